@@ -0,0 +1,77 @@
+"""
+Benchmark parse_datetime_bulk against calling parse_datetime per entry.
+
+Entity strings from imports and logs repeat heavily, so the rows are
+drawn from a small vocabulary of date and time strings. The per-entry
+loop runs with the parse caches disabled (as before they existed) and
+enabled; the bulk parser deduplicates and resolves the strings at once.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chatbot.utils import datetime_parser
+from chatbot.utils.datetime_parser import parse_datetime, parse_datetime_bulk
+
+DATE_STRINGS = [
+    "today", "tomorrow", "Tomorrow", "next week", "next month", "friday", "next monday",
+    "on tuesday", "March 5th", "5 march 2027", "12/25/2026", "2026-11-02", "june 3rd 2027"
+]
+TIME_STRINGS = ["10am", "at 3pm", "9:30 am", "noon", "15:30", "4:15pm", "", "7 pm"]
+
+
+def per_entry(dates, times, cached):
+    """Parse each row with parse_datetime, optionally without the parse caches."""
+    if not cached:
+        sizes = datetime_parser._date_cache.maxsize, datetime_parser._time_cache.maxsize
+        datetime_parser._date_cache.maxsize = datetime_parser._time_cache.maxsize = 0
+        datetime_parser.clear_parse_caches()
+    try:
+        return [parse_datetime(date, time_string) for date, time_string in zip(dates, times)]
+    finally:
+        if not cached:
+            datetime_parser._date_cache.maxsize, datetime_parser._time_cache.maxsize = sizes
+
+
+def main():
+    """Main benchmark function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=200000, help='Number of date/time rows')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    dates = [rng.choice(DATE_STRINGS) for _ in range(args.rows)]
+    times = [rng.choice(TIME_STRINGS) for _ in range(args.rows)]
+    
+    results = {}
+    for name, run in (
+        ('per entry', lambda: per_entry(dates, times, cached=False)),
+        ('per entry cached', lambda: per_entry(dates, times, cached=True)),
+        ('bulk', lambda: parse_datetime_bulk(dates, times))
+    ):
+        start = time.perf_counter()
+        results[name] = run()
+        results[name + ' seconds'] = time.perf_counter() - start
+    
+    values, valid = results['bulk']
+    expected = np.array([np.datetime64(value, 's') if value else np.datetime64('NaT') for value in results['per entry']])
+    assert valid.all() and (values == expected).all()
+    
+    baseline = results['per entry seconds']
+    print(f"{'variant':>18}{'seconds':>10}{'us/row':>9}{'speedup':>9}")
+    for name in ('per entry', 'per entry cached', 'bulk'):
+        seconds = results[name + ' seconds']
+        print(f"{name:>18}{seconds:>10.3f}{seconds / args.rows * 1e6:>9.2f}{baseline / seconds:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Benchmark extract_datetime_from_text against the previous implementation.
+
+The previous extractor (kept below as legacy_extract_datetime_from_text)
+ran up to three date regexes and three time regexes in turn, compiling
+them on each call, and parsed every match with dateutil. The current one
+scans the text once with a precompiled pattern and resolves known forms
+directly.
+
+The second table times parse_date and parse_time on the short strings
+users send over and over, with and without the per-day table and cache.
+"""
+
+import argparse
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from dateutil import parser as date_parser
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chatbot.utils import datetime_parser
+from chatbot.utils.datetime_parser import extract_datetime_from_text, parse_date, parse_time
+
+MESSAGES = [
+    "Remind me tomorrow at 3pm to call mom",
+    "Set a reminder for March 5th at 9:30 am",
+    "dentist appointment 12/25/2026 at 10:00",
+    "What are my reminders for today?",
+    "Schedule the team sync next week at 14:30",
+    "Add an event called birthday party",
+    "remind me to water the plants at 7 pm",
+    "Can you delete my meeting reminder",
+]
+
+DATE_STRINGS = ["tomorrow", "next week", "today", "friday", "March 5th", "12/25/2026", "june 3rd 2027", "2026.11.02"]
+TIME_STRINGS = ["10am", "at 3pm", "9:30 am", "noon", "16h30", "4:15pm"]
+
+
+def legacy_extract_datetime_from_text(text):
+    """Previous implementation of extract_datetime_from_text."""
+    result = {'date': None, 'time': None, 'datetime': None}
+    date_patterns = [
+        r'\b(today|tomorrow|yesterday|next week|next month)\b',
+        r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:st|nd|rd|th)?',
+        r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b',
+    ]
+    time_patterns = [
+        r'\b\d{1,2}:\d{2}\s*(am|pm)\b',
+        r'\b\d{1,2}\s*(am|pm)\b',
+        r'\b\d{1,2}:\d{2}\b',
+    ]
+    for pattern in date_patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            result['date'] = _legacy_parse_date(match.group(0))
+            break
+    for pattern in time_patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            result['time'] = _legacy_parse_time(match.group(0))
+            break
+    if result['date'] and result['time']:
+        hour, minute = result['time']
+        result['datetime'] = result['date'].replace(hour=hour, minute=minute, second=0, microsecond=0)
+    return result
+
+
+def _legacy_parse_date(date_string):
+    date_string = date_string.strip().lower()
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    relative = {'today': timedelta(0), 'tomorrow': timedelta(days=1), 'yesterday': timedelta(days=-1)}
+    if date_string in relative:
+        return today + relative[date_string]
+    if 'next week' in date_string:
+        return today + timedelta(weeks=1)
+    try:
+        return date_parser.parse(date_string, default=today)
+    except (ValueError, TypeError):
+        return None
+
+
+def _legacy_parse_time(time_string):
+    time_string = re.sub(r'^at\s+', '', time_string.strip().lower())
+    try:
+        parsed = date_parser.parse(time_string, default=datetime.now())
+        return (parsed.hour, parsed.minute)
+    except (ValueError, TypeError):
+        return None
+
+
+def measure(extract, repeats, messages=MESSAGES):
+    """
+    Time extract over every message.
+    
+    Args:
+        extract: Function taking a message
+        repeats: Passes over messages
+        messages: Strings to pass to extract
+    
+    Returns:
+        Microseconds per message
+    """
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for message in messages:
+            extract(message)
+    return (time.perf_counter() - start) / (repeats * len(messages)) * 1e6
+
+
+def uncached_parse_date(date_string):
+    # An explicit today bypasses the day table and the cache
+    return parse_date(date_string, today=datetime.now().replace(hour=0, minute=0, second=0, microsecond=0))
+
+
+def uncached_parse_time(time_string):
+    return datetime_parser._parse_time(datetime_parser._TIME_PREFIX.sub('', ' '.join(time_string.lower().split())))
+
+
+def main():
+    """Main benchmark function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeats', type=int, default=2000, help='Passes over the sample messages')
+    args = parser.parse_args()
+    
+    # Both must find the same dates and times (minutes can differ: the legacy
+    # parser took the current minute for "3pm")
+    for message in MESSAGES:
+        new, old = extract_datetime_from_text(message), legacy_extract_datetime_from_text(message)
+        assert (new['date'], new['time'] and new['time'][0]) == (old['date'], old['time'] and old['time'][0]), message
+    
+    legacy = measure(legacy_extract_datetime_from_text, args.repeats)
+    current = measure(extract_datetime_from_text, args.repeats)
+    print(f"{'implementation':>16}{'us/message':>12}")
+    print(f"{'legacy':>16}{legacy:>12.1f}")
+    print(f"{'single pass':>16}{current:>12.1f}")
+    print(f"speedup: {legacy / current:.1f}x")
+    
+    for name, cached, uncached, strings in (
+        ('parse_date', parse_date, uncached_parse_date, DATE_STRINGS),
+        ('parse_time', parse_time, uncached_parse_time, TIME_STRINGS)
+    ):
+        assert [cached(text) for text in strings] == [uncached(text) for text in strings], name
+        slow = measure(uncached, args.repeats, strings)
+        fast = measure(cached, args.repeats, strings)
+        print(f"{name}: {slow:.2f} -> {fast:.2f} us/string ({slow / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark Keras model.predict against the compiled, bucketed intent model.
+
+Reports the first-call latency (tracing included) and the p50/p99 of
+later calls for several batch sizes.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import config
+from chatbot.compiled_model import CompiledIntentModel
+
+
+def measure(predict, x, repeats):
+    """
+    Time one cold call and then repeated calls.
+    
+    Args:
+        predict: Function taking an input batch
+        x: Input batch
+        repeats: Number of timed calls after the first
+    
+    Returns:
+        tuple: (first call ms, p50 ms, p99 ms)
+    """
+    start = time.perf_counter()
+    predict(x)
+    first = time.perf_counter() - start
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        predict(x)
+        times.append(time.perf_counter() - start)
+    return first * 1000, np.percentile(times, 50) * 1000, np.percentile(times, 99) * 1000
+
+
+def main():
+    """Main benchmark function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 5, 32])
+    parser.add_argument('--repeats', type=int, default=200)
+    args = parser.parse_args()
+    
+    from keras.models import load_model
+    model = load_model(config.MODEL_PATHS['intents_model'])
+    input_dim = model.input_shape[-1]
+    buckets = config.PERFORMANCE_CONFIG['batch_buckets']
+    
+    print(f"{'variant':>18}{'batch':>7}{'first ms':>10}{'p50 ms':>9}{'p99 ms':>9}")
+    for batch_size in args.batch_sizes:
+        x = np.zeros((batch_size, input_dim), dtype=np.float32)
+        # A fresh Keras predict function per batch size, as after a deploy
+        model.make_predict_function(force=True)
+        variants = [('keras predict', lambda x: model.predict(x, verbose=0))]
+        
+        cold = CompiledIntentModel(model, buckets)
+        variants.append(('compiled (cold)', cold.predict))
+        warm = CompiledIntentModel(model, buckets)
+        warm.warm_up()
+        variants.append(('compiled (warm)', warm.predict))
+        
+        for name, predict in variants:
+            first, p50, p99 = measure(predict, x, args.repeats)
+            print(f"{name:>18}{batch_size:>7}{first:>10.2f}{p50:>9.2f}{p99:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
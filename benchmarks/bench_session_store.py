@@ -0,0 +1,84 @@
+"""
+Benchmark SessionStore get/put throughput under thread contention.
+
+Compares shard counts across thread counts, optionally with a spill file
+and a capacity small enough to force eviction.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chatbot.session_store import SessionStore
+
+
+def run_benchmark(store, threads, operations, population, put_ratio):
+    """
+    Run get/put operations from several threads against one store.
+    
+    Args:
+        store: SessionStore to exercise
+        threads: Number of threads
+        operations: Operations per thread
+        population: Number of distinct session ids
+        put_ratio: Fraction of operations that are put() instead of get()
+    
+    Returns:
+        Operations per second across all threads
+    """
+    barrier = threading.Barrier(threads + 1)
+    
+    def worker(seed):
+        rng = random.Random(seed)
+        ids = [f'user-{rng.randrange(population)}' for _ in range(operations)]
+        barrier.wait()
+        for session_id in ids:
+            session = store.get(session_id)
+            if rng.random() < put_ratio:
+                session.last_intent = 'greeting'
+                store.put(session)
+    
+    workers = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return threads * operations / (time.perf_counter() - start)
+
+
+def main():
+    """Main benchmark function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--shards', type=int, nargs='+', default=[1, 16])
+    parser.add_argument('--operations', type=int, default=50000, help='Operations per thread')
+    parser.add_argument('--population', type=int, default=100000, help='Distinct session ids')
+    parser.add_argument('--max-sessions', type=int, default=200000, help='In-memory capacity')
+    parser.add_argument('--put-ratio', type=float, default=0.2)
+    parser.add_argument('--spill', action='store_true', help='Spill evicted sessions to SQLite')
+    args = parser.parse_args()
+    
+    print(f"{'shards':>8}{'threads':>9}{'ops/s':>12}{'evicted':>9}{'spilled':>9}")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for shards in args.shards:
+            for threads in args.threads:
+                spill_path = os.path.join(tmpdir, f'{shards}-{threads}.db') if args.spill else ''
+                store = SessionStore(shards, ttl=3600, max_sessions=args.max_sessions, spill_path=spill_path)
+                rate = run_benchmark(store, threads, args.operations, args.population, args.put_ratio)
+                stats = store.stats()
+                store.close()
+                print(f"{shards:>8}{threads:>9}{rate:>12,.0f}{stats['evicted']:>9}{stats['spilled']:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,30 @@ RemindMe! Chatbot Package
 A reminder and event management chatbot with intent classification and NER.
 """
 
+import importlib
+
 __version__ = "1.0.0"
 
-from chatbot.chatbot import Chatbot
-from chatbot.model_loader import ModelLoader
+# Public names and the modules that define them. They are imported on first
+# access, so importing the package (or a light submodule) does not pull in
+# spaCy or TensorFlow.
+_LAZY_IMPORTS = {
+    'Chatbot': 'chatbot.chatbot',
+    'ModelLoader': 'chatbot.model_loader',
+    'Session': 'chatbot.dialogue',
+}
+
+__all__ = ['Chatbot', 'ModelLoader', 'Session']
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
 
-__all__ = ['Chatbot', 'ModelLoader']
 
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
@@ -0,0 +1,200 @@
+"""
+Offline bulk processing: stream a JSONL file of messages through the
+models and write intents, probabilities and entities as JSONL.
+
+Each input line is a JSON object with the message in BULK_CONFIG['text_field']
+(an optional 'id' is copied to the output) or a bare JSON string. Output
+lines are written in input order:
+
+    {"line": 1, "id": ..., "message": "...", "intents": [...], "entities": {...}}
+
+Lines that cannot be parsed produce {"line": n, "error": "..."}.
+
+The input is processed in chunks of BULK_CONFIG['chunk_size'] lines, so
+memory stays bounded. After every chunk the input and output byte
+offsets are saved to '<output>.offset', and --resume continues from there.
+"""
+
+import json
+import os
+import sys
+import time
+import config
+from logger import logger
+
+
+class BulkProcessor:
+    """Classifies and tags messages chunk by chunk."""
+    
+    NER_MODES = ('all', 'needed', 'none')
+    
+    def __init__(self, chatbot, chunk_size=None, ner='all', text_field=None, ner_batch_size=None):
+        """
+        Initialize BulkProcessor.
+        
+        Args:
+            chatbot: Chatbot with loaded models
+            chunk_size: Lines per chunk (from config if None)
+            ner: 'all' to tag every message, 'needed' only those whose
+                intent uses entities, 'none' to skip NER
+            text_field: JSON field holding the message (from config if None)
+            ner_batch_size: nlp.pipe batch size (from config if None)
+        """
+        if ner not in self.NER_MODES:
+            raise ValueError(f"Unknown NER mode '{ner}', expected one of {self.NER_MODES}")
+        bulk_config = config.BULK_CONFIG
+        self.chatbot = chatbot
+        self.chunk_size = chunk_size or bulk_config['chunk_size']
+        self.ner = ner
+        self.text_field = text_field or bulk_config['text_field']
+        self.ner_batch_size = ner_batch_size or bulk_config['ner_batch_size']
+    
+    def parse_line(self, line_number, raw):
+        """
+        Parse one input line.
+        
+        Args:
+            line_number: 1-based line number
+            raw: Line bytes
+        
+        Returns:
+            Output record with 'line', 'message' and optional 'id', or
+            with 'error' if the line is not usable
+        """
+        record = {'line': line_number}
+        try:
+            data = json.loads(raw)
+        except ValueError as e:
+            record['error'] = f'Invalid JSON: {e}'
+            return record
+        
+        if isinstance(data, dict):
+            message = data.get(self.text_field)
+            if 'id' in data:
+                record['id'] = data['id']
+        else:
+            message = data
+        if not isinstance(message, str):
+            record['error'] = f"Missing string field '{self.text_field}'"
+            return record
+        record['message'] = message
+        return record
+    
+    def process_chunk(self, records):
+        """
+        Add intents and entities to a chunk of parsed records.
+        
+        Args:
+            records: List of records from parse_line(); updated in place
+        
+        Returns:
+            The same list of records
+        """
+        valid = [record for record in records if 'error' not in record]
+        if not valid:
+            return records
+        
+        messages = [record['message'] for record in valid]
+        predictions = self.chatbot.intent_classifier.predict_batch(messages, log=False)
+        for record, intents in zip(valid, predictions):
+            record['intents'] = intents
+            record['entities'] = {}
+        
+        if self.ner == 'all':
+            tagged = valid
+        elif self.ner == 'needed':
+            needs_entities = self.chatbot.response_generator.needs_entities
+            tagged = [record for record in valid if record['intents'] and needs_entities(record['intents'][0]['intent'])]
+        else:
+            tagged = []
+        if tagged:
+            extracted = self.chatbot.entity_extractor.extract_batch(
+                (record['message'] for record in tagged), batch_size=self.ner_batch_size
+            )
+            for record, entities in zip(tagged, extracted):
+                record['entities'] = entities
+        return records
+    
+    def run(self, input_path, output_path, resume=False, progress_interval=None, progress_file=sys.stderr):
+        """
+        Process an input JSONL file into an output JSONL file.
+        
+        Args:
+            input_path: Path to the input JSONL file
+            output_path: Path to the output JSONL file
+            resume: Continue from the offsets saved by a previous run
+            progress_interval: Seconds between progress reports (from config if None)
+            progress_file: Stream for progress reports, or None for silence
+        
+        Returns:
+            Dictionary with messages, errors, seconds and messages_per_second
+            for this run
+        """
+        if progress_interval is None:
+            progress_interval = config.BULK_CONFIG['progress_interval']
+        checkpoint_path = f'{output_path}.offset'
+        checkpoint = {'input_offset': 0, 'output_offset': 0, 'lines': 0}
+        if resume and os.path.exists(checkpoint_path):
+            with open(checkpoint_path, 'r', encoding='utf-8') as f:
+                checkpoint = json.load(f)
+            logger.info(f"Resuming bulk run at line {checkpoint['lines']} of {input_path}")
+        
+        # Drop anything written after the last checkpoint
+        mode = 'r+b' if os.path.exists(output_path) else 'w+b'
+        with open(input_path, 'rb') as source, open(output_path, mode) as sink:
+            sink.truncate(checkpoint['output_offset'])
+            sink.seek(checkpoint['output_offset'])
+            source.seek(checkpoint['input_offset'])
+            
+            stats = {'messages': 0, 'errors': 0}
+            started = last_report = time.perf_counter()
+            for chunk, consumed in self._read_chunks(source, checkpoint['lines']):
+                self.process_chunk(chunk)
+                sink.write(b''.join(
+                    json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n' for record in chunk
+                ))
+                sink.flush()
+                os.fsync(sink.fileno())
+                
+                checkpoint['input_offset'] += consumed
+                checkpoint['output_offset'] = sink.tell()
+                checkpoint['lines'] = chunk[-1]['line']
+                _write_checkpoint(checkpoint_path, checkpoint)
+                
+                stats['messages'] += len(chunk)
+                stats['errors'] += sum('error' in record for record in chunk)
+                now = time.perf_counter()
+                if progress_file is not None and now - last_report >= progress_interval:
+                    last_report = now
+                    print(
+                        f"{checkpoint['lines']} lines, {stats['messages'] / (now - started):.0f} msg/s",
+                        file=progress_file, flush=True
+                    )
+        
+        stats['seconds'] = time.perf_counter() - started
+        stats['messages_per_second'] = stats['messages'] / stats['seconds'] if stats['seconds'] else 0.0
+        logger.info(f"Bulk run {input_path} -> {output_path}: {stats}")
+        return stats
+    
+    def _read_chunks(self, source, line_number):
+        chunk = []
+        consumed = 0
+        for raw in source:
+            line_number += 1
+            consumed += len(raw)
+            if not raw.strip():
+                continue
+            chunk.append(self.parse_line(line_number, raw))
+            if len(chunk) >= self.chunk_size:
+                yield chunk, consumed
+                chunk = []
+                consumed = 0
+        if chunk:
+            yield chunk, consumed
+
+
+def _write_checkpoint(path, checkpoint):
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
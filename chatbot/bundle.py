@@ -0,0 +1,199 @@
+"""
+Single-file, memory-mappable model bundle.
+
+A bundle holds everything the chatbot needs besides the spaCy NER model:
+the intent model weights, the vocabulary, the classes, the compiled
+response table and the intent patterns used by the fast path. Layout:
+
+    magic (8 bytes) | format version (uint32) | header length (uint64)
+    | SHA-256 of everything after the preamble (32 bytes)
+    | JSON header | padding | arrays, each starting on a 64-byte boundary
+
+The header describes every array (offset, dtype, shape) along with the
+JSON-serializable data. Arrays are stored raw in little-endian byte order,
+so loading maps the file with np.memmap and wraps each array as a
+read-only view: nothing is copied or unpickled, and worker processes that
+map the same file share its pages.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import time
+import numpy as np
+from chatbot.numpy_backend import NumpyIntentModel
+
+BUNDLE_MAGIC = b'RMBUNDLE'
+BUNDLE_FORMAT_VERSION = 1
+ALIGNMENT = 64
+
+# magic, format version, header length, checksum
+_PREAMBLE = struct.Struct('<8sIQ32s')
+
+
+class BundleError(Exception):
+    """Raised when a bundle is missing, corrupt or of an unsupported version."""
+
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+class ModelBundle:
+    """Intent model, vocabulary, classes and response table loaded from a bundle."""
+    
+    def __init__(self, intent_model, words, classes, response_table, patterns, metadata):
+        """
+        Initialize ModelBundle.
+        
+        Args:
+            intent_model: NumpyIntentModel
+            words: List of vocabulary words
+            classes: List of intent classes
+            response_table: Table produced by ResponseGenerator.to_table()
+            patterns: Dictionary mapping intent tag to its pattern texts
+            metadata: Header fields such as bundle_version and created
+        """
+        self.intent_model = intent_model
+        self.words = words
+        self.classes = classes
+        self.response_table = response_table
+        self.patterns = patterns
+        self.metadata = metadata
+    
+    @property
+    def version(self):
+        """Version string of the bundle."""
+        return self.metadata.get('bundle_version')
+    
+    def intents_data(self):
+        """
+        Get the intents in the intents.json shape, patterns only.
+        
+        Returns:
+            Dictionary with an 'intents' list of tag and patterns, as
+            needed by FastPathMatcher
+        """
+        return {'intents': [
+            {'tag': tag, 'patterns': patterns} for tag, patterns in self.patterns.items()
+        ]}
+
+
+def write_bundle(path, intent_model, words, classes, response_table, patterns, bundle_version=None):
+    """
+    Write a model bundle.
+    
+    Args:
+        path: Destination file path
+        intent_model: NumpyIntentModel (any precision)
+        words: List of vocabulary words
+        classes: List of intent classes
+        response_table: Table produced by ResponseGenerator.to_table()
+        patterns: Dictionary mapping intent tag to its pattern texts
+        bundle_version: Version string (creation timestamp if None)
+    
+    Returns:
+        Header dictionary that was written
+    """
+    created = time.strftime('%Y-%m-%dT%H:%M:%S')
+    arrays = {
+        name: np.ascontiguousarray(array, dtype=array.dtype.newbyteorder('<'))
+        for name, array in intent_model.to_arrays().items()
+    }
+    
+    header = {
+        'bundle_version': bundle_version or time.strftime('%Y%m%d%H%M%S'),
+        'created': created,
+        'precision': intent_model.precision,
+        'activations': [layer.activation for layer in intent_model.layers],
+        'words': list(words),
+        'classes': list(classes),
+        'response_table': response_table,
+        'patterns': patterns,
+        'arrays': {}
+    }
+    # Array offsets are relative to the aligned end of the header
+    offset = 0
+    for name, array in arrays.items():
+        offset = _align(offset)
+        header['arrays'][name] = {'offset': offset, 'dtype': array.dtype.str, 'shape': list(array.shape)}
+        offset += array.nbytes
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    data_start = _align(_PREAMBLE.size + len(header_bytes))
+    
+    body = bytearray(header_bytes)
+    for name, array in arrays.items():
+        position = data_start + header['arrays'][name]['offset']
+        body.extend(b'\0' * (position - _PREAMBLE.size - len(body)))
+        body.extend(array.tobytes())
+    
+    checksum = hashlib.sha256(body).digest()
+    # Running processes map the current file, so it is never rewritten in
+    # place: the new bundle is written beside it and renamed over it, and
+    # existing mappings keep the old inode
+    fd, temp_path = tempfile.mkstemp(prefix='.bundle-', dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_PREAMBLE.pack(BUNDLE_MAGIC, BUNDLE_FORMAT_VERSION, len(header_bytes), checksum))
+            f.write(body)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    return header
+
+
+def load_bundle(path, verify=True):
+    """
+    Map a model bundle into memory.
+    
+    Args:
+        path: Bundle file path
+        verify: Whether to check the SHA-256 checksum (reads the whole file)
+    
+    Returns:
+        ModelBundle whose weight arrays are read-only views of the mapping
+    """
+    try:
+        mapping = np.memmap(path, dtype=np.uint8, mode='r')
+    except (OSError, ValueError) as e:
+        raise BundleError(f"Cannot map bundle {path}: {e}") from e
+    if mapping.size < _PREAMBLE.size:
+        raise BundleError(f"{path} is too small to be a model bundle")
+    
+    magic, format_version, header_length, checksum = _PREAMBLE.unpack(bytes(mapping[:_PREAMBLE.size]))
+    if magic != BUNDLE_MAGIC:
+        raise BundleError(f"{path} is not a model bundle")
+    if format_version != BUNDLE_FORMAT_VERSION:
+        raise BundleError(
+            f"Unsupported bundle format version {format_version} (expected {BUNDLE_FORMAT_VERSION})"
+        )
+    if verify and hashlib.sha256(mapping[_PREAMBLE.size:]).digest() != checksum:
+        raise BundleError(f"Checksum mismatch in {path}")
+    
+    try:
+        header = json.loads(bytes(mapping[_PREAMBLE.size:_PREAMBLE.size + header_length]))
+    except ValueError as e:
+        raise BundleError(f"Corrupt bundle header in {path}: {e}") from e
+    
+    data_start = _align(_PREAMBLE.size + header_length)
+    arrays = {}
+    for name, spec in header['arrays'].items():
+        dtype = np.dtype(spec['dtype'])
+        count = int(np.prod(spec['shape'], dtype=np.int64))
+        offset = data_start + spec['offset']
+        arrays[name] = np.frombuffer(mapping, dtype=dtype, count=count, offset=offset).reshape(spec['shape'])
+    
+    intent_model = NumpyIntentModel.from_arrays(header['precision'], header['activations'], arrays)
+    metadata = {key: header[key] for key in ('bundle_version', 'created', 'precision')}
+    metadata['format_version'] = format_version
+    return ModelBundle(
+        intent_model, header['words'], header['classes'],
+        header['response_table'], header['patterns'], metadata
+    )
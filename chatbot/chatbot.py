@@ -2,36 +2,156 @@
 Main Chatbot class that orchestrates all components.
 """
 
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 import config
 from logger import logger, log_request, log_error
-from chatbot.model_loader import ModelLoader
-from chatbot.intent_classifier import IntentClassifier
-from chatbot.entity_extractor import EntityExtractor
-from chatbot.response_generator import ResponseGenerator
+from chatbot.model_set import ModelSet, ReloadError
+from chatbot.dialogue import Session
+from chatbot.session_store import SessionStore
+from chatbot.utils.timing import StageTimings
 
 
 class Chatbot:
     """Main chatbot class that coordinates all components."""
     
-    def __init__(self):
-        """Initialize Chatbot and load all models."""
-        print("Loading models...")
-        loader = ModelLoader()
-        nlp, intent_model, intents_data, words, classes = loader.load_all()
+    def __init__(self, models=None):
+        """
+        Initialize Chatbot and load all models.
         
-        self.intent_classifier = IntentClassifier(intent_model, words, classes)
-        self.entity_extractor = EntityExtractor(nlp)
-        self.response_generator = ResponseGenerator(intents_data)
+        Args:
+            models: ModelSet to serve (loaded with ModelLoader if None)
+        """
+        if models is None:
+            print("Loading models...")
+            models = ModelSet.load()
+        if config.PERFORMANCE_CONFIG['warm_up_models']:
+            models.warm_up()
+        self.models = models
+        self.models_loaded_at = time.time()
+        self.reloads = 0
+        self._reload_lock = threading.Lock()
         self.goodbye_statements = config.CHATBOT_CONFIG['goodbye_statements']
         self.welcome_message = config.CHATBOT_CONFIG['welcome_message']
+        self.use_fast_path = config.PERFORMANCE_CONFIG['use_fast_path']
+        self.always_run_ner = config.NER_CONFIG['always_run_ner']
+        self.stage_timings = StageTimings()
+        self.session = Session()
+        self.sessions = SessionStore()
+        
+        # Persistent pool for running NER and intent classification side by side
+        self.speculative_ner_threshold = config.PERFORMANCE_CONFIG['speculative_ner_threshold']
+        self.ner_need_rate = 0.0
+        self.executor = None
+        if config.PERFORMANCE_CONFIG['concurrent_stages']:
+            self.executor = ThreadPoolExecutor(
+                max_workers=config.PERFORMANCE_CONFIG['stage_workers'],
+                thread_name_prefix='chatbot-stage'
+            )
+    
+    # The components of the active model set. Requests read self.models
+    # once and use that set throughout, so a reload never mixes two sets.
+    @property
+    def intent_classifier(self):
+        """Intent classifier of the active model set."""
+        return self.models.intent_classifier
+    
+    @property
+    def entity_extractor(self):
+        """Entity extractor of the active model set."""
+        return self.models.entity_extractor
+    
+    @property
+    def response_generator(self):
+        """Response generator of the active model set."""
+        return self.models.response_generator
     
-    def process_message(self, message):
+    @property
+    def fast_path(self):
+        """Fast-path matcher of the active model set."""
+        return self.models.fast_path
+    
+    @property
+    def model_version(self):
+        """Version of the active model set."""
+        return self.models.version
+    
+    def reload(self, models=None):
+        """
+        Load a new model set and swap it in without interrupting requests.
+        
+        The new set is loaded and smoke-tested while the current one keeps
+        serving; if either step fails the current set stays active. The
+        swap replaces the single self.models reference, so requests that
+        already started finish on the old set and later ones use the new
+        one. The caches of both sets are cleared on swap.
+        
+        Args:
+            models: ModelSet to swap in (loaded with ModelLoader if None)
+        
+        Returns:
+            Dictionary with previous_version, version, smoke test results
+            and load_seconds
+        
+        Raises:
+            ReloadError: If the new set cannot be loaded or fails its smoke batch
+        """
+        with self._reload_lock:
+            start = time.perf_counter()
+            if models is None:
+                try:
+                    models = ModelSet.load()
+                except (Exception, SystemExit) as e:
+                    # ModelLoader exits the process on a missing artifact
+                    log_error('ReloadError', f"Could not load new models: {e}", e)
+                    raise ReloadError(f"Could not load new models: {e}") from e
+            if config.PERFORMANCE_CONFIG['warm_up_models']:
+                models.warm_up()
+            try:
+                smoke = models.smoke_test()
+            except ReloadError as e:
+                log_error('ReloadError', f"Rejected model set {models.version}: {e}", e)
+                raise
+            
+            # Answers cached during the smoke batch are valid, but start clean
+            models.clear_caches()
+            previous = self.models
+            self.models = models
+            self.models_loaded_at = time.time()
+            self.reloads += 1
+            previous.clear_caches()
+            
+            result = {
+                'previous_version': previous.version,
+                'version': models.version,
+                'smoke_test': smoke,
+                'load_seconds': time.perf_counter() - start
+            }
+            logger.info(f"Reloaded models: {result}")
+            return result
+    
+    def model_info(self):
+        """
+        Get the active model version and reload history.
+        
+        Returns:
+            Dictionary with version, loaded_at (epoch seconds) and reloads
+        """
+        return {'version': self.model_version, 'loaded_at': self.models_loaded_at, 'reloads': self.reloads}
+    
+    def process_message(self, message, session=None):
         """
         Process a user message and return a response.
         
+        When the previous response asked for a missing entity, the message
+        is taken as its value instead of being classified.
+        
         Args:
             message: User input message
+            session: Session holding the conversation's dialogue state, or
+                a session id to look up in the session store; the
+                chatbot's own session (used by run()) when None
         
         Returns:
             Response string
@@ -39,12 +159,22 @@ class Chatbot:
         if not message or not message.strip():
             return "Please enter a message."
         
+        if session is None:
+            session = self.session
+        elif not isinstance(session, Session):
+            session = self.sessions.get(session)
+        
         start_time = time.time()
+        models = self.models
         
-        # Extract entities and predict intent
-        entities = self.entity_extractor.extract(message)
-        intents = self.intent_classifier.predict(message)
-        response = self.response_generator.generate(intents, entities)
+        if session.dialogue is not None:
+            response, session.dialogue = models.response_generator.resume(session.dialogue, message)
+        else:
+            intents, entities = self._analyze(message, models)
+            response, session.dialogue = models.response_generator.respond(intents, entities)
+            session.last_intent = intents[0]['intent'] if intents else None
+        if session is not self.session:
+            self.sessions.save(session)
         
         processing_time = time.time() - start_time
         
@@ -53,6 +183,226 @@ class Chatbot:
         
         return response
     
+    def process_batch(self, messages, sessions=None):
+        """
+        Process several messages with one intent forward pass and one nlp.pipe call.
+        
+        Messages answering a slot prompt and exact fast-path matches are
+        handled individually; the rest are classified together, and NER
+        runs in one pipe over those whose intent needs entities.
+        
+        Args:
+            messages: List of user input messages
+            sessions: List with a Session, a session id or None (stateless)
+                per message; None for all stateless
+        
+        Returns:
+            List of response strings in input order
+        """
+        if sessions is None:
+            sessions = [None] * len(messages)
+        sessions = [
+            session if session is None or isinstance(session, Session) else self.sessions.get(session)
+            for session in sessions
+        ]
+        start_time = time.time()
+        models = self.models
+        responses = [None] * len(messages)
+        classify = []
+        analyzed = {}
+        for i, (message, session) in enumerate(zip(messages, sessions)):
+            if not message or not message.strip():
+                responses[i] = "Please enter a message."
+            elif session is not None and session.dialogue is not None:
+                responses[i], session.dialogue = models.response_generator.resume(session.dialogue, message)
+            else:
+                tag = models.fast_path.match(message) if self.use_fast_path else None
+                if tag is not None:
+                    analyzed[i] = ([{'intent': tag, 'probability': 1.0}], {})
+                else:
+                    classify.append(i)
+        
+        if classify:
+            pipeline_start = time.perf_counter()
+            predictions = self.stage_timings.timed(
+                'intent', models.intent_classifier.predict_batch, [messages[i] for i in classify]
+            )
+            needs_ner = [i for i, intents in zip(classify, predictions) if self._needs_entities(intents, models)]
+            entities = {}
+            if needs_ner:
+                extracted = self.stage_timings.timed(
+                    'ner', lambda texts: list(models.entity_extractor.extract_batch(texts)),
+                    [messages[i] for i in needs_ner]
+                )
+                entities = dict(zip(needs_ner, extracted))
+            self.stage_timings.record('models', time.perf_counter() - pipeline_start)
+            for i, intents in zip(classify, predictions):
+                analyzed[i] = (intents, entities.get(i, {}))
+        
+        for i, (intents, message_entities) in analyzed.items():
+            responses[i], state = models.response_generator.respond(intents, message_entities)
+            if sessions[i] is not None:
+                sessions[i].dialogue = state
+                sessions[i].last_intent = intents[0]['intent'] if intents else None
+        for session in sessions:
+            if session is not None:
+                self.sessions.save(session)
+        
+        processing_time = (time.time() - start_time) / max(len(messages), 1)
+        for message, response in zip(messages, responses):
+            log_request(message, response, processing_time)
+        return responses
+    
+    def _analyze(self, message, models):
+        """
+        Predict the intent of a message and extract the entities it needs.
+        
+        Args:
+            message: User input message
+            models: ModelSet to use
+        
+        Returns:
+            tuple: (intents, entities)
+        """
+        # Exact pattern matches skip both models
+        tag = models.fast_path.match(message) if self.use_fast_path else None
+        if tag is not None:
+            logger.debug(f"Fast-path match for '{message}': {tag}")
+            return [{'intent': tag, 'probability': 1.0}], {}
+        if self.executor is not None and self._speculate_ner(models):
+            return self._run_stages_concurrently(message, models)
+        
+        # Predict intent, then run NER only if the intent has entity slots
+        pipeline_start = time.perf_counter()
+        intents = self.stage_timings.timed('intent', models.intent_classifier.predict, message)
+        if self._record_ner_need(self._needs_entities(intents, models)):
+            entities = self.stage_timings.timed('ner', models.entity_extractor.extract, message)
+        else:
+            entities = {}
+        self.stage_timings.record('models', time.perf_counter() - pipeline_start)
+        return intents, entities
+    
+    def _speculate_ner(self, models):
+        """
+        Decide whether to start NER before the intent is known.
+        
+        Args:
+            models: ModelSet to use
+        
+        Returns:
+            Boolean indicating if NER should run concurrently with the intent model
+        """
+        if self.always_run_ner or models.entities_always_needed():
+            return True
+        return self.ner_need_rate >= self.speculative_ner_threshold
+    
+    def _record_ner_need(self, needed):
+        """
+        Update the moving share of model-path messages that needed NER.
+        
+        Args:
+            needed: Whether NER was needed for the last message
+        
+        Returns:
+            needed, unchanged
+        """
+        # Roughly the last 20 messages; updates may race, which only blurs the estimate
+        self.ner_need_rate += 0.05 * (float(needed) - self.ner_need_rate)
+        return needed
+    
+    def _run_stages_concurrently(self, message, models):
+        """
+        Run NER on the stage pool while classifying the intent.
+        
+        The latency of a request is then max(NER, intent) instead of their
+        sum. NER starts before the intent is known, so this is only used
+        when it will be needed anyway (always_run_ner, or every intent has
+        entity slots) or when most recent messages needed it (see
+        _speculate_ner); a result that turns out not to be needed is
+        discarded.
+        
+        Args:
+            message: User input message
+            models: ModelSet to use
+        
+        Returns:
+            tuple: (intents, entities)
+        """
+        pipeline_start = time.perf_counter()
+        ner_future = self.executor.submit(
+            self.stage_timings.timed, 'ner', models.entity_extractor.extract, message
+        )
+        intents = self.stage_timings.timed('intent', models.intent_classifier.predict, message)
+        if self._record_ner_need(self._needs_entities(intents, models)):
+            entities = ner_future.result()
+        else:
+            ner_future.cancel()
+            entities = {}
+        self.stage_timings.record('models', time.perf_counter() - pipeline_start)
+        return intents, entities
+    
+    def _needs_entities(self, intents, models):
+        """
+        Decide whether NER has to run for the predicted intents.
+        
+        Args:
+            intents: List of predicted intents with probabilities
+            models: ModelSet whose response generator knows the entity slots
+        
+        Returns:
+            Boolean indicating if entities should be extracted
+        """
+        if self.always_run_ner:
+            return True
+        return bool(intents) and models.response_generator.needs_entities(intents[0]['intent'])
+    
+    def timing_stats(self):
+        """
+        Get per-stage timing statistics.
+        
+        'intent' and 'ner' are the model stages; 'models' is the wall time
+        of both together, so with concurrent stages it approaches
+        max(intent, ner) rather than their sum.
+        
+        Returns:
+            Dictionary mapping stage name to count, total_seconds and mean_ms
+        """
+        return self.stage_timings.summary()
+    
+    def close(self):
+        """Shut down the stage thread pool and close the session store."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+        self.sessions.close()
+    
+    def cache_stats(self):
+        """
+        Get hit/miss/eviction statistics of the preprocessing and prediction caches.
+        
+        Returns:
+            Dictionary mapping cache name to its statistics
+        """
+        models = self.models
+        return {
+            'preprocessing': models.intent_classifier.preprocessor.cache.stats(),
+            'intents': models.intent_classifier.cache.stats(),
+            'entities': models.entity_extractor.cache.stats()
+        }
+    
+    def fast_path_stats(self):
+        """
+        Get statistics of the exact-match fast path.
+        
+        Returns:
+            Dictionary with patterns, hits, misses and hit_rate
+        """
+        return self.fast_path.stats()
+    
+    def clear_caches(self):
+        """Invalidate all cached preprocessing and prediction results."""
+        self.models.clear_caches()
+    
     def is_goodbye(self, message):
         """
         Check if message contains goodbye statements.
@@ -63,8 +413,7 @@ class Chatbot:
         Returns:
             Boolean indicating if message is a goodbye
         """
-        message_lower = message.lower()
-        return any(word in message_lower for word in self.goodbye_statements)
+        return self.fast_path.is_goodbye(message)
     
     def run(self):
         """Run the interactive chatbot loop."""
@@ -82,12 +431,13 @@ class Chatbot:
                     print("RemindMe!: Please enter a message.")
                     continue
                 
-                # Process message
+                # Process message; a reply to a slot prompt is never a goodbye
+                answering_prompt = self.session.is_pending
                 response = self.process_message(message)
                 print("RemindMe!: ", response)
                 
                 # Check for goodbye statements
-                if self.is_goodbye(message):
+                if not answering_prompt and self.is_goodbye(message):
                     print('\nAre you sure you want to end this chat? Type "yes" or "no"')
                     try:
                         next_input = input('> ').lower().strip()
@@ -114,4 +464,6 @@ class Chatbot:
                 print(f"RemindMe!: {error_msg}")
                 print("Please try again or type 'quit' to exit.")
                 log_error('UnexpectedError', error_msg, e)
+        
+        self.close()
 
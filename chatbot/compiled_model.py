@@ -0,0 +1,105 @@
+"""
+Compiled, fixed-signature inference for the Keras intent model.
+
+Keras ``model.predict`` wraps every call in a data adapter and a batch
+loop, and its first call traces the model into a graph. CompiledIntentModel
+instead traces ``model(x, training=False)`` once per batch-size bucket with
+a fully static input shape. Batches are zero-padded up to the nearest
+bucket (and split at the largest), so after warm_up() no call ever traces
+again and each call is a single graph execution.
+"""
+
+import threading
+import numpy as np
+
+
+class CompiledIntentModel:
+    """Keras model called through one concrete tf.function per batch bucket."""
+    
+    def __init__(self, model, batch_buckets, jit_compile=False):
+        """
+        Initialize CompiledIntentModel.
+        
+        Args:
+            model: Loaded Keras model taking a bag-of-words batch
+            batch_buckets: Batch sizes to compile for, e.g. (1, 8, 32)
+            jit_compile: Whether to compile the graphs with XLA
+        """
+        import tensorflow as tf
+        
+        if not batch_buckets or min(batch_buckets) < 1:
+            raise ValueError(f"Invalid batch buckets: {batch_buckets}")
+        self.model = model
+        self.input_dim = int(model.input_shape[-1])
+        self.output_dim = int(model.output_shape[-1])
+        self.batch_buckets = tuple(sorted(set(int(size) for size in batch_buckets)))
+        self.traces = 0
+        self._tf = tf
+        self._function = tf.function(self._call, jit_compile=jit_compile, autograph=False)
+        self._concrete = {}
+        self._lock = threading.Lock()
+    
+    def _call(self, x):
+        # Python side effects only run while tracing
+        self.traces += 1
+        return self.model(x, training=False)
+    
+    def bucket_for(self, size):
+        """
+        Get the bucket a batch of a given size is padded to.
+        
+        Args:
+            size: Number of rows
+        
+        Returns:
+            Smallest bucket holding size rows, or the largest bucket
+        """
+        for bucket in self.batch_buckets:
+            if size <= bucket:
+                return bucket
+        return self.batch_buckets[-1]
+    
+    def _concrete_function(self, bucket):
+        function = self._concrete.get(bucket)
+        if function is None:
+            with self._lock:
+                function = self._concrete.get(bucket)
+                if function is None:
+                    function = self._function.get_concrete_function(
+                        self._tf.TensorSpec((bucket, self.input_dim), self._tf.float32)
+                    )
+                    self._concrete[bucket] = function
+        return function
+    
+    def predict(self, x, batch_size=None, verbose=0):
+        """
+        Run the forward pass.
+        
+        Args:
+            x: Input array of shape (n_samples, input_dim)
+            batch_size: Accepted for Keras API compatibility (unused)
+            verbose: Accepted for Keras API compatibility (unused)
+        
+        Returns:
+            numpy array of shape (n_samples, output_dim) with class probabilities
+        """
+        x = np.asarray(x, dtype=np.float32)
+        largest = self.batch_buckets[-1]
+        outputs = []
+        for start in range(0, len(x), largest):
+            chunk = x[start:start + largest]
+            bucket = self.bucket_for(len(chunk))
+            if len(chunk) < bucket:
+                padded = np.zeros((bucket, self.input_dim), dtype=np.float32)
+                padded[:len(chunk)] = chunk
+                chunk = padded
+            result = self._concrete_function(bucket)(self._tf.constant(chunk))
+            outputs.append(result.numpy()[:min(largest, len(x) - start)])
+        if not outputs:
+            return np.zeros((0, self.output_dim), dtype=np.float32)
+        return outputs[0] if len(outputs) == 1 else np.concatenate(outputs)
+    
+    def warm_up(self):
+        """Trace and run every bucket once."""
+        for bucket in self.batch_buckets:
+            self.predict(np.zeros((bucket, self.input_dim), dtype=np.float32))
@@ -0,0 +1,92 @@
+"""
+Dialogue state for multi-turn slot filling.
+"""
+
+
+class DialogueState:
+    """
+    A response waiting for entity values the user has not given yet.
+    
+    Holds the intent, the chosen response template, the slots still
+    missing with their prompts, and the entities collected so far. The
+    state is plain data, so it can be kept per conversation and resumed
+    by whichever worker handles the next message.
+    """
+    
+    __slots__ = ('tag', 'template', 'missing', 'entities')
+    
+    def __init__(self, tag, template, missing, entities):
+        """
+        Initialize DialogueState.
+        
+        Args:
+            tag: Intent tag the response belongs to
+            template: ResponseTemplate to render once all slots are filled
+            missing: List of (entity_type, prompt) tuples still to ask for
+            entities: Dictionary of entities collected so far
+        """
+        self.tag = tag
+        self.template = template
+        self.missing = list(missing)
+        self.entities = dict(entities)
+    
+    @property
+    def missing_slots(self):
+        """Entity types still to be filled, in the order they are asked."""
+        return [entity_type for entity_type, _ in self.missing]
+    
+    @property
+    def prompt(self):
+        """Prompt for the next missing slot, or None when complete."""
+        return self.missing[0][1] if self.missing else None
+    
+    @property
+    def is_complete(self):
+        """Whether every slot has a value."""
+        return not self.missing
+    
+    def fill(self, value):
+        """
+        Use a user reply as the value of the next missing slot.
+        
+        Args:
+            value: Reply text; blank replies leave the slot missing
+        
+        Returns:
+            Boolean indicating if a slot was filled
+        """
+        value = value.strip()
+        if not value or not self.missing:
+            return False
+        entity_type, _ = self.missing.pop(0)
+        self.entities[entity_type] = value
+        return True
+
+
+class Session:
+    """
+    Per-conversation state passed to Chatbot.process_message.
+    
+    Uses __slots__ so that hundreds of thousands of idle sessions stay
+    small in memory.
+    """
+    
+    __slots__ = ('session_id', 'dialogue', 'last_intent', 'last_seen')
+    
+    def __init__(self, session_id=None, last_seen=0.0):
+        """
+        Initialize Session.
+        
+        Args:
+            session_id: Optional identifier of the conversation
+            last_seen: Time of the last access (time.time())
+        """
+        self.session_id = session_id
+        self.dialogue = None
+        self.last_intent = None
+        self.last_seen = last_seen
+    
+    @property
+    def is_pending(self):
+        """Whether the conversation is waiting for slot values."""
+        return self.dialogue is not None
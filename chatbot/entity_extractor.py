@@ -2,8 +2,12 @@
 Entity extraction module using NER.
 """
 
+import copy
+import time
+from collections import deque
 import config
 from logger import logger, log_error
+from chatbot.utils.cache import LRUCache
 
 
 class EntityExtractor:
@@ -18,6 +22,40 @@ class EntityExtractor:
         """
         self.nlp = nlp_model
         self.keep_first_only = config.NER_CONFIG['keep_first_entity_only']
+        perf_config = config.PERFORMANCE_CONFIG
+        self.cache = LRUCache(perf_config['cache_size'] if perf_config['cache_predictions'] else 0)
+    
+    def set_model(self, nlp_model):
+        """
+        Replace the NER model and invalidate cached entities.
+        
+        Args:
+            nlp_model: Loaded spaCy NER model
+        """
+        self.nlp = nlp_model
+        self.clear_cache()
+    
+    def clear_cache(self):
+        """Drop cached entity results."""
+        self.cache.clear()
+    
+    def warm_up(self, sample='Remind me to call mom tomorrow at 5pm'):
+        """
+        Run the NER model once so the first request does not pay for
+        lazy initialization. Nothing is cached; failures are logged.
+        
+        Args:
+            sample: Text to run through the model
+        
+        Returns:
+            Seconds spent
+        """
+        start = time.perf_counter()
+        try:
+            self.nlp(sample)
+        except Exception as e:
+            log_error('WarmUpError', f"NER warm-up failed: {e}", e)
+        return time.perf_counter() - start
     
     def extract(self, message):
         """
@@ -32,28 +70,130 @@ class EntityExtractor:
         if not message or not message.strip():
             return {}
         
+        # NER is case sensitive, so the cache key keeps the original casing
+        key = message.strip()
+        cached = self.cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
         try:
             doc = self.nlp(message)
-            entities = {}
-            
-            for ent in doc.ents:
-                # Handle multiple entities of same type based on config
-                if self.keep_first_only:
-                    if ent.label_ not in entities:
-                        entities[ent.label_] = ent.text
-                else:
-                    # Keep all entities, store as list
-                    if ent.label_ not in entities:
-                        entities[ent.label_] = []
-                    entities[ent.label_].append(ent.text)
+            entities = self._doc_to_entities(doc)
             
             if entities:
                 logger.debug(f"Extracted entities from '{message}': {entities}")
             
+            self.cache.put(key, copy.deepcopy(entities))
             return entities
         except Exception as e:
             error_msg = f"Error extracting entities: {e}"
             print(error_msg)
             log_error('EntityExtractionError', error_msg, e)
             return {}
-
+    
+    def extract_batch(self, messages, batch_size=None, n_process=1, on_error='skip'):
+        """
+        Extract entities from many messages by streaming them through nlp.pipe.
+        
+        Intended for bulk jobs: results are neither read from nor added to
+        the per-message cache. If a batch fails, its messages are retried
+        one at a time (a message that still fails gets {}) and streaming
+        resumes with the next batch.
+        
+        Args:
+            messages: Iterable of message strings
+            batch_size: Number of texts spaCy buffers per batch
+                (uses the model's configured batch_size if None)
+            n_process: Number of worker processes used by spaCy
+            on_error: 'skip' to fall back as described above, or 'raise' to
+                log and re-raise the first error (used to validate a model)
+        
+        Yields:
+            Dictionary mapping entity labels to entity text, one per message,
+            in input order
+        """
+        if on_error not in ('skip', 'raise'):
+            raise ValueError(f"Unsupported on_error: {on_error}")
+        kwargs = {'n_process': n_process}
+        if batch_size is not None:
+            kwargs['batch_size'] = batch_size
+        
+        # Texts handed to nlp.pipe that have no result yet
+        pending = deque()
+        
+        def feed(source):
+            for message in source:
+                text = message if message and message.strip() else ''
+                pending.append(text)
+                yield text
+        
+        source = iter(messages)
+        while True:
+            try:
+                for doc in self.nlp.pipe(feed(source), **kwargs):
+                    entities = self._doc_to_entities(doc)
+                    pending.popleft()
+                    yield entities
+                return
+            except Exception as e:
+                if on_error == 'raise':
+                    error_msg = f"Error extracting entities in batch: {e}"
+                    print(error_msg)
+                    log_error('EntityExtractionError', error_msg, e)
+                    raise
+                error_msg = f"Error extracting entities in batch, retrying per message: {e}"
+                print(error_msg)
+                log_error('EntityExtractionError', error_msg, e)
+            
+            if not pending:
+                # The pipe fails before reading anything, so it cannot make progress
+                for message in source:
+                    yield self._extract_uncached(message)
+                return
+            while pending:
+                yield self._extract_uncached(pending.popleft())
+    
+    def _extract_uncached(self, text):
+        """
+        Extract entities from one message without the cache, logging failures.
+        
+        Args:
+            text: Input message string
+        
+        Returns:
+            Dictionary mapping entity labels to entity text ({} on failure)
+        """
+        if not text or not text.strip():
+            return {}
+        try:
+            return self._doc_to_entities(self.nlp(text))
+        except Exception as e:
+            error_msg = f"Error extracting entities: {e}"
+            print(error_msg)
+            log_error('EntityExtractionError', error_msg, e)
+            return {}
+    
+    def _doc_to_entities(self, doc):
+        """
+        Convert a processed spaCy Doc into the entity dictionary format.
+        
+        Args:
+            doc: spaCy Doc with entities
+        
+        Returns:
+            Dictionary mapping entity labels to entity text
+        """
+        entities = {}
+        
+        for ent in doc.ents:
+            # Handle multiple entities of same type based on config
+            if self.keep_first_only:
+                if ent.label_ not in entities:
+                    entities[ent.label_] = ent.text
+            else:
+                # Keep all entities, store as list
+                if ent.label_ not in entities:
+                    entities[ent.label_] = []
+                entities[ent.label_].append(ent.text)
+        
+        return entities
@@ -0,0 +1,195 @@
+"""
+Compiled fast-path matching for exact intent patterns and goodbye detection.
+"""
+
+import re
+import threading
+from collections import deque
+from chatbot.utils.cache import normalize_message
+
+_TRAILING_PUNCTUATION = re.compile(r'[\s?!.,]+$')
+
+
+def normalize_pattern(text):
+    """
+    Normalize text for exact pattern lookup.
+    
+    Lowercases, collapses whitespace and drops trailing punctuation, so
+    "What are my reminders?" and "what are my reminders" share a key.
+    
+    Args:
+        text: Input text
+    
+    Returns:
+        Normalized text
+    """
+    return _TRAILING_PUNCTUATION.sub('', normalize_message(text))
+
+
+class AhoCorasick:
+    """Keyword automaton that finds all keyword occurrences in one pass."""
+    
+    def __init__(self, keywords):
+        """
+        Build the automaton.
+        
+        Args:
+            keywords: Iterable of keyword strings (matched case-sensitively)
+        """
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+        
+        for keyword in keywords:
+            if not keyword:
+                continue
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                state = next_state
+            if keyword not in self._output[state]:
+                self._output[state] = self._output[state] + (keyword,)
+        
+        # Breadth-first pass to compute failure links
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+    
+    def _step(self, state, char):
+        while state and char not in self._goto[state]:
+            state = self._fail[state]
+        return self._goto[state].get(char, 0)
+    
+    def find_all(self, text):
+        """
+        Find all keyword occurrences.
+        
+        Args:
+            text: Text to scan
+        
+        Yields:
+            tuple: (start_index, keyword) for every occurrence
+        """
+        state = 0
+        for i, char in enumerate(text):
+            state = self._step(state, char)
+            for keyword in self._output[state]:
+                yield i - len(keyword) + 1, keyword
+    
+    def contains_any(self, text):
+        """
+        Check whether any keyword occurs in text, stopping at the first hit.
+        
+        Args:
+            text: Text to scan
+        
+        Returns:
+            Boolean indicating if a keyword was found
+        """
+        state = 0
+        for char in text:
+            state = self._step(state, char)
+            if self._output[state]:
+                return True
+        return False
+
+
+class FastPathMatcher:
+    """
+    Answers exact pattern matches and goodbye checks without the models.
+    
+    Patterns from intents.json are indexed by their normalized text at
+    load time. Patterns containing entity placeholders, or shared by
+    several intents, are left to the classifier.
+    """
+    
+    def __init__(self, intents_data, goodbye_statements):
+        """
+        Initialize FastPathMatcher.
+        
+        Args:
+            intents_data: Dictionary containing intents and patterns
+            goodbye_statements: List of goodbye keywords
+        """
+        self.exact_index = {}
+        ambiguous = set()
+        for intent in intents_data.get('intents', []):
+            tag = intent.get('tag')
+            for pattern in intent.get('patterns', []):
+                text = pattern if isinstance(pattern, str) else pattern.get('text', '')
+                if not text or '{' in text:
+                    continue
+                key = normalize_pattern(text)
+                if not key:
+                    continue
+                if self.exact_index.get(key, tag) != tag:
+                    ambiguous.add(key)
+                self.exact_index[key] = tag
+        for key in ambiguous:
+            del self.exact_index[key]
+        
+        self.goodbye_automaton = AhoCorasick(
+            statement.lower() for statement in goodbye_statements
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def match(self, message):
+        """
+        Look up the intent of a message that exactly matches a pattern.
+        
+        Args:
+            message: User input message
+        
+        Returns:
+            Intent tag or None if there is no exact match
+        """
+        tag = self.exact_index.get(normalize_pattern(message))
+        with self._lock:
+            if tag is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return tag
+    
+    def is_goodbye(self, message):
+        """
+        Check if message contains a goodbye statement, in a single pass.
+        
+        Args:
+            message: User input message
+        
+        Returns:
+            Boolean indicating if a goodbye statement occurs in the message
+        """
+        return self.goodbye_automaton.contains_any(message.lower())
+    
+    def stats(self):
+        """
+        Get fast-path statistics.
+        
+        Returns:
+            Dictionary with patterns, hits, misses and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'patterns': len(self.exact_index),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
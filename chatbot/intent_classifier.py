@@ -2,10 +2,14 @@
 Intent classification module.
 """
 
+import sys
+import time
 import numpy as np
 import config
 from logger import logger, log_prediction, log_error
+from chatbot.utils import tokenizer
 from chatbot.utils.preprocessor import Preprocessor
+from chatbot.utils.cache import LRUCache, normalize_message
 
 
 class IntentClassifier:
@@ -20,11 +24,65 @@ class IntentClassifier:
             words: List of words in vocabulary
             classes: List of intent classes
         """
-        self.model = model
+        self.model = _compile(model)
         self.preprocessor = Preprocessor(words_vocabulary=words)
         self.classes = classes
         self.error_threshold = config.INTENT_CONFIG['error_threshold']
         self.use_verbose = config.INTENT_CONFIG['use_verbose']
+        self.sparse_input = hasattr(model, 'predict_sparse')
+        perf_config = config.PERFORMANCE_CONFIG
+        self.cache = LRUCache(perf_config['cache_size'] if perf_config['cache_predictions'] else 0)
+    
+    def set_model(self, model, words=None, classes=None):
+        """
+        Replace the model (and optionally vocabulary and classes).
+        
+        Cached predictions and preprocessing results are invalidated.
+        
+        Args:
+            model: Trained model for intent classification
+            words: New list of words in vocabulary (keeps current if None)
+            classes: New list of intent classes (keeps current if None)
+        """
+        self.model = _compile(model)
+        self.sparse_input = hasattr(model, 'predict_sparse')
+        if classes is not None:
+            self.classes = classes
+        if words is not None:
+            self.preprocessor.set_vocabulary(words)
+        self.clear_cache()
+    
+    def clear_cache(self):
+        """Drop cached predictions and preprocessing results."""
+        self.cache.clear()
+        self.preprocessor.cache.clear()
+    
+    def warm_up(self, sample='hello'):
+        """
+        Pay first-call costs before serving.
+        
+        Runs the model once per batch bucket (tracing each compiled graph)
+        and tokenizes a sample so the lemmatizer data is loaded. Nothing is
+        cached. Failures are logged, not raised.
+        
+        Args:
+            sample: Sentence to tokenize
+        
+        Returns:
+            Seconds spent
+        """
+        start = time.perf_counter()
+        try:
+            if hasattr(self.model, 'warm_up'):
+                self.model.warm_up()
+            else:
+                input_dim = len(self.preprocessor.words)
+                for size in config.PERFORMANCE_CONFIG['batch_buckets']:
+                    self.model.predict(np.zeros((size, input_dim), dtype=np.float32), verbose=0)
+            tokenizer.clean_up_sentence(sample)
+        except Exception as e:
+            log_error('WarmUpError', f"Intent model warm-up failed: {e}", e)
+        return time.perf_counter() - start
     
     def predict(self, sentence):
         """
@@ -40,38 +98,131 @@ class IntentClassifier:
             return []
         
         try:
-            sentence = sentence.lower().strip()
-            bow = self.preprocessor.bag_of_words(sentence)
-            verbose = 1 if self.use_verbose else 0
-            res = self.model.predict(np.array([bow]), verbose=verbose)[0]
-            
-            results = [[i, r] for i, r in enumerate(res) if r > self.error_threshold]
-            results.sort(key=lambda x: x[1], reverse=True)
+            sentence = normalize_message(sentence)
+            cached = self.cache.get(sentence)
+            if cached is not None:
+                return _copy_results(cached)
             
-            return_list = []
-            for r in results:
-                return_list.append({
-                    'intent': self.classes[r[0]],
-                    'probability': float(r[1])
-                })
+            res = self._forward([sentence])[0]
             
-            # Log prediction
-            if return_list:
-                log_prediction(
-                    sentence,
-                    return_list[0]['intent'],
-                    return_list[0]['probability']
-                )
-            else:
-                logger.warning(
-                    f"No intent matched for sentence: '{sentence}' "
-                    f"(threshold: {self.error_threshold})"
-                )
-            
-            return return_list
+            results = self._build_results(sentence, res)
+            self.cache.put(sentence, results)
+            return _copy_results(results)
         except Exception as e:
             error_msg = f"Error in predict_class: {e}"
             print(error_msg)
             log_error('PredictionError', error_msg, e)
             return []
+    
+    def predict_batch(self, sentences, log=True):
+        """
+        Predict intent classes for several sentences with one forward pass.
+        
+        Args:
+            sentences: List of input sentence strings
+            log: Whether to log each prediction (bulk jobs turn this off)
+        
+        Returns:
+            List with one entry per sentence, each in the format returned by predict()
+        """
+        results = [[] for _ in sentences]
+        rows = []
+        for i, sentence in enumerate(sentences):
+            if not sentence or not sentence.strip():
+                continue
+            sentence = normalize_message(sentence)
+            cached = self.cache.get(sentence)
+            if cached is not None:
+                results[i] = _copy_results(cached)
+            else:
+                rows.append((i, sentence))
+        if not rows:
+            return results
+        
+        try:
+            res = self._forward([sentence for _, sentence in rows])
+            
+            for (i, sentence), probabilities in zip(rows, res):
+                sentence_results = self._build_results(sentence, probabilities, log)
+                self.cache.put(sentence, sentence_results)
+                results[i] = _copy_results(sentence_results)
+            
+            return results
+        except Exception as e:
+            error_msg = f"Error in predict_batch: {e}"
+            print(error_msg)
+            log_error('PredictionError', error_msg, e)
+            return [[] for _ in sentences]
+    
+    def _forward(self, sentences):
+        """
+        Run one model forward pass over normalized sentences.
+        
+        Models that accept sparse input (see NumpyIntentModel.predict_sparse)
+        get the CSR batch directly; others get a dense bag-of-words matrix.
+        
+        Args:
+            sentences: List of lowercased, stripped sentences
+        
+        Returns:
+            numpy array of class probabilities, one row per sentence
+        """
+        if self.sparse_input:
+            batch = self.preprocessor.sparse_bag_of_words_batch(sentences)
+            return self.model.predict_sparse(batch)
+        
+        bows = self.preprocessor.bag_of_words_batch(sentences)
+        verbose = 1 if self.use_verbose else 0
+        return self.model.predict(bows, batch_size=len(sentences), verbose=verbose)
+    
+    def _build_results(self, sentence, probabilities, log=True):
+        """
+        Threshold, sort and label the model output for one sentence.
+        
+        Args:
+            sentence: Normalized input sentence (used for logging)
+            probabilities: Model output row for the sentence
+            log: Whether to log the prediction
+        
+        Returns:
+            List of dictionaries with 'intent' and 'probability' keys
+        """
+        results = [[i, r] for i, r in enumerate(probabilities) if r > self.error_threshold]
+        results.sort(key=lambda x: x[1], reverse=True)
+        
+        return_list = []
+        for r in results:
+            return_list.append({
+                'intent': self.classes[r[0]],
+                'probability': float(r[1])
+            })
+        
+        # Log prediction
+        if log and return_list:
+            log_prediction(
+                sentence,
+                return_list[0]['intent'],
+                return_list[0]['probability']
+            )
+        elif log:
+            logger.warning(
+                f"No intent matched for sentence: '{sentence}' "
+                f"(threshold: {self.error_threshold})"
+            )
+        
+        return return_list
+
+
+def _copy_results(results):
+    """Copy a cached result list so callers cannot modify the cache."""
+    return [dict(r) for r in results]
+
 
+def _compile(model):
+    """Wrap a Keras model in a CompiledIntentModel when enabled in config."""
+    keras = sys.modules.get('keras')
+    perf_config = config.PERFORMANCE_CONFIG
+    if not perf_config['compile_intent_model'] or keras is None or not isinstance(model, keras.Model):
+        return model
+    from chatbot.compiled_model import CompiledIntentModel
+    return CompiledIntentModel(model, perf_config['batch_buckets'])
@@ -2,15 +2,60 @@
 Entry point for the RemindMe! Chatbot application.
 """
 
-from chatbot.chatbot import Chatbot
+import argparse
+import config
 
 
-def main():
+def build_parser():
+    """
+    Build the command line parser.
+    
+    Returns:
+        argparse.ArgumentParser with 'chat' (default) and 'bulk' subcommands
+    """
+    parser = argparse.ArgumentParser(description='RemindMe! Chatbot')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.add_parser('chat', help='Interactive chat (default)')
+    
+    bulk = subparsers.add_parser('bulk', help='Classify a JSONL file of messages into a JSONL file')
+    bulk.add_argument('input', help='Input JSONL file')
+    bulk.add_argument('output', help='Output JSONL file')
+    bulk.add_argument(
+        '--chunk-size', type=int, default=config.BULK_CONFIG['chunk_size'],
+        help='Messages per chunk'
+    )
+    bulk.add_argument(
+        '--ner', choices=['all', 'needed', 'none'], default='all',
+        help="Extract entities for every message, only for intents that use them, or not at all"
+    )
+    bulk.add_argument(
+        '--field', default=config.BULK_CONFIG['text_field'],
+        help='JSON field holding the message text'
+    )
+    bulk.add_argument('--resume', action='store_true', help='Continue from the saved offsets')
+    return parser
+
+
+def main(argv=None):
     """Main entry point."""
+    args = build_parser().parse_args(argv)
+    
+    from chatbot.chatbot import Chatbot
     chatbot = Chatbot()
-    chatbot.run()
+    if args.command == 'bulk':
+        from chatbot.bulk import BulkProcessor
+        processor = BulkProcessor(chatbot, chunk_size=args.chunk_size, ner=args.ner, text_field=args.field)
+        try:
+            stats = processor.run(args.input, args.output, resume=args.resume)
+        finally:
+            chatbot.close()
+        print(
+            f"✓ Processed {stats['messages']} messages ({stats['errors']} errors) "
+            f"in {stats['seconds']:.1f}s, {stats['messages_per_second']:.0f} msg/s"
+        )
+    else:
+        chatbot.run()
 
 
 if __name__ == "__main__":
     main()
-
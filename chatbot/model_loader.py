@@ -2,15 +2,46 @@
 Model loading utilities for the chatbot.
 """
 
+import hashlib
 import json
 import pickle
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from keras.models import load_model
-import spacy
 import config
 from logger import logger, log_model_loading, log_error
+from chatbot.utils.timing import StageTimings
+
+
+def compact_ner_exclude(model_path):
+    """
+    Get the parts of a spaCy model that inference does not need.
+    
+    Every pipeline component except 'ner' is excluded. The vocab (string
+    store, lookup tables and vectors) is excluded too unless the model
+    was built with static vectors; entity labels live in the NER
+    component itself and new strings are interned as texts are processed.
+    
+    Args:
+        model_path: Path to the spaCy model directory
+    
+    Returns:
+        List of names to pass as spacy.load(..., exclude=...)
+    """
+    import spacy
+    
+    model_config = spacy.util.load_config(Path(model_path) / 'config.cfg', interpolate=True)
+    exclude = [name for name in model_config['nlp']['pipeline'] if name != 'ner']
+    
+    uses_vectors = (
+        model_config.get('paths', {}).get('vectors') is not None
+        or model_config.get('initialize', {}).get('vectors') is not None
+    )
+    if not uses_vectors:
+        exclude.append('vocab')
+    return exclude
 
 
 class ModelLoader:
@@ -23,20 +54,53 @@ class ModelLoader:
         self.intents_data = None
         self.words = None
         self.classes = None
+        self.bundle = None
         self.model_paths = config.MODEL_PATHS
+        self.timings = StageTimings()
     
     def load_all(self):
         """
         Load all required models and data files.
         
+        The artifacts are independent, so with
+        PERFORMANCE_CONFIG['parallel_model_loading'] they are loaded on a
+        thread pool; spaCy and TensorFlow spend much of their import and
+        load time in I/O and native code. Each phase is timed and a
+        breakdown is printed at the end.
+        
         Returns:
             tuple: (nlp, intent_model, intents_data, words, classes)
         """
-        self.load_ner_model()
-        self.load_intent_model()
-        self.load_intents_data()
-        self.load_words()
-        self.load_classes()
+        if self.use_bundle():
+            phases = [
+                ('ner_model', self.load_ner_model),
+                ('bundle', self.load_bundle)
+            ]
+        else:
+            phases = [
+                ('ner_model', self.load_ner_model),
+                ('intent_model', self.load_intent_model),
+                ('intents_data', self.load_intents_data),
+                ('words', self.load_words),
+                ('classes', self.load_classes)
+            ]
+        start = time.perf_counter()
+        if config.PERFORMANCE_CONFIG['parallel_model_loading']:
+            # Concurrent first imports of spaCy and TensorFlow can deadlock on
+            # shared dependencies, so the libraries are imported up front
+            self.timings.timed('imports', self.import_libraries)
+            with ThreadPoolExecutor(max_workers=len(phases), thread_name_prefix='model-loader') as executor:
+                futures = [executor.submit(self.timings.timed, name, load) for name, load in phases]
+                # Re-raises the SystemExit of a failed loader in the main thread
+                for future in futures:
+                    future.result()
+        else:
+            for name, load in phases:
+                self.timings.timed(name, load)
+        self.timings.record('total', time.perf_counter() - start)
+        
+        print(f"✓ Startup: {self.startup_report()}")
+        logger.info(f"Model loading times: {self.startup_report()}")
         
         return (
             self.nlp,
@@ -46,14 +110,111 @@ class ModelLoader:
             self.classes
         )
     
+    def use_bundle(self):
+        """
+        Check whether the model bundle replaces the separate artifacts.
+        
+        The bundle holds NumPy-backend weights, so it is only used with
+        that backend, when enabled in config and present on disk.
+        
+        Returns:
+            Boolean indicating if load_bundle() should be used
+        """
+        return (
+            config.PERFORMANCE_CONFIG['use_model_bundle']
+            and config.PERFORMANCE_CONFIG['intent_backend'] == 'numpy'
+            and os.path.exists(self.model_paths['model_bundle'])
+        )
+    
+    def model_version(self):
+        """
+        Identify the loaded model set.
+        
+        Returns:
+            The bundle version when a bundle was loaded, otherwise a digest
+            of the size and modification time of every model file
+        """
+        if self.bundle is not None:
+            return self.bundle.version
+        
+        digest = hashlib.sha256()
+        for key in ('ner_model', 'intents_model', 'intents_json', 'words_pkl', 'classes_pkl'):
+            path = self.model_paths[key]
+            files = [path]
+            if os.path.isdir(path):
+                files = sorted(
+                    os.path.join(root, name) for root, _, names in os.walk(path) for name in names
+                )
+            for file_path in files:
+                if os.path.exists(file_path):
+                    stat = os.stat(file_path)
+                    digest.update(f'{file_path}:{stat.st_size}:{stat.st_mtime_ns};'.encode('utf-8'))
+        return f'files-{digest.hexdigest()[:12]}'
+    
+    def load_bundle(self):
+        """Load the intent model, vocabulary, classes and responses from the model bundle."""
+        from chatbot.bundle import load_bundle
+        
+        try:
+            self.bundle = load_bundle(
+                self.model_paths['model_bundle'],
+                verify=config.PERFORMANCE_CONFIG['verify_model_bundle']
+            )
+            self.intent_model = self.bundle.intent_model.for_inference()
+            self.words = self.bundle.words
+            self.classes = self.bundle.classes
+            self.intents_data = self.bundle.intents_data()
+            print(f"✓ Model bundle {self.bundle.version} loaded successfully ({self.bundle.metadata['precision']})")
+            log_model_loading('Model Bundle', success=True)
+        except Exception as e:
+            error_msg = f"Error loading model bundle: {e}"
+            print(f"✗ {error_msg}")
+            log_model_loading('Model Bundle', success=False, error=str(e))
+            sys.exit(1)
+    
+    def import_libraries(self):
+        """Import the libraries the configured models need."""
+        import spacy  # noqa: F401
+        if config.PERFORMANCE_CONFIG['intent_backend'] == 'keras':
+            import keras  # noqa: F401
+    
+    def startup_report(self):
+        """
+        Format the time spent in each loading phase.
+        
+        Returns:
+            String like 'total 1.20s (ner_model 0.85s, intent_model 1.10s, ...)'
+        """
+        phases = self.timings.summary()
+        total = phases.pop('total', None)
+        details = ', '.join(f"{name} {stats['total_seconds']:.2f}s" for name, stats in phases.items())
+        if total is None:
+            return details
+        return f"total {total['total_seconds']:.2f}s ({details})"
+    
     def load_ner_model(self):
         """Load the NER model."""
         try:
-            if not os.path.exists(self.model_paths['ner_model']):
-                raise FileNotFoundError(f"NER model not found at {self.model_paths['ner_model']}")
+            import spacy
+            
+            profile = config.NER_CONFIG['load_profile']
+            model_path = self.model_paths['ner_model']
+            if profile == 'compact' and os.path.exists(self.model_paths['ner_model_compact']):
+                # Pruned copy written by training/package_ner.py
+                model_path = self.model_paths['ner_model_compact']
+            
+            if not os.path.exists(model_path):
+                raise FileNotFoundError(f"NER model not found at {model_path}")
             
-            self.nlp = spacy.load(self.model_paths['ner_model'])
-            print("✓ NER model loaded successfully")
+            if profile == 'compact':
+                self.nlp = spacy.load(model_path, exclude=compact_ner_exclude(model_path))
+                # Inference only: nothing but the entity recognizer runs
+                self.nlp.select_pipes(enable=['ner'])
+            elif profile == 'full':
+                self.nlp = spacy.load(model_path)
+            else:
+                raise ValueError(f"Unknown NER load profile: {profile}")
+            print(f"✓ NER model loaded successfully ({profile} profile)")
             log_model_loading('NER Model', success=True)
         except Exception as e:
             error_msg = f"Error loading NER model: {e}"
@@ -67,8 +228,19 @@ class ModelLoader:
             if not os.path.exists(self.model_paths['intents_model']):
                 raise FileNotFoundError(f"Intents model not found at {self.model_paths['intents_model']}")
             
-            self.intent_model = load_model(self.model_paths['intents_model'])
-            print("✓ Intents model loaded successfully")
+            backend = config.PERFORMANCE_CONFIG['intent_backend']
+            precision = config.PERFORMANCE_CONFIG['model_optimization']
+            if precision in ('float16', 'int8') and backend != 'numpy':
+                raise ValueError(f"model_optimization '{precision}' requires the numpy intent backend")
+            
+            if backend == 'numpy':
+                self.intent_model = self._load_numpy_intent_model(precision)
+            elif backend == 'keras':
+                from keras.models import load_model
+                self.intent_model = load_model(self.model_paths['intents_model'])
+            else:
+                raise ValueError(f"Unknown intent backend: {backend}")
+            print(f"✓ Intents model loaded successfully ({backend} backend, {precision})")
             log_model_loading('Intents Model', success=True)
         except Exception as e:
             error_msg = f"Error loading intents model: {e}"
@@ -76,6 +248,35 @@ class ModelLoader:
             log_model_loading('Intents Model', success=False, error=str(e))
             sys.exit(1)
     
+    def _load_numpy_intent_model(self, precision):
+        """
+        Load the intent model for the NumPy backend.
+        
+        Reduced-precision models are read from the file written by
+        training/quantize_intents.py when it exists, otherwise the float32
+        weights are quantized at load time. Either way only the first layer
+        is kept quantized (see NumpyIntentModel.for_inference).
+        
+        Args:
+            precision: 'none', 'float16' or 'int8'
+        
+        Returns:
+            NumpyIntentModel instance
+        """
+        from chatbot.numpy_backend import NumpyIntentModel
+        
+        if precision not in ('float16', 'int8'):
+            return NumpyIntentModel.from_h5(self.model_paths['intents_model'])
+        
+        quantized_path = self.model_paths['intents_model'].replace('.h5', f'_{precision}.npz')
+        if os.path.exists(quantized_path):
+            return NumpyIntentModel.load_npz(quantized_path).for_inference()
+        
+        logger.warning(
+            f"Quantized model not found at {quantized_path}, quantizing {precision} at load time"
+        )
+        return NumpyIntentModel.from_h5(self.model_paths['intents_model']).quantize(precision).for_inference()
+    
     def load_intents_data(self):
         """Load intents JSON data."""
         try:
@@ -0,0 +1,188 @@
+"""
+The set of loaded models a Chatbot serves from, and its validation.
+
+A ModelSet bundles the intent classifier, entity extractor, response
+generator and fast-path matcher built from one ModelLoader run, together
+with the version of the artifacts they came from. The Chatbot holds one
+ModelSet reference and each request reads it once, so a reload can build
+and check a new set while requests keep running, then replace the whole
+set with a single assignment.
+"""
+
+import math
+import config
+from logger import logger
+from chatbot.model_loader import ModelLoader
+from chatbot.intent_classifier import IntentClassifier
+from chatbot.entity_extractor import EntityExtractor
+from chatbot.response_generator import ResponseGenerator
+from chatbot.fast_path import FastPathMatcher
+
+
+class ReloadError(Exception):
+    """Raised when a new model set cannot be loaded or fails its smoke batch."""
+
+
+def smoke_messages(intents_data, limit):
+    """
+    Pick pattern texts to smoke-test a model set with.
+    
+    Takes the first pattern of every intent, then the second, and so on,
+    so a small limit still covers as many intents as possible.
+    
+    Args:
+        intents_data: Dictionary containing intents and patterns
+        limit: Maximum number of messages
+    
+    Returns:
+        List of (message, expected intent tag) tuples
+    """
+    per_intent = []
+    for intent in intents_data.get('intents', []):
+        texts = [
+            pattern if isinstance(pattern, str) else pattern.get('text', '')
+            for pattern in intent.get('patterns', [])
+        ]
+        per_intent.append([(text, intent.get('tag')) for text in texts if text])
+    
+    messages = []
+    depth = 0
+    while len(messages) < limit and any(depth < len(pairs) for pairs in per_intent):
+        for pairs in per_intent:
+            if depth < len(pairs) and len(messages) < limit:
+                messages.append(pairs[depth])
+        depth += 1
+    return messages
+
+
+class ModelSet:
+    """Components built from one set of model artifacts."""
+    
+    def __init__(self, intent_classifier, entity_extractor, response_generator, fast_path,
+                 version=None, smoke_batch=None):
+        """
+        Initialize ModelSet.
+        
+        Args:
+            intent_classifier: IntentClassifier
+            entity_extractor: EntityExtractor
+            response_generator: ResponseGenerator
+            fast_path: FastPathMatcher
+            version: Version string of the artifacts
+            smoke_batch: List of (message, expected tag) used by smoke_test()
+        """
+        self.intent_classifier = intent_classifier
+        self.entity_extractor = entity_extractor
+        self.response_generator = response_generator
+        self.fast_path = fast_path
+        self.version = version
+        self.smoke_batch = smoke_batch or []
+        self._entities_always_needed = None
+    
+    @classmethod
+    def load(cls, loader=None):
+        """
+        Load the models and build the components around them.
+        
+        Args:
+            loader: ModelLoader to use (a new one if None)
+        
+        Returns:
+            ModelSet instance
+        """
+        loader = loader or ModelLoader()
+        nlp, intent_model, intents_data, words, classes = loader.load_all()
+        if loader.bundle is not None:
+            response_generator = ResponseGenerator.from_table(loader.bundle.response_table)
+        else:
+            response_generator = ResponseGenerator(intents_data)
+        return cls(
+            IntentClassifier(intent_model, words, classes),
+            EntityExtractor(nlp),
+            response_generator,
+            FastPathMatcher(intents_data, config.CHATBOT_CONFIG['goodbye_statements']),
+            version=loader.model_version(),
+            smoke_batch=smoke_messages(intents_data, config.RELOAD_CONFIG['smoke_batch_size'])
+        )
+    
+    def entities_always_needed(self):
+        """
+        Check whether every intent class has entity slots.
+        
+        Returns:
+            Boolean indicating if NER is needed whatever the intent
+        """
+        if self._entities_always_needed is None:
+            classes = self.intent_classifier.classes
+            self._entities_always_needed = bool(classes) and all(
+                self.response_generator.needs_entities(tag) for tag in classes
+            )
+        return self._entities_always_needed
+    
+    def smoke_test(self, min_accuracy=None):
+        """
+        Run the smoke batch through every component.
+        
+        The batch is classified in one forward pass, tagged with one
+        nlp.pipe call and answered. Probabilities must be finite and name
+        known classes, and the top-1 intent must match the pattern's own
+        intent for at least min_accuracy of the batch.
+        
+        Args:
+            min_accuracy: Required top-1 accuracy (from config if None)
+        
+        Returns:
+            Dictionary with messages and accuracy
+        
+        Raises:
+            ReloadError: If a component fails or the accuracy is too low
+        """
+        if min_accuracy is None:
+            min_accuracy = config.RELOAD_CONFIG['min_smoke_accuracy']
+        if not self.smoke_batch:
+            raise ReloadError("No intent patterns to smoke-test the models with")
+        messages = [message for message, _ in self.smoke_batch]
+        
+        try:
+            predictions = self.intent_classifier.predict_batch(messages, log=False)
+            entities = list(self.entity_extractor.extract_batch(messages, on_error='raise'))
+            for intents, message_entities in zip(predictions, entities):
+                self.response_generator.respond(intents, message_entities)
+        except Exception as e:
+            raise ReloadError(f"Smoke batch failed: {e}") from e
+        
+        if len(predictions) != len(messages) or len(entities) != len(messages):
+            raise ReloadError("Smoke batch returned the wrong number of results")
+        known = set(self.intent_classifier.classes)
+        correct = 0
+        for (message, tag), intents in zip(self.smoke_batch, predictions):
+            for result in intents:
+                probability = float(result['probability'])
+                if result['intent'] not in known or not math.isfinite(probability) or not 0.0 <= probability <= 1.0:
+                    raise ReloadError(f"Invalid prediction for '{message}': {result}")
+            correct += bool(intents) and intents[0]['intent'] == tag
+        
+        accuracy = correct / len(messages)
+        if accuracy < min_accuracy:
+            raise ReloadError(f"Smoke batch accuracy {accuracy:.2f} is below {min_accuracy:.2f}")
+        return {'messages': len(messages), 'accuracy': accuracy}
+    
+    def warm_up(self):
+        """
+        Run the models once before they serve requests.
+        
+        Returns:
+            Dictionary mapping component to seconds spent
+        """
+        timings = {
+            'intent': self.intent_classifier.warm_up(),
+            'ner': self.entity_extractor.warm_up()
+        }
+        print(f"✓ Warm-up: {', '.join(f'{name} {seconds:.2f}s' for name, seconds in timings.items())}")
+        logger.info(f"Model warm-up times: {timings}")
+        return timings
+    
+    def clear_caches(self):
+        """Invalidate the cached preprocessing, prediction and entity results."""
+        self.intent_classifier.clear_cache()
+        self.entity_extractor.clear_cache()
@@ -0,0 +1,446 @@
+"""
+Pure-NumPy inference backend for the intent classification model.
+"""
+
+import json
+import numpy as np
+
+
+def _relu(x):
+    return np.maximum(x, 0, out=x)
+
+
+def _softmax(x):
+    x = x - x.max(axis=-1, keepdims=True)
+    np.exp(x, out=x)
+    x /= x.sum(axis=-1, keepdims=True)
+    return x
+
+
+def _sigmoid(x):
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+ACTIVATIONS = {
+    'linear': lambda x: x,
+    'relu': _relu,
+    'softmax': _softmax,
+    'sigmoid': _sigmoid,
+    'tanh': np.tanh,
+}
+
+# Layers that are identity functions at inference time
+PASSTHROUGH_LAYERS = ('InputLayer', 'Dropout')
+
+# Supported weight storage precisions
+PRECISIONS = ('float32', 'float16', 'int8')
+
+
+class DenseLayer:
+    """A fully connected layer: activation(x @ kernel + bias)."""
+    
+    precision = 'float32'
+    
+    def __init__(self, kernel, bias, activation='linear'):
+        """
+        Initialize DenseLayer.
+        
+        Args:
+            kernel: Weight matrix of shape (input_dim, units)
+            bias: Bias vector of shape (units,)
+            activation: Name of the activation function
+        """
+        if activation not in ACTIVATIONS:
+            raise ValueError(f"Unsupported activation: {activation}")
+        self.kernel = np.ascontiguousarray(kernel, dtype=np.float32)
+        self.bias = np.ascontiguousarray(bias, dtype=np.float32)
+        self.activation = activation
+        self._activation_fn = ACTIVATIONS[activation]
+    
+    @property
+    def units(self):
+        """Number of output units."""
+        return self.kernel.shape[1]
+    
+    @property
+    def nbytes(self):
+        """Memory used by the stored weights."""
+        return self.kernel.nbytes + self.bias.nbytes
+    
+    def gather_rows(self, indices):
+        """
+        Get float32 kernel rows for the given input columns.
+        
+        Args:
+            indices: Array of input column indices
+        
+        Returns:
+            numpy array of shape (len(indices), units)
+        """
+        return self.kernel[indices]
+    
+    def __call__(self, x):
+        return self._activation_fn(x @ self.kernel + self.bias)
+
+
+class QuantizedDenseLayer(DenseLayer):
+    """
+    Dense layer whose kernel is stored as float16 or per-channel int8.
+    
+    For int8, each output unit j has its own scale so that
+    kernel[:, j] ~= q[:, j] * scale[j]. The bias stays in float32.
+    
+    NumPy has no fast float16 or int8 matmul, so the kernel is never
+    upcast as a whole: both the sparse path (gather_rows) and calls
+    convert only the kernel rows of the active input columns, which for
+    a bag of words is a few rows of the vocabulary-sized first layer.
+    The small later layers are dequantized at load instead (see
+    NumpyIntentModel.for_inference).
+    """
+    
+    def __init__(self, kernel, bias, activation='linear', precision='int8', scale=None):
+        """
+        Initialize QuantizedDenseLayer from already quantized weights.
+        
+        Args:
+            kernel: Quantized weight matrix of shape (input_dim, units)
+            bias: Bias vector of shape (units,)
+            activation: Name of the activation function
+            precision: 'float16' or 'int8'
+            scale: Per-output-unit float32 scales (required for int8)
+        """
+        if activation not in ACTIVATIONS:
+            raise ValueError(f"Unsupported activation: {activation}")
+        if precision == 'float16':
+            self.kernel = np.ascontiguousarray(kernel, dtype=np.float16)
+            self.scale = None
+        elif precision == 'int8':
+            if scale is None:
+                raise ValueError("int8 layers require per-channel scales")
+            self.kernel = np.ascontiguousarray(kernel, dtype=np.int8)
+            self.scale = np.ascontiguousarray(scale, dtype=np.float32)
+        else:
+            raise ValueError(f"Unsupported precision: {precision}")
+        self.bias = np.ascontiguousarray(bias, dtype=np.float32)
+        self.precision = precision
+        self.activation = activation
+        self._activation_fn = ACTIVATIONS[activation]
+    
+    @classmethod
+    def from_dense(cls, layer, precision):
+        """
+        Quantize a float32 DenseLayer.
+        
+        Args:
+            layer: DenseLayer to quantize
+            precision: 'float16' or 'int8'
+        
+        Returns:
+            QuantizedDenseLayer instance
+        """
+        if precision == 'float16':
+            return cls(layer.kernel, layer.bias, layer.activation, 'float16')
+        
+        max_abs = np.abs(layer.kernel).max(axis=0)
+        scale = np.where(max_abs > 0, max_abs / 127.0, 1.0).astype(np.float32)
+        quantized = np.clip(np.rint(layer.kernel / scale), -127, 127).astype(np.int8)
+        return cls(quantized, layer.bias, layer.activation, 'int8', scale)
+    
+    @property
+    def nbytes(self):
+        """Memory used by the stored weights."""
+        scale_bytes = self.scale.nbytes if self.scale is not None else 0
+        return self.kernel.nbytes + self.bias.nbytes + scale_bytes
+    
+    def dequantize(self):
+        """
+        Get the float32 layer this layer's weights represent.
+        
+        Returns:
+            DenseLayer instance
+        """
+        kernel = self.kernel.astype(np.float32)
+        if self.scale is not None:
+            kernel *= self.scale
+        return DenseLayer(kernel, self.bias, self.activation)
+    
+    def gather_rows(self, indices):
+        # Only the gathered rows are converted
+        rows = self.kernel[indices].astype(np.float32)
+        if self.scale is not None:
+            rows *= self.scale
+        return rows
+    
+    def __call__(self, x):
+        x = np.asarray(x, dtype=np.float32)
+        active = np.flatnonzero(x.any(axis=0))
+        x = x[:, active] @ self.gather_rows(active)
+        return self._activation_fn(x + self.bias)
+
+
+class NumpyIntentModel:
+    """
+    Forward pass of the intent MLP implemented with NumPy only.
+    
+    Exposes the subset of the Keras model API used by IntentClassifier,
+    so it can be swapped in for the Keras model without other changes.
+    """
+    
+    def __init__(self, layers):
+        """
+        Initialize NumpyIntentModel.
+        
+        Args:
+            layers: List of DenseLayer objects, applied in order
+        """
+        if not layers:
+            raise ValueError("NumpyIntentModel requires at least one layer")
+        self.layers = layers
+    
+    @property
+    def input_dim(self):
+        """Size of the bag-of-words input vector."""
+        return self.layers[0].kernel.shape[0]
+    
+    @property
+    def output_dim(self):
+        """Number of intent classes."""
+        return self.layers[-1].units
+    
+    @property
+    def precision(self):
+        """Weight storage precision of the model."""
+        return self.layers[0].precision
+    
+    @property
+    def nbytes(self):
+        """Memory used by the stored weights of all layers."""
+        return sum(layer.nbytes for layer in self.layers)
+    
+    @classmethod
+    def from_h5(cls, model_path):
+        """
+        Load a Sequential Dense model saved by Keras in HDF5 format.
+        
+        Only the weights and layer configuration are read; TensorFlow is
+        not imported.
+        
+        Args:
+            model_path: Path to the .h5 model file
+        
+        Returns:
+            NumpyIntentModel instance
+        """
+        import h5py
+        
+        with h5py.File(model_path, 'r') as f:
+            model_config = f.attrs['model_config']
+            if isinstance(model_config, bytes):
+                model_config = model_config.decode('utf-8')
+            model_config = json.loads(model_config)
+            
+            if model_config.get('class_name') != 'Sequential':
+                raise ValueError(
+                    f"Unsupported model type: {model_config.get('class_name')}"
+                )
+            
+            weights_group = f['model_weights'] if 'model_weights' in f else f
+            layers = []
+            for layer_config in model_config['config']['layers']:
+                class_name = layer_config['class_name']
+                if class_name in PASSTHROUGH_LAYERS:
+                    continue
+                if class_name != 'Dense':
+                    raise ValueError(f"Unsupported layer type: {class_name}")
+                
+                name = layer_config['config']['name']
+                group = weights_group[name][name]
+                layers.append(DenseLayer(
+                    group['kernel:0'][()],
+                    group['bias:0'][()],
+                    layer_config['config'].get('activation', 'linear')
+                ))
+        
+        return cls(layers)
+    
+    @classmethod
+    def from_keras(cls, model):
+        """
+        Build a NumpyIntentModel from an in-memory Keras model.
+        
+        Args:
+            model: Keras Sequential model made of Dense and Dropout layers
+        
+        Returns:
+            NumpyIntentModel instance
+        """
+        layers = []
+        for layer in model.layers:
+            class_name = layer.__class__.__name__
+            if class_name in PASSTHROUGH_LAYERS:
+                continue
+            if class_name != 'Dense':
+                raise ValueError(f"Unsupported layer type: {class_name}")
+            kernel, bias = layer.get_weights()
+            layers.append(DenseLayer(kernel, bias, layer.get_config()['activation']))
+        
+        return cls(layers)
+    
+    def predict(self, x, batch_size=None, verbose=0):
+        """
+        Run the forward pass.
+        
+        Args:
+            x: Input array of shape (n_samples, input_dim)
+            batch_size: Accepted for Keras API compatibility (unused)
+            verbose: Accepted for Keras API compatibility (unused)
+        
+        Returns:
+            numpy array of shape (n_samples, output_dim) with class probabilities
+        """
+        x = np.asarray(x, dtype=np.float32)
+        for layer in self.layers:
+            x = layer(x)
+        return x
+    
+    def predict_sparse(self, batch):
+        """
+        Run the forward pass on a sparse bag-of-words batch.
+        
+        Because the inputs are binary, the first layer's pre-activation for
+        a row is the bias plus the sum of the kernel rows of its active
+        columns, so no dense input matrix is built.
+        
+        Args:
+            batch: SparseBatch with CSR indptr/indices of active columns
+        
+        Returns:
+            numpy array of shape (n_samples, output_dim) with class probabilities
+        """
+        first = self.layers[0]
+        n_rows = len(batch.indptr) - 1
+        x = np.zeros((n_rows, first.units), dtype=np.float32)
+        
+        row_lengths = np.diff(batch.indptr)
+        non_empty = row_lengths > 0
+        if batch.indices.size:
+            gathered = first.gather_rows(batch.indices)
+            # Empty rows have zero-length segments, so the start of every
+            # non-empty row ends the previous non-empty segment
+            x[non_empty] = np.add.reduceat(gathered, batch.indptr[:-1][non_empty], axis=0)
+        
+        x += first.bias
+        x = first._activation_fn(x)
+        for layer in self.layers[1:]:
+            x = layer(x)
+        return x
+    
+    def quantize(self, precision):
+        """
+        Get a copy of the model with reduced-precision weights.
+        
+        Args:
+            precision: 'float32', 'float16' or 'int8'
+        
+        Returns:
+            NumpyIntentModel instance
+        """
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unsupported precision: {precision}")
+        if precision == self.precision:
+            return self
+        if self.precision != 'float32':
+            raise ValueError("Only float32 models can be quantized")
+        if precision == 'float32':
+            return self
+        return NumpyIntentModel([
+            QuantizedDenseLayer.from_dense(layer, precision) for layer in self.layers
+        ])
+    
+    def for_inference(self):
+        """
+        Get the model to serve predictions with.
+        
+        A reduced-precision first layer stays quantized, since predict_sparse
+        only converts the rows it gathers from it; the later layers are small
+        and used as whole matrices, so they are dequantized once here. The
+        result mixes precisions; save the model it was made from instead.
+        
+        Returns:
+            NumpyIntentModel instance (self if already float32)
+        """
+        if self.precision == 'float32':
+            return self
+        return NumpyIntentModel(self.layers[:1] + [
+            layer.dequantize() if isinstance(layer, QuantizedDenseLayer) else layer
+            for layer in self.layers[1:]
+        ])
+    
+    def to_arrays(self):
+        """
+        Get the weights as named arrays.
+        
+        Returns:
+            Dictionary mapping 'kernel_<i>', 'bias_<i>' and (for int8)
+            'scale_<i>' to numpy arrays
+        """
+        arrays = {}
+        for i, layer in enumerate(self.layers):
+            arrays[f'kernel_{i}'] = layer.kernel
+            arrays[f'bias_{i}'] = layer.bias
+            if getattr(layer, 'scale', None) is not None:
+                arrays[f'scale_{i}'] = layer.scale
+        return arrays
+    
+    @classmethod
+    def from_arrays(cls, precision, activations, arrays):
+        """
+        Build a model from named weight arrays without copying them.
+        
+        Args:
+            precision: 'float32', 'float16' or 'int8'
+            activations: Activation name per layer
+            arrays: Mapping in the format returned by to_arrays()
+        
+        Returns:
+            NumpyIntentModel instance
+        """
+        layers = []
+        for i, activation in enumerate(activations):
+            kernel = arrays[f'kernel_{i}']
+            bias = arrays[f'bias_{i}']
+            if precision == 'float32':
+                layers.append(DenseLayer(kernel, bias, str(activation)))
+            else:
+                scale = arrays[f'scale_{i}'] if f'scale_{i}' in arrays else None
+                layers.append(QuantizedDenseLayer(kernel, bias, str(activation), precision, scale))
+        return cls(layers)
+    
+    def save_npz(self, path):
+        """
+        Save the model weights to an uncompressed .npz file.
+        
+        Args:
+            path: Destination file path
+        """
+        np.savez(
+            path,
+            precision=np.array(self.precision),
+            activations=np.array([layer.activation for layer in self.layers]),
+            **self.to_arrays()
+        )
+    
+    @classmethod
+    def load_npz(cls, path):
+        """
+        Load a model saved with save_npz().
+        
+        Args:
+            path: Path to the .npz file
+        
+        Returns:
+            NumpyIntentModel instance
+        """
+        with np.load(path, allow_pickle=False) as data:
+            arrays = {name: data[name] for name in data.files}
+        return cls.from_arrays(str(arrays.pop('precision')), arrays.pop('activations'), arrays)
@@ -0,0 +1,326 @@
+"""
+Pre-fork launcher for the HTTP server.
+
+Run with ``python -m chatbot.prefork --workers 4``. The parent process
+loads the models once, binds the listening socket and forks the workers.
+Each worker serves the shared socket with its own ChatServer, so the
+kernel spreads connections across them. The model weights, vocabulary
+and intents are inherited copy-on-write: they are only read after
+loading, so the workers share those pages instead of each holding a copy.
+
+The parent supervises the workers. A worker that dies is replaced. On
+SIGTERM or SIGINT every worker drains its in-flight requests and exits,
+and any worker still running after the drain timeout is killed.
+
+On SIGHUP the parent reloads the models (see Chatbot.reload) and, once the
+new set has passed its smoke batch, forks a fresh worker for every slot
+and tells the old ones to drain. The new workers accept from the same
+socket, so no connection is refused during the switch. A rejected model
+set leaves the running workers untouched.
+
+TensorFlow does not support forking once its runtime has started, so the
+launcher refuses to start unless the NumPy intent backend is selected
+(INTENT_BACKEND=numpy).
+"""
+
+import argparse
+import asyncio
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+import config
+from logger import logger, log_error
+
+# Workers that die sooner than this after starting are restarted with a delay
+MIN_WORKER_UPTIME = 1.0
+MAX_RESTART_DELAY = 30.0
+# How often workers check that the supervisor is still alive
+PARENT_CHECK_INTERVAL = 1.0
+
+
+def available_cpus():
+    """
+    Get the CPUs this process may run on.
+    
+    Returns:
+        Sorted list of CPU ids
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def create_listening_socket(host, port, backlog=1024):
+    """
+    Bind the socket the workers share.
+    
+    Args:
+        host: Interface to bind
+        port: Port to bind, 0 for any free port
+        backlog: Listen queue length
+    
+    Returns:
+        Bound, listening socket inherited by forked workers
+    """
+    sock = socket.create_server((host, port), backlog=backlog)
+    sock.setblocking(False)
+    sock.set_inheritable(True)
+    return sock
+
+
+async def _serve_worker(chatbot, sock, drain_timeout):
+    # Imported here so the parent does not need the server module loaded
+    from chatbot.server import ChatServer
+    
+    # Reloads go through the supervisor (SIGHUP), which replaces every worker
+    server = ChatServer(chatbot, allow_reload=False)
+    await server.start(sock=sock)
+    
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stop.set)
+    
+    # Drain as well if the supervisor disappears without signalling us
+    parent = os.getppid()
+    while not stop.is_set() and os.getppid() == parent:
+        try:
+            await asyncio.wait_for(stop.wait(), PARENT_CHECK_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+    await server.stop(drain_timeout)
+
+
+def run_worker(chatbot, sock, cpu=None, drain_timeout=None):
+    """
+    Serve the shared socket in a forked worker until told to stop.
+    
+    Args:
+        chatbot: Chatbot loaded by the parent
+        sock: Shared listening socket
+        cpu: CPU to pin the worker to, or None
+        drain_timeout: Seconds to finish in-flight requests on SIGTERM
+    
+    Returns:
+        Exit code for the worker process
+    """
+    if cpu is not None and hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, {cpu})
+    try:
+        asyncio.run(_serve_worker(chatbot, sock, drain_timeout))
+        return 0
+    except Exception as e:
+        log_error('WorkerError', f"Worker {os.getpid()} failed: {e}", e)
+        return 1
+
+
+class WorkerPool:
+    """Forks, supervises and stops the worker processes."""
+    
+    def __init__(self, chatbot, sock, workers, pin_workers=True, drain_timeout=None):
+        """
+        Initialize WorkerPool.
+        
+        Args:
+            chatbot: Chatbot with all models loaded
+            sock: Shared listening socket
+            workers: Number of worker processes
+            pin_workers: Whether to pin each worker to one CPU
+            drain_timeout: Seconds workers get to drain on shutdown
+        """
+        self.chatbot = chatbot
+        self.sock = sock
+        self.workers = workers
+        self.drain_timeout = config.SERVER_CONFIG['drain_timeout'] if drain_timeout is None else drain_timeout
+        self.cpus = available_cpus() if pin_workers else None
+        self.children = {}  # pid -> (slot, start time)
+        self.restart_delay = {}  # slot -> seconds to wait before the next restart
+        self.stopping = False
+        self.restarts = 0
+        self.reload_requested = False
+        self.retiring = set()  # pids of workers replaced after a reload
+    
+    def _spawn(self, slot):
+        cpu = self.cpus[slot % len(self.cpus)] if self.cpus else None
+        pid = os.fork()
+        if pid == 0:
+            # Child: default signal handling until the worker loop installs its own
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGHUP, signal.SIG_IGN)
+            code = 1
+            try:
+                code = run_worker(self.chatbot, self.sock, cpu, self.drain_timeout)
+            finally:
+                os._exit(code)
+        self.children[pid] = (slot, time.monotonic())
+        logger.info(f"Started worker {slot} (pid {pid}{f', cpu {cpu}' if cpu is not None else ''})")
+    
+    def _handle_stop(self, signum, frame):
+        if not self.stopping:
+            logger.info(f"Received signal {signum}, draining workers")
+        self.stopping = True
+    
+    def _handle_reload(self, signum, frame):
+        self.reload_requested = True
+    
+    def _freeze_loaded_objects(self):
+        # Keep the loaded objects out of the children's garbage collection,
+        # which would otherwise write to (and so copy) every shared page
+        gc.unfreeze()
+        gc.collect()
+        gc.freeze()
+    
+    def reload(self):
+        """
+        Reload the models and replace every worker with one serving them.
+        
+        Returns:
+            Boolean indicating if the new models were swapped in
+        """
+        # Imported here so the launcher module does not load the model stack
+        from chatbot.model_set import ReloadError
+        
+        try:
+            result = self.chatbot.reload()
+        except ReloadError as e:
+            logger.warning(f"Model reload rejected, workers keep serving {self.chatbot.model_version}: {e}")
+            return False
+        
+        self._freeze_loaded_objects()
+        for pid, (slot, _) in list(self.children.items()):
+            if pid in self.retiring:
+                continue
+            self.retiring.add(pid)
+            self._spawn(slot)
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        logger.info(f"Workers now serving models {result['version']}")
+        return True
+    
+    def run(self):
+        """Fork the workers and supervise them until a stop signal arrives."""
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        signal.signal(signal.SIGHUP, self._handle_reload)
+        
+        self._freeze_loaded_objects()
+        for slot in range(self.workers):
+            self._spawn(slot)
+        
+        pending = {}  # slot -> time at which to restart it
+        while not self.stopping:
+            if self.reload_requested:
+                self.reload_requested = False
+                self.reload()
+            pid, status = os.waitpid(-1, os.WNOHANG) if self.children else (0, 0)
+            if pid == 0:
+                now = time.monotonic()
+                for slot, when in list(pending.items()):
+                    if now >= when and not self.stopping:
+                        del pending[slot]
+                        self._spawn(slot)
+                time.sleep(0.1)
+                continue
+            
+            slot, started = self.children.pop(pid)
+            if pid in self.retiring:
+                # Drained after a reload; its replacement is already running
+                self.retiring.discard(pid)
+                continue
+            if self.stopping:
+                break
+            uptime = time.monotonic() - started
+            delay = 0.0
+            if uptime < MIN_WORKER_UPTIME:
+                delay = min(max(self.restart_delay.get(slot, 0.5) * 2, 1.0), MAX_RESTART_DELAY)
+            self.restart_delay[slot] = delay
+            self.restarts += 1
+            logger.warning(
+                f"Worker {slot} (pid {pid}) exited with status {os.waitstatus_to_exitcode(status)}, "
+                f"restarting{f' in {delay:.1f}s' if delay else ''}"
+            )
+            pending[slot] = time.monotonic() + delay
+        
+        self.stop()
+    
+    def stop(self):
+        """Ask every worker to drain, then kill those that outlive the timeout."""
+        self.stopping = True
+        for pid in self.children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        
+        deadline = time.monotonic() + self.drain_timeout + 1.0
+        while self.children and time.monotonic() < deadline:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                time.sleep(0.05)
+            else:
+                self.children.pop(pid, None)
+        
+        for pid in list(self.children):
+            logger.warning(f"Worker pid {pid} did not drain in time, killing it")
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+            self.children.pop(pid, None)
+
+
+def main():
+    """Pre-fork launcher entry point."""
+    server_config = config.SERVER_CONFIG
+    parser = argparse.ArgumentParser(description='RemindMe! Chatbot pre-fork HTTP server')
+    parser.add_argument('--host', default=server_config['host'], help='Interface to bind')
+    parser.add_argument('--port', type=int, default=server_config['port'], help='Port to bind')
+    parser.add_argument(
+        '--workers', type=int, default=server_config['workers'] or len(available_cpus()),
+        help='Number of worker processes (default: one per CPU)'
+    )
+    parser.add_argument(
+        '--no-pin', action='store_true', default=not server_config['pin_workers'],
+        help='Do not pin workers to CPUs'
+    )
+    args = parser.parse_args()
+    
+    if config.PERFORMANCE_CONFIG['intent_backend'] != 'numpy':
+        # Loading the Keras model starts TensorFlow, which cannot survive a fork
+        print("✗ The pre-fork launcher requires INTENT_BACKEND=numpy")
+        logger.error("Pre-fork launcher refused to start with the Keras intent backend")
+        sys.exit(1)
+    
+    from chatbot.chatbot import Chatbot
+    chatbot = Chatbot()
+    if args.workers > 1:
+        # Any worker can receive a conversation's next message
+        if chatbot.sessions.spill_path:
+            chatbot.sessions.shared = True
+            print(f"✓ Sessions shared between workers through {chatbot.sessions.spill_path}")
+        else:
+            print(
+                "Warning: each worker keeps its own sessions, so multi-turn dialogues break "
+                "without sticky routing; set SESSION_SPILL_PATH to share them"
+            )
+            logger.warning(f"Pre-fork launcher with {args.workers} workers and no shared session store")
+    sock = create_listening_socket(args.host, args.port)
+    print(f"✓ Serving on http://{args.host}:{sock.getsockname()[1]} with {args.workers} workers")
+    
+    pool = WorkerPool(chatbot, sock, args.workers, pin_workers=not args.no_pin)
+    try:
+        pool.run()
+    finally:
+        sock.close()
+    print("Server stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,88 @@ Response generation module.
 """
 
 import random
+import re
+from collections import namedtuple
+import config
 from logger import logger
+from chatbot.dialogue import DialogueState
+from chatbot.utils.cache import normalize_message
+
+# Matches {entity_type} placeholders in response templates
+PLACEHOLDER_PATTERN = re.compile(r'\{(\w+)\}')
+
+# Compiled responses of one intent and the inputs it asks for
+IntentResponses = namedtuple('IntentResponses', ['templates', 'inputs'])
+
+
+class ResponseTemplate:
+    """
+    A response text pre-split into literal chunks and slot names.
+    
+    chunks always has one more element than slots, so rendering
+    interleaves them and joins once. Placeholders that are not slots
+    are kept in the literal chunks as they are.
+    """
+    
+    __slots__ = ('chunks', 'slots')
+    
+    def __init__(self, text, slot_names=()):
+        """
+        Compile a response template.
+        
+        Args:
+            text: Response text with {entity_type} placeholders
+            slot_names: Entity types to substitute when rendering
+        """
+        parts = PLACEHOLDER_PATTERN.split(text)
+        chunks = [parts[0]]
+        slots = []
+        for i in range(1, len(parts), 2):
+            name, literal = parts[i], parts[i + 1]
+            if name in slot_names:
+                slots.append(name)
+                chunks.append(literal)
+            else:
+                chunks[-1] += f'{{{name}}}{literal}'
+        self.chunks = tuple(chunks)
+        self.slots = tuple(slots)
+    
+    @classmethod
+    def from_parts(cls, chunks, slots):
+        """
+        Rebuild a template from its compiled chunks and slots.
+        
+        Args:
+            chunks: Literal chunks, one more than slots
+            slots: Slot names between the chunks
+        
+        Returns:
+            ResponseTemplate instance
+        """
+        template = cls.__new__(cls)
+        template.chunks = tuple(chunks)
+        template.slots = tuple(slots)
+        return template
+    
+    def render(self, values):
+        """
+        Fill the slots from values.
+        
+        Args:
+            values: Dictionary of entity type to value; slots without a
+                value keep their {placeholder}
+        
+        Returns:
+            Rendered response string
+        """
+        if not self.slots:
+            return self.chunks[0]
+        parts = [self.chunks[0]]
+        for slot, literal in zip(self.slots, self.chunks[1:]):
+            value = values.get(slot)
+            parts.append(f'{{{slot}}}' if value is None else str(value))
+            parts.append(literal)
+        return ''.join(parts)
 
 
 class ResponseGenerator:
@@ -16,12 +97,127 @@ class ResponseGenerator:
         Args:
             intents_data: Dictionary containing intents and responses
         """
-        self.intents_data = intents_data
+        self.intents = {}
+        self.entity_slots = {}
+        self.cancel_statements = set(config.CHATBOT_CONFIG['cancel_statements'])
+        for intent in intents_data.get('intents', []):
+            tag = intent.get('tag')
+            if tag in self.intents:
+                continue
+            self.intents[tag] = self._compile_intent(intent)
+            self.entity_slots[tag] = self._collect_entity_slots(intent)
+    
+    @classmethod
+    def from_table(cls, table):
+        """
+        Create a generator from a table written by to_table().
+        
+        Args:
+            table: Dictionary mapping intent tag to its compiled responses
+        
+        Returns:
+            ResponseGenerator instance
+        """
+        generator = cls({'intents': []})
+        for tag, entry in table.items():
+            templates = tuple(
+                None if parts is None else ResponseTemplate.from_parts(*parts)
+                for parts in entry['templates']
+            )
+            generator.intents[tag] = IntentResponses(templates, tuple(tuple(item) for item in entry['inputs']))
+            generator.entity_slots[tag] = set(entry['entity_slots'])
+        return generator
+    
+    def to_table(self):
+        """
+        Export the compiled responses as JSON-serializable data.
+        
+        Returns:
+            Dictionary mapping intent tag to templates (chunks and slots),
+            inputs and entity slots
+        """
+        return {
+            tag: {
+                'templates': [
+                    None if template is None else [list(template.chunks), list(template.slots)]
+                    for template in responses.templates
+                ],
+                'inputs': [list(item) for item in responses.inputs],
+                'entity_slots': sorted(self.entity_slots[tag])
+            }
+            for tag, responses in self.intents.items()
+        }
+    
+    @staticmethod
+    def _compile_intent(intent):
+        """
+        Compile the responses of an intent, dropping its training patterns.
+        
+        Only entity types declared in the intent's 'inputs' are filled in;
+        other placeholders are left in the text.
+        
+        Args:
+            intent: Intent dictionary from intents data
+        
+        Returns:
+            IntentResponses with compiled templates and (type, prompt) inputs
+        """
+        inputs = tuple(
+            (entity.get('type', ''), entity.get('prompt', f'Please provide {entity.get("type", "information")}'))
+            for entity in intent.get('inputs', [])
+        )
+        slot_names = {entity_type for entity_type, _ in inputs}
+        templates = []
+        for response in intent.get('responses', []):
+            text = response if isinstance(response, str) else response.get('text', '')
+            templates.append(ResponseTemplate(text, slot_names) if text else None)
+        return IntentResponses(tuple(templates), inputs)
+    
+    @staticmethod
+    def _collect_entity_slots(intent):
+        """
+        Collect the entity types an intent's responses can consume.
+        
+        Looks at the intent's 'inputs', the entities annotated on its
+        responses and {placeholders} in the response texts. Entities that
+        only appear in training patterns are not used by any response.
+        
+        Args:
+            intent: Intent dictionary from intents data
+        
+        Returns:
+            Set of entity type names
+        """
+        slots = {entity.get('type', '') for entity in intent.get('inputs', [])}
+        for response in intent.get('responses', []):
+            if not isinstance(response, dict):
+                slots.update(PLACEHOLDER_PATTERN.findall(response))
+                continue
+            slots.update(entity.get('type', '') for entity in response.get('entities', []))
+            slots.update(PLACEHOLDER_PATTERN.findall(response.get('text', '')))
+        slots.discard('')
+        return slots
+    
+    def needs_entities(self, tag):
+        """
+        Check whether responses for an intent can use extracted entities.
+        
+        Args:
+            tag: Intent tag
+        
+        Returns:
+            Boolean indicating if NER output is relevant for the intent
+        """
+        return bool(self.entity_slots.get(tag))
     
     def generate(self, intents_list, entities):
         """
         Generate response based on predicted intent and extracted entities.
         
+        Never blocks: when declared inputs are missing, the prompt for the
+        first one is returned. Use respond() to get the dialogue state
+        needed to continue the conversation.
+        
         Args:
             intents_list: List of predicted intents with probabilities
             entities: Dictionary of extracted entities
@@ -29,70 +225,81 @@ class ResponseGenerator:
         Returns:
             Generated response string
         """
+        return self.respond(intents_list, entities)[0]
+    
+    def respond(self, intents_list, entities):
+        """
+        Generate a response, or start slot filling for missing inputs.
+        
+        Args:
+            intents_list: List of predicted intents with probabilities
+            entities: Dictionary of extracted entities
+        
+        Returns:
+            tuple: (response string, DialogueState or None). A state is
+            returned when inputs are missing; the response is then the
+            prompt for the first missing input.
+        """
         # Handle empty intent list with fallback
         if not intents_list or len(intents_list) == 0:
-            return "I'm sorry, I didn't understand that. Could you please rephrase your question?"
-        
-        tag = intents_list[0]['intent']
-        list_of_intents = self.intents_data.get('intents', [])
+            return "I'm sorry, I didn't understand that. Could you please rephrase your question?", None
         
         # Find matching intent
-        matched_intent = None
-        for i in list_of_intents:
-            if i.get('tag') == tag:
-                matched_intent = i
-                break
+        tag = intents_list[0]['intent']
+        matched_intent = self.intents.get(tag)
         
         # Fallback if intent not found
         if not matched_intent:
-            return "I'm sorry, I didn't understand that. Could you please rephrase your question?"
+            return "I'm sorry, I didn't understand that. Could you please rephrase your question?", None
         
         try:
             # Select random response
-            responses = matched_intent.get('responses', [])
-            if not responses:
-                return "I'm sorry, I don't have a response for that."
+            if not matched_intent.templates:
+                return "I'm sorry, I don't have a response for that.", None
             
-            response = random.choice(responses).get('text', '')
-            if not response:
-                return "I'm sorry, I don't have a response for that."
+            template = random.choice(matched_intent.templates)
+            if template is None:
+                return "I'm sorry, I don't have a response for that.", None
             
-            # Handle entity replacement
-            missing_entities = []
-            if 'inputs' in matched_intent:
-                for entity in matched_intent['inputs']:
-                    entity_type = entity.get('type', '')
-                    if entity_type in entities:
-                        response = response.replace(
-                            f'{{{entity_type}}}',
-                            str(entities[entity_type])
-                        )
-                    else:
-                        missing_entities.append(entity)
+            # Ask for missing entities on the following turns
+            missing = [
+                (entity_type, prompt) for entity_type, prompt in matched_intent.inputs
+                if entity_type not in entities
+            ]
+            if missing:
+                state = DialogueState(tag, template, missing, entities)
+                return state.prompt, state
             
-            # Prompt for missing entities
-            if len(missing_entities) > 0:
-                for entity in missing_entities:
-                    prompt = entity.get(
-                        'prompt',
-                        f'Please provide {entity.get("type", "information")}'
-                    )
-                    response += '\n' + prompt
-                    try:
-                        user_input = input(prompt + '\n> ').strip()
-                        if user_input:
-                            entities[entity.get('type', '')] = user_input
-                            response = response.replace(
-                                f'{{{entity.get("type", "")}}}',
-                                user_input
-                            )
-                    except (EOFError, KeyboardInterrupt):
-                        return "Input cancelled. Please try again."
-            
-            return response
+            return template.render(entities), None
         except Exception as e:
             error_msg = f"Error generating response: {e}"
             print(error_msg)
             logger.error(error_msg)
-            return "I'm sorry, I encountered an error processing your request. Please try again."
-
+            return "I'm sorry, I encountered an error processing your request. Please try again.", None
+    
+    def resume(self, state, message):
+        """
+        Continue slot filling with the user's reply.
+        
+        Args:
+            state: DialogueState returned by respond() or resume()
+            message: User reply holding the value of the next missing slot
+        
+        Returns:
+            tuple: (response string, DialogueState or None). The state is
+            None once the response is complete or the user cancelled.
+        """
+        if normalize_message(message) in self.cancel_statements:
+            return "Input cancelled. Please try again.", None
+        
+        state.fill(message)
+        if not state.is_complete:
+            return state.prompt, state
+        
+        try:
+            return state.template.render(state.entities), None
+        except Exception as e:
+            error_msg = f"Error generating response: {e}"
+            print(error_msg)
+            logger.error(error_msg)
+            return "I'm sorry, I encountered an error processing your request. Please try again.", None
@@ -0,0 +1,484 @@
+"""
+Asyncio HTTP server with micro-batched inference.
+
+Run with ``python -m chatbot.server``. Endpoints:
+
+- ``POST /chat`` with ``{"message": "...", "session_id": "..."}`` returns
+  ``{"response": "...", "session_id": "...", "pending_slots": [...]}``.
+  ``session_id`` is optional; without it the message is stateless.
+- ``GET /metrics`` returns batching, stage timing, cache and model statistics.
+- ``GET /health`` returns ``{"status": "ok", "pid": ..., "model_version": ...}``.
+- ``POST /admin/reload`` loads, smoke-tests and swaps in new models and
+  returns the old and new versions (only with SERVER_CONFIG['allow_reload']).
+  SIGHUP triggers the same reload.
+
+Concurrent requests are queued and gathered into micro-batches of at most
+``max_batch_size`` messages, waiting no longer than ``max_wait_ms`` for a
+batch to fill. Each batch is answered with one intent forward pass and one
+``nlp.pipe`` call on a dedicated model thread, so the event loop keeps
+accepting requests while the models run.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+import config
+from logger import logger, log_error
+
+
+class MicroBatcher:
+    """
+    Gathers submitted items into batches for a synchronous batch function.
+    
+    A batch is dispatched as soon as it holds max_batch_size items or its
+    oldest item has waited max_wait seconds. Under bursty load the queue
+    refills while the previous batch runs, so batches fill up without
+    waiting; a lone request only pays max_wait.
+    """
+    
+    def __init__(self, process_batch, max_batch_size, max_wait):
+        """
+        Initialize MicroBatcher.
+        
+        Args:
+            process_batch: Callable taking a list of items and returning a
+                list of results in the same order; runs on a worker thread
+            max_batch_size: Maximum number of items per batch
+            max_wait: Maximum seconds to wait for a batch to fill
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.queue = None
+        self.task = None
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='chatbot-batch')
+        
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.items = 0
+        self.largest_batch = 0
+        self.batch_size_histogram = {}
+        self.total_queue_wait = 0.0
+        self.max_queue_wait = 0.0
+        self.total_process_time = 0.0
+    
+    def start(self):
+        """Start the batching task on the running event loop."""
+        self.queue = asyncio.Queue()
+        self.task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self):
+        """Finish the queued items, then stop the batching task."""
+        if self.task is None:
+            return
+        await self.queue.join()
+        self.task.cancel()
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+        self.task = None
+        self.executor.shutdown(wait=True)
+    
+    async def submit(self, item):
+        """
+        Queue an item and wait for its result.
+        
+        Args:
+            item: Item passed to process_batch
+        
+        Returns:
+            The result process_batch produced for the item
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((item, future, time.perf_counter()))
+        return await future
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = batch[0][2] + self.max_wait
+            while len(batch) < self.max_batch_size:
+                if self.queue.empty():
+                    timeout = deadline - time.perf_counter()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(self.queue.get_nowait())
+            
+            started = time.perf_counter()
+            try:
+                results = await loop.run_in_executor(
+                    self.executor, self.process_batch, [item for item, _, _ in batch]
+                )
+                for (_, future, _), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+            except Exception as e:
+                log_error('BatchProcessingError', f"Error processing batch of {len(batch)}: {e}", e)
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            finally:
+                self._record(batch, started, time.perf_counter())
+                for _ in batch:
+                    self.queue.task_done()
+    
+    def _record(self, batch, started, finished):
+        waits = [started - enqueued for _, _, enqueued in batch]
+        size = len(batch)
+        with self._lock:
+            self.batches += 1
+            self.items += size
+            self.largest_batch = max(self.largest_batch, size)
+            self.batch_size_histogram[size] = self.batch_size_histogram.get(size, 0) + 1
+            self.total_queue_wait += sum(waits)
+            self.max_queue_wait = max(self.max_queue_wait, max(waits))
+            self.total_process_time += finished - started
+    
+    def stats(self):
+        """
+        Get batching statistics.
+        
+        Returns:
+            Dictionary with batch counts, batch size and queue wait figures
+        """
+        with self._lock:
+            return {
+                'batches': self.batches,
+                'messages': self.items,
+                'queue_depth': self.queue.qsize() if self.queue is not None else 0,
+                'mean_batch_size': self.items / self.batches if self.batches else 0.0,
+                'max_batch_size': self.largest_batch,
+                'batch_size_histogram': dict(sorted(self.batch_size_histogram.items())),
+                'mean_queue_wait_ms': self.total_queue_wait / self.items * 1000 if self.items else 0.0,
+                'max_queue_wait_ms': self.max_queue_wait * 1000,
+                'mean_batch_time_ms': self.total_process_time / self.batches * 1000 if self.batches else 0.0
+            }
+
+
+class ChatServer:
+    """Minimal HTTP/1.1 JSON front end that feeds a MicroBatcher."""
+    
+    def __init__(self, chatbot, max_batch_size=None, max_wait_ms=None, max_body_bytes=None, allow_reload=None):
+        """
+        Initialize ChatServer.
+        
+        Args:
+            chatbot: Object providing process_batch(messages, sessions),
+                a SessionStore as sessions, timing_stats(), cache_stats(),
+                model_info() and reload() (normally a Chatbot)
+            max_batch_size: Messages per micro-batch (from config if None)
+            max_wait_ms: Batch fill timeout in milliseconds (from config if None)
+            max_body_bytes: Largest accepted request body (from config if None)
+            allow_reload: Whether to serve POST /admin/reload (from config if None)
+        """
+        server_config = config.SERVER_CONFIG
+        self.chatbot = chatbot
+        self.max_body_bytes = max_body_bytes or server_config['max_body_bytes']
+        self.batcher = MicroBatcher(
+            self._process_batch,
+            max_batch_size or server_config['max_batch_size'],
+            (server_config['max_wait_ms'] if max_wait_ms is None else max_wait_ms) / 1000
+        )
+        self.allow_reload = server_config['allow_reload'] if allow_reload is None else allow_reload
+        self.server = None
+        self.draining = False
+        self._reload_task = None
+        self._connections = set()
+        self._idle = set()
+    
+    def _process_batch(self, items):
+        # Runs in the executor: a shared session store reads and writes
+        # SQLite here, so sessions are looked up with the batch, off the loop
+        messages = [message for message, _ in items]
+        sessions = [
+            self.chatbot.sessions.get(session_id) if session_id is not None else None
+            for _, session_id in items
+        ]
+        responses = self.chatbot.process_batch(messages, sessions)
+        return [
+            (response, session.dialogue.missing_slots if session is not None and session.dialogue else [])
+            for response, session in zip(responses, sessions)
+        ]
+    
+    async def start(self, host=None, port=None, sock=None):
+        """
+        Start listening and batching.
+        
+        Args:
+            host: Interface to bind (from config if None)
+            port: Port to bind, 0 for any free port (from config if None)
+            sock: Already bound listening socket to serve instead of host/port
+        """
+        self.batcher.start()
+        if sock is not None:
+            self.server = await asyncio.start_server(self._handle_connection, sock=sock)
+        else:
+            self.server = await asyncio.start_server(
+                self._handle_connection,
+                host or config.SERVER_CONFIG['host'],
+                config.SERVER_CONFIG['port'] if port is None else port
+            )
+    
+    @property
+    def port(self):
+        """Port the server is listening on."""
+        return self.server.sockets[0].getsockname()[1]
+    
+    async def stop(self, timeout=None):
+        """
+        Drain the server: stop accepting connections, close idle keep-alive
+        connections and let in-flight requests finish.
+        
+        Args:
+            timeout: Seconds to wait for in-flight requests (from config if None)
+        """
+        self.draining = True
+        if self.server is not None:
+            self.server.close()
+        for writer in list(self._idle):
+            writer.close()
+        
+        deadline = time.monotonic() + (config.SERVER_CONFIG['drain_timeout'] if timeout is None else timeout)
+        while self._connections and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        if self._connections:
+            logger.warning(f"Drain timed out with {len(self._connections)} open connections")
+        
+        await self.batcher.stop()
+        if self.server is not None:
+            await self.server.wait_closed()
+    
+    def metrics(self):
+        """
+        Get server metrics.
+        
+        Returns:
+            Dictionary with batching, stage timing, cache and model statistics
+        """
+        return {
+            'models': self.chatbot.model_info(),
+            'batching': self.batcher.stats(),
+            'sessions': self.chatbot.sessions.stats(),
+            'timings': self.chatbot.timing_stats(),
+            'caches': self.chatbot.cache_stats()
+        }
+    
+    async def reload(self):
+        """
+        Reload the models off the event loop while requests keep being served.
+        
+        Concurrent calls share one reload.
+        
+        Returns:
+            Result of chatbot.reload()
+        
+        Raises:
+            ReloadError: If the new models are rejected
+        """
+        if self._reload_task is None or self._reload_task.done():
+            self._reload_task = asyncio.ensure_future(asyncio.to_thread(self.chatbot.reload))
+        return await asyncio.shield(self._reload_task)
+    
+    async def _handle_connection(self, reader, writer):
+        self._connections.add(writer)
+        try:
+            while not self.draining:
+                request = await self._read_request(reader, writer)
+                if request is None:
+                    break
+                method, path, body, keep_alive = request
+                status, payload = await self._dispatch(method, path, body)
+                keep_alive = keep_alive and not self.draining
+                await self._write_response(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except _BadRequest as e:
+            await self._write_response(writer, e.status, {'error': e.message}, False)
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+    
+    async def _read_request(self, reader, writer):
+        # Connections waiting for their next request can be closed on drain
+        self._idle.add(writer)
+        try:
+            request_line = await reader.readline()
+        finally:
+            self._idle.discard(writer)
+        if not request_line.strip():
+            return None
+        try:
+            method, path, version = request_line.decode('latin-1').split()
+        except ValueError:
+            raise _BadRequest(HTTPStatus.BAD_REQUEST, 'Malformed request line')
+        
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            raise _BadRequest(HTTPStatus.BAD_REQUEST, 'Invalid Content-Length')
+        if length > self.max_body_bytes:
+            raise _BadRequest(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, 'Request body too large')
+        body = await reader.readexactly(length) if length else b''
+        
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+        return method.upper(), path.split('?', 1)[0], body, keep_alive
+    
+    async def _dispatch(self, method, path, body):
+        if path == '/chat':
+            if method != 'POST':
+                return HTTPStatus.METHOD_NOT_ALLOWED, {'error': 'Use POST'}
+            return await self._chat(body)
+        if path == '/metrics' and method == 'GET':
+            return HTTPStatus.OK, self.metrics()
+        if path == '/health' and method == 'GET':
+            return HTTPStatus.OK, {
+                'status': 'ok', 'pid': os.getpid(), 'model_version': self.chatbot.model_info()['version']
+            }
+        if path == '/admin/reload' and self.allow_reload:
+            if method != 'POST':
+                return HTTPStatus.METHOD_NOT_ALLOWED, {'error': 'Use POST'}
+            return await self._reload()
+        return HTTPStatus.NOT_FOUND, {'error': f'No route for {method} {path}'}
+    
+    async def _chat(self, body):
+        try:
+            data = json.loads(body or b'{}')
+        except ValueError:
+            return HTTPStatus.BAD_REQUEST, {'error': 'Body must be JSON'}
+        if not isinstance(data, dict):
+            return HTTPStatus.BAD_REQUEST, {'error': 'Body must be a JSON object'}
+        message = data.get('message')
+        if not isinstance(message, str):
+            return HTTPStatus.BAD_REQUEST, {'error': "'message' must be a string"}
+        
+        session_id = data.get('session_id')
+        if session_id is not None:
+            session_id = str(session_id)
+        
+        try:
+            response, pending = await self.batcher.submit((message, session_id))
+        except Exception:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {'error': 'Error processing message'}
+        
+        return HTTPStatus.OK, {'response': response, 'session_id': session_id, 'pending_slots': pending}
+    
+    async def _reload(self):
+        # Imported here so the server module does not load the model stack
+        from chatbot.model_set import ReloadError
+        
+        try:
+            return HTTPStatus.OK, await self.reload()
+        except ReloadError as e:
+            return HTTPStatus.CONFLICT, {'error': str(e), 'version': self.chatbot.model_info()['version']}
+    
+    @staticmethod
+    async def _write_response(writer, status, payload, keep_alive):
+        body = json.dumps(payload).encode('utf-8')
+        head = (
+            f'HTTP/1.1 {status.value} {status.phrase}\r\n'
+            f'Content-Type: application/json\r\n'
+            f'Content-Length: {len(body)}\r\n'
+            f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'
+        )
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+
+class _BadRequest(Exception):
+    """Request that cannot be parsed; answered and the connection closed."""
+    
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+async def _reload_on_signal(server):
+    try:
+        result = await server.reload()
+        print(f"✓ Reloaded models: {result['previous_version']} -> {result['version']}")
+    except Exception as e:
+        # The chatbot has logged the error; the current models keep serving
+        print(f"✗ Model reload failed, still serving {server.chatbot.model_info()['version']}: {e}")
+
+
+async def serve(chatbot, host, port, max_batch_size, max_wait_ms):
+    """
+    Serve chatbot until cancelled.
+    
+    Args:
+        chatbot: Chatbot instance
+        host: Interface to bind
+        port: Port to bind
+        max_batch_size: Messages per micro-batch
+        max_wait_ms: Batch fill timeout in milliseconds
+    """
+    server = ChatServer(chatbot, max_batch_size, max_wait_ms)
+    await server.start(host, port)
+    print(f"✓ Serving on http://{host}:{server.port} "
+          f"(max batch {server.batcher.max_batch_size}, max wait {max_wait_ms} ms)")
+    logger.info(f"Chat server listening on {host}:{server.port}")
+    if hasattr(signal, 'SIGHUP'):
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGHUP, lambda: asyncio.ensure_future(_reload_on_signal(server))
+        )
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main():
+    """Server entry point."""
+    server_config = config.SERVER_CONFIG
+    parser = argparse.ArgumentParser(description='RemindMe! Chatbot HTTP server')
+    parser.add_argument('--host', default=server_config['host'], help='Interface to bind')
+    parser.add_argument('--port', type=int, default=server_config['port'], help='Port to bind')
+    parser.add_argument(
+        '--max-batch-size', type=int, default=server_config['max_batch_size'],
+        help='Maximum messages per micro-batch'
+    )
+    parser.add_argument(
+        '--max-wait-ms', type=float, default=server_config['max_wait_ms'],
+        help='Maximum time a message waits for its batch to fill'
+    )
+    args = parser.parse_args()
+    
+    from chatbot.chatbot import Chatbot
+    chatbot = Chatbot()
+    try:
+        asyncio.run(serve(chatbot, args.host, args.port, args.max_batch_size, args.max_wait_ms))
+    except KeyboardInterrupt:
+        print('\nServer stopped')
+    finally:
+        chatbot.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""
+Sharded in-memory session store with TTL, capacity eviction and an
+optional SQLite spill file.
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+import config
+from logger import log_error
+from chatbot.dialogue import Session
+
+
+class _Shard:
+    """One lock and one access-ordered table of sessions."""
+    
+    __slots__ = ('lock', 'sessions')
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sessions = OrderedDict()
+
+
+class SessionStore:
+    """
+    Keeps conversation state for many concurrent sessions.
+    
+    Session ids are hashed onto independent shards, each with its own lock,
+    so concurrent requests for different sessions rarely contend. Within a
+    shard sessions are kept in access order: sessions idle for longer than
+    the TTL are dropped from the front, and when a shard is over its share
+    of max_sessions the least recently used session is evicted. With a
+    spill path, evicted sessions that still hold state (a pending dialogue
+    or a last intent) are written to SQLite and loaded back on their next
+    access instead of being lost.
+    
+    A shared store treats the spill file as the source of truth, so that
+    several processes (the pre-fork workers) see one set of sessions:
+    get() reads the session from the file and save() writes it back after
+    every update. The in-memory tables then only hold sessions in use, and
+evicting one never writes it back.
+    """
+    
+    def __init__(self, shards=None, ttl=None, max_sessions=None, spill_path=None, shared=None):
+        """
+        Initialize SessionStore.
+        
+        Args:
+            shards: Number of shards (from config if None)
+            ttl: Seconds of inactivity after which a session expires (from config if None)
+            max_sessions: Sessions kept in memory across all shards (from config if None)
+            spill_path: SQLite file for evicted sessions, None to drop them
+                (from config if None; pass '' to disable)
+            shared: Whether the spill file is shared with other processes
+                (from config if None)
+        
+        Raises:
+            ValueError: If shared is set without a spill path
+        """
+        session_config = config.SESSION_CONFIG
+        shards = shards or session_config['shards']
+        self.ttl = session_config['ttl_seconds'] if ttl is None else ttl
+        max_sessions = max_sessions or session_config['max_sessions']
+        self.shard_capacity = max(1, max_sessions // shards)
+        self.shards = [_Shard() for _ in range(shards)]
+        self.spill_path = session_config['spill_path'] if spill_path is None else spill_path
+        self.shared = session_config['shared'] if shared is None else shared
+        if self.shared and not self.spill_path:
+            raise ValueError("A shared session store needs a spill path")
+        
+        self._db = None
+        self._db_pid = None
+        self._db_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._counters = dict.fromkeys(
+            ('hits', 'misses', 'created', 'expired', 'evicted', 'spilled', 'loaded'), 0
+        )
+    
+    def _shard(self, session_id):
+        return self.shards[hash(session_id) % len(self.shards)]
+    
+    def _count(self, name, amount=1):
+        with self._stats_lock:
+            self._counters[name] += amount
+    
+    def get(self, session_id, create=True):
+        """
+        Get the session for an id, refreshing its last access time.
+        
+        Args:
+            session_id: Conversation identifier
+            create: Whether to create a new session if none is stored
+        
+        Returns:
+            Session, or None if not found and create is False
+        """
+        now = time.time()
+        shard = self._shard(session_id)
+        if self.shared:
+            return self._get_shared(shard, session_id, create, now)
+        with shard.lock:
+            session = shard.sessions.get(session_id)
+            if session is not None and now - session.last_seen <= self.ttl:
+                shard.sessions.move_to_end(session_id)
+                session.last_seen = now
+                self._count('hits')
+                return session
+        
+        # Not in memory (or expired): try the spill file, then create
+        if session is not None:
+            self._count('expired')
+        session = self._load_spilled(session_id, now)
+        if session is None:
+            self._count('misses')
+            if not create:
+                return None
+            session = Session(session_id)
+            self._count('created')
+        session.last_seen = now
+        return self._insert(shard, session, now)
+    
+    def _get_shared(self, shard, session_id, create, now):
+        # Another process may have changed the session since this one last
+        # saw it, so the in-memory copy is never used
+        session = self._load_spilled(session_id, now, delete=False)
+        if session is None:
+            self._count('misses')
+            if not create:
+                return None
+            session = Session(session_id)
+            self._count('created')
+        session.last_seen = now
+        return self._insert(shard, session, now, replace=True)
+    
+    def put(self, session):
+        """
+        Store a session, replacing any with the same id.
+        
+        Args:
+            session: Session with a session_id
+        """
+        now = time.time()
+        session.last_seen = now
+        self._insert(self._shard(session.session_id), session, now, replace=True)
+        self.save(session)
+    
+    def save(self, session):
+        """
+        Write an updated session through to the spill file of a shared store.
+        
+        Sessions without state are removed from the file instead. Does
+        nothing unless the store is shared.
+        
+        Args:
+            session: Session with a session_id
+        """
+        if not self.shared or session.session_id is None:
+            return
+        session_id = str(session.session_id)
+        try:
+            with self._db_lock:
+                db = self._connection()
+                if session.dialogue is not None or session.last_intent is not None:
+                    db.execute(
+                        'REPLACE INTO sessions VALUES (?, ?, ?)',
+                        (session_id, session.last_seen, pickle.dumps(session, pickle.HIGHEST_PROTOCOL))
+                    )
+                else:
+                    db.execute('DELETE FROM sessions WHERE session_id = ?', (session_id,))
+        except sqlite3.Error as e:
+            log_error('SessionSpillError', f"Could not save session {session_id}: {e}", e)
+    
+    def _insert(self, shard, session, now, replace=False):
+        evicted = []
+        with shard.lock:
+            existing = shard.sessions.get(session.session_id)
+            if existing is not None and not replace and now - existing.last_seen <= self.ttl:
+                # Another thread stored it first
+                shard.sessions.move_to_end(session.session_id)
+                return existing
+            shard.sessions[session.session_id] = session
+            shard.sessions.move_to_end(session.session_id)
+            expired = self._expire_shard(shard, now)
+            while len(shard.sessions) > self.shard_capacity:
+                evicted.append(shard.sessions.popitem(last=False)[1])
+        if expired:
+            self._count('expired', expired)
+        if evicted:
+            self._count('evicted', len(evicted))
+            # A shared store wrote them through in save(), and another process
+            # may have saved newer state since, so they are only dropped
+            if not self.shared:
+                self._spill(evicted)
+        return session
+    
+    def _expire_shard(self, shard, now):
+        # Sessions are in access order, so expired ones are at the front
+        expired = 0
+        cutoff = now - self.ttl
+        while shard.sessions:
+            oldest = next(iter(shard.sessions.values()))
+            if oldest.last_seen >= cutoff:
+                break
+            shard.sessions.popitem(last=False)
+            expired += 1
+        return expired
+    
+    def delete(self, session_id):
+        """
+        Remove a session from memory and the spill file.
+        
+        Args:
+            session_id: Conversation identifier
+        """
+        shard = self._shard(session_id)
+        with shard.lock:
+            shard.sessions.pop(session_id, None)
+        if self.spill_path:
+            with self._db_lock:
+                self._connection().execute('DELETE FROM sessions WHERE session_id = ?', (session_id,))
+    
+    def expire(self):
+        """
+        Drop every expired session, in memory and in the spill file.
+        
+        Returns:
+            Number of sessions dropped from memory
+        """
+        now = time.time()
+        expired = 0
+        for shard in self.shards:
+            with shard.lock:
+                expired += self._expire_shard(shard, now)
+        if expired:
+            self._count('expired', expired)
+        if self.spill_path:
+            with self._db_lock:
+                self._connection().execute('DELETE FROM sessions WHERE last_seen < ?', (now - self.ttl,))
+        return expired
+    
+    def _connection(self):
+        # One connection per process: a forked worker must not reuse its parent's
+        if self._db is None or self._db_pid != os.getpid():
+            self._db = sqlite3.connect(self.spill_path, check_same_thread=False, isolation_level=None)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS sessions '
+                '(session_id TEXT PRIMARY KEY, last_seen REAL, data BLOB)'
+            )
+            self._db_pid = os.getpid()
+        return self._db
+    
+    def _spill(self, sessions):
+        keep = [
+            session for session in sessions
+            if session.dialogue is not None or session.last_intent is not None
+        ]
+        if not self.spill_path or not keep:
+            return
+        rows = [
+            (str(session.session_id), session.last_seen, pickle.dumps(session, pickle.HIGHEST_PROTOCOL))
+            for session in keep
+        ]
+        try:
+            with self._db_lock:
+                self._connection().executemany('REPLACE INTO sessions VALUES (?, ?, ?)', rows)
+            self._count('spilled', len(rows))
+        except sqlite3.Error as e:
+            log_error('SessionSpillError', f"Could not spill {len(rows)} sessions: {e}", e)
+    
+    def _load_spilled(self, session_id, now, delete=True):
+        if not self.spill_path:
+            return None
+        try:
+            with self._db_lock:
+                db = self._connection()
+                row = db.execute(
+                    'SELECT last_seen, data FROM sessions WHERE session_id = ?', (str(session_id),)
+                ).fetchone()
+                if row is None:
+                    return None
+                if delete:
+                    db.execute('DELETE FROM sessions WHERE session_id = ?', (str(session_id),))
+        except sqlite3.Error as e:
+            log_error('SessionSpillError', f"Could not load session {session_id}: {e}", e)
+            return None
+        if now - row[0] > self.ttl:
+            self._count('expired')
+            return None
+        self._count('loaded')
+        return pickle.loads(row[1])
+    
+    def __len__(self):
+        return sum(len(shard.sessions) for shard in self.shards)
+    
+    def stats(self):
+        """
+        Get session store statistics.
+        
+        Returns:
+            Dictionary with in-memory and spilled session counts and the
+            hit, miss, creation, expiry, eviction, spill and load counters
+        """
+        spilled_now = 0
+        if self.spill_path and self._db is not None:
+            with self._db_lock:
+                spilled_now = self._connection().execute('SELECT COUNT(*) FROM sessions').fetchone()[0]
+        with self._stats_lock:
+            counters = dict(self._counters)
+        return {
+            'sessions': len(self),
+            'capacity': self.shard_capacity * len(self.shards),
+            'shards': len(self.shards),
+            'on_disk': spilled_now,
+            **counters
+        }
+    
+    def close(self):
+        """Close the spill file."""
+        with self._db_lock:
+            if self._db is not None and self._db_pid == os.getpid():
+                self._db.close()
+            self._db = None
@@ -3,14 +3,18 @@ Utility functions for the chatbot package.
 """
 
 from chatbot.utils.preprocessor import Preprocessor
+from chatbot.utils.cache import LRUCache, normalize_message
 from chatbot.utils.datetime_parser import (
-    parse_date, parse_time, parse_datetime,
+    parse_date, parse_time, parse_datetime, parse_datetime_bulk,
     validate_datetime, format_datetime, extract_datetime_from_text
 )
+from chatbot.utils.recurrence import RecurrenceRule, parse_recurrence
 
 __all__ = [
     'Preprocessor',
-    'parse_date', 'parse_time', 'parse_datetime',
-    'validate_datetime', 'format_datetime', 'extract_datetime_from_text'
+    'LRUCache', 'normalize_message',
+    'parse_date', 'parse_time', 'parse_datetime', 'parse_datetime_bulk',
+    'validate_datetime', 'format_datetime', 'extract_datetime_from_text',
+    'RecurrenceRule', 'parse_recurrence'
 ]
 
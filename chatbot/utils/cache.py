@@ -0,0 +1,108 @@
+"""
+Bounded LRU cache used for preprocessing and prediction results.
+"""
+
+import threading
+from collections import OrderedDict
+
+
+def normalize_message(message):
+    """
+    Normalize a message for use as a cache key.
+    
+    Lowercases and collapses whitespace, which does not change the
+    tokens seen by the intent classifier.
+    
+    Args:
+        message: Input message string
+    
+    Returns:
+        Normalized message string
+    """
+    return ' '.join(message.lower().split())
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache with hit/miss/eviction counters."""
+    
+    def __init__(self, maxsize):
+        """
+        Initialize LRUCache.
+        
+        Args:
+            maxsize: Maximum number of entries (0 disables caching)
+        """
+        self.maxsize = max(0, int(maxsize))
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key, default=None):
+        """
+        Look up a key and mark it as most recently used.
+        
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+        
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def put(self, key, value):
+        """
+        Store a value, evicting the least recently used entry when full.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self):
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self):
+        return len(self._data)
+    
+    def __contains__(self, key):
+        return key in self._data
+    
+    def stats(self):
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with hits, misses, evictions, size, maxsize and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
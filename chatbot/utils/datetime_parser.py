@@ -1,24 +1,283 @@
 """
 Date and time parsing utilities for RemindMe! Chatbot
-Uses python-dateutil for robust date/time parsing
+Resolves common forms directly and uses python-dateutil as a fallback
 """
 
+from collections import namedtuple
 from datetime import datetime, timedelta
 from dateutil import parser as date_parser
 from dateutil.relativedelta import relativedelta
 import re
+import threading
+import time
+from zoneinfo import ZoneInfo
+import numpy as np
 import config
+from chatbot.utils.cache import LRUCache
 from logger import setup_logger
 
 logger = setup_logger('datetime_parser')
 
-def parse_date(date_string):
+MONTHS = {
+    'jan': 1, 'january': 1, 'feb': 2, 'february': 2, 'mar': 3, 'march': 3,
+    'apr': 4, 'april': 4, 'may': 5, 'jun': 6, 'june': 6, 'jul': 7, 'july': 7,
+    'aug': 8, 'august': 8, 'sep': 9, 'sept': 9, 'september': 9,
+    'oct': 10, 'october': 10, 'nov': 11, 'november': 11, 'dec': 12, 'december': 12
+}
+
+# Short forms that are also common words ('sun', 'sat', 'wed') are left out
+WEEKDAYS = {
+    'monday': 0, 'tuesday': 1, 'tues': 1, 'wednesday': 2, 'thursday': 3, 'thurs': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6
+}
+
+RELATIVE_DATES = {
+    'today': timedelta(0),
+    'tomorrow': timedelta(days=1),
+    'yesterday': timedelta(days=-1),
+    'next week': timedelta(weeks=1),
+    'last week': timedelta(weeks=-1),
+    'next month': relativedelta(months=1),
+    'last month': relativedelta(months=-1),
+    'next year': relativedelta(years=1),
+    'last year': relativedelta(years=-1)
+}
+
+def _alternation(words):
+    # Longest first, so 'september' wins over 'sep'
+    return '|'.join(sorted(words, key=len, reverse=True))
+
+_ORDINAL = r'(?:st|nd|rd|th)?'
+_MERIDIEM = r'[ap]\.?m\.?'
+
+# Every date and time form in one pattern, so a text is scanned once. At
+# each word start the first character selects the digit-led or the
+# letter-led forms; within each, longer and more specific forms come first.
+_SCANNER = re.compile(rf'''
+    (?<!\w)(?:
+        (?=\d)(?:
+            (?P<iso>(?P<iso_year>\d{{4}})-(?P<iso_month>\d{{1,2}})-(?P<iso_day>\d{{1,2}}))
+          | (?P<numeric>(?P<num_first>\d{{1,2}})[/-](?P<num_second>\d{{1,2}})[/-](?P<num_year>\d{{4}}|\d{{2}}))
+          | (?P<day_month>(?P<dm_day>\d{{1,2}}){_ORDINAL}\s+(?:of\s+)?(?P<dm_month>{_alternation(MONTHS)})\.?
+                (?:,?\s+(?P<dm_year>\d{{4}}))?)
+          | (?P<clock>(?P<clock_hour>\d{{1,2}}):(?P<clock_minute>\d{{2}})(?:\s*(?P<clock_meridiem>{_MERIDIEM}))?)
+          | (?P<hour>(?P<hour_value>\d{{1,2}})\s*(?P<hour_meridiem>{_MERIDIEM}))
+        )
+      | (?=[a-z])(?:
+            (?P<relative>today|tomorrow|yesterday|(?:next|last)\s+(?:week|month|year))
+          | (?P<weekday>(?:(?P<weekday_prefix>next|this|on)\s+)?(?P<weekday_name>{_alternation(WEEKDAYS)})\.?)
+          | (?P<month_day>(?P<md_month>{_alternation(MONTHS)})\.?\s+(?P<md_day>\d{{1,2}}){_ORDINAL}
+                (?:,?\s+(?P<md_year>\d{{4}}))?)
+          | (?P<named_time>noon|midnight)
+        )
+    )(?!\w)
+''', re.IGNORECASE | re.VERBOSE)
+
+_DATE_KINDS = ('iso', 'numeric', 'relative', 'weekday', 'month_day', 'day_month')
+_TIME_KINDS = ('clock', 'hour', 'named_time')
+_TIME_PREFIX = re.compile(r'^(?:at\s+|@\s*)')
+
+# A date or time found in text: kind is 'date' (value is a datetime at
+# midnight) or 'time' (value is an (hour, minute) tuple)
+DateTimeSpan = namedtuple('DateTimeSpan', ['kind', 'start', 'end', 'text', 'value'])
+
+# Parse results for repeated strings; dates are keyed on the day they were
+# resolved against, times do not depend on the day
+_date_cache = LRUCache(config.DATETIME_CONFIG['parse_cache_size'])
+_time_cache = LRUCache(config.DATETIME_CONFIG['parse_cache_size'])
+_MISSING = object()
+
+# The current day in the configured timezone: start and end are Unix
+# timestamps bounding it, today is its (naive) midnight and table maps
+# every relative keyword and weekday phrase to its date on that day
+DayState = namedtuple('DayState', ['timezone', 'start', 'end', 'today', 'table'])
+
+def _day_table(today):
+    """Resolve every relative keyword and weekday phrase against today."""
+    table = {keyword: today + offset for keyword, offset in RELATIVE_DATES.items()}
+    for name, weekday in WEEKDAYS.items():
+        days_ahead = (weekday - today.weekday()) % 7
+        for prefix in ('', 'on ', 'this '):
+            table[prefix + name] = today + timedelta(days=days_ahead)
+        table['next ' + name] = today + timedelta(days=days_ahead or 7)
+    return table
+
+class DayAnchor:
+    """
+    Today's date, recomputed only when the day (or the timezone) changes.
+    
+    Checking the current time against the day's bounds is far cheaper
+    than building today's midnight with datetime.now() on every call.
+    """
+    
+    def __init__(self):
+        """Initialize DayAnchor."""
+        self._state = None
+        self._lock = threading.Lock()
+        self.rollovers = 0
+    
+    def current(self, now=None):
+        """
+        Get the state of the current day.
+        
+        Args:
+            now: Unix timestamp to use instead of the current time
+        
+        Returns:
+            DayState for the day containing now
+        """
+        if now is None:
+            now = time.time()
+        state = self._state
+        timezone = config.DATETIME_CONFIG['default_timezone']
+        if state is None or not state.start <= now < state.end or state.timezone != timezone:
+            with self._lock:
+                state = self._state
+                if state is None or not state.start <= now < state.end or state.timezone != timezone:
+                    state = self._state = self._roll(now, timezone)
+        return state
+    
+    def _roll(self, now, timezone):
+        tzinfo = ZoneInfo(timezone) if timezone else None
+        day = datetime.fromtimestamp(now, tzinfo).date()
+        next_day = day + timedelta(days=1)
+        # Naive datetimes are local time; midnight may be skipped or repeated
+        # by a DST change, which timestamp() resolves like the clock does
+        start = datetime(day.year, day.month, day.day, tzinfo=tzinfo).timestamp()
+        end = datetime(next_day.year, next_day.month, next_day.day, tzinfo=tzinfo).timestamp()
+        today = datetime(day.year, day.month, day.day)
+        self.rollovers += 1
+        _date_cache.clear()
+        return DayState(timezone, start, end, today, _day_table(today))
+
+_day_anchor = DayAnchor()
+
+def midnight_today():
+    """
+    Get the start of the current day in the configured timezone.
+    
+    Returns:
+        Naive datetime at midnight today
+    """
+    return _day_anchor.current().today
+
+def parse_cache_stats():
+    """
+    Get statistics of the parse_date and parse_time caches.
+    
+    Returns:
+        Dictionary with 'date' and 'time' cache statistics
+    """
+    return {'date': _date_cache.stats(), 'time': _time_cache.stats()}
+
+def clear_parse_caches():
+    """Drop every cached parse_date and parse_time result."""
+    _date_cache.clear()
+    _time_cache.clear()
+
+def _full_year(year, today):
+    # Two-digit years resolve to within 50 years of today, like dateutil
+    if year >= 100:
+        return year
+    year += today.year // 100 * 100
+    if year > today.year + 50:
+        year -= 100
+    elif year < today.year - 50:
+        year += 100
+    return year
+
+def _resolve_date(match, today):
+    """Resolve a scanner match of a date kind, or None if it is not a valid date."""
+    group = match.group
+    kind = match.lastgroup
+    try:
+        if kind == 'relative':
+            return today + RELATIVE_DATES[' '.join(group('relative').lower().split())]
+        if kind == 'weekday':
+            days_ahead = (WEEKDAYS[group('weekday_name').lower()] - today.weekday()) % 7
+            prefix = (group('weekday_prefix') or '').lower()
+            if prefix == 'next' and days_ahead == 0:
+                days_ahead = 7
+            return today + timedelta(days=days_ahead)
+        if kind == 'month_day':
+            year = int(group('md_year')) if group('md_year') else today.year
+            return datetime(year, MONTHS[group('md_month').lower()], int(group('md_day')))
+        if kind == 'day_month':
+            year = int(group('dm_year')) if group('dm_year') else today.year
+            return datetime(year, MONTHS[group('dm_month').lower()], int(group('dm_day')))
+        if kind == 'iso':
+            return datetime(int(group('iso_year')), int(group('iso_month')), int(group('iso_day')))
+        if kind == 'numeric':
+            # Month first, unless only day first is possible (as dateutil does)
+            month, day = int(group('num_first')), int(group('num_second'))
+            if month > 12 >= day:
+                month, day = day, month
+            return datetime(_full_year(int(group('num_year')), today), month, day)
+    except ValueError:
+        return None
+    return None
+
+def _resolve_time(match):
+    """Resolve a scanner match of a time kind, or None if it is not a valid time."""
+    group = match.group
+    kind = match.lastgroup
+    if kind == 'named_time':
+        return (12, 0) if group('named_time').lower() == 'noon' else (0, 0)
+    if kind == 'clock':
+        hour, minute, meridiem = int(group('clock_hour')), int(group('clock_minute')), group('clock_meridiem')
+    else:
+        hour, minute, meridiem = int(group('hour_value')), 0, group('hour_meridiem')
+    if minute > 59:
+        return None
+    if meridiem:
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if meridiem[0].lower() == 'p' else 0)
+    elif hour > 23:
+        return None
+    return (hour, minute)
+
+def find_datetime_spans(text, today=None):
+    """
+    Find every date and time in a text in one pass.
+    
+    Weekday names, month-day and day-month forms, numeric and ISO dates,
+    relative keywords, clock times ("15:30", "9:00 am"), hours with am/pm
+    ("3pm") and "noon"/"midnight" are recognized and resolved without
+    dateutil. Matches that are not valid dates or times are skipped.
+    
+    Args:
+        text: Natural language text
+        today: Date relative forms are resolved against (midnight today if None)
+    
+    Returns:
+        List of DateTimeSpan in text order
+    """
+    if not text:
+        return []
+    today = today or midnight_today()
+    spans = []
+    for match in _SCANNER.finditer(text):
+        if match.lastgroup in _DATE_KINDS:
+            kind, value = 'date', _resolve_date(match, today)
+        else:
+            kind, value = 'time', _resolve_time(match)
+        if value is not None:
+            spans.append(DateTimeSpan(kind, match.start(), match.end(), match.group(0), value))
+    return spans
+
+def parse_date(date_string, today=None):
     """
     Parse a date string into a datetime object.
     Handles relative dates like 'today', 'tomorrow', 'next week', etc.
     
+    Relative keywords and weekday names are looked up in a table built
+    once per day, and other results are cached per day, so repeated
+    strings are not parsed again until midnight.
+    
     Args:
         date_string: String containing date information
+        today: Date relative forms are resolved against (midnight today if None)
     
     Returns:
         datetime object or None if parsing fails
@@ -26,28 +285,32 @@ def parse_date(date_string):
     if not date_string or not date_string.strip():
         return None
     
-    date_string = date_string.strip().lower()
-    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    
-    # Handle relative date keywords
-    relative_keywords = config.DATETIME_CONFIG['relative_date_keywords']
-    
-    if date_string == 'today':
-        return today
-    elif date_string == 'tomorrow':
-        return today + timedelta(days=1)
-    elif date_string == 'yesterday':
-        return today - timedelta(days=1)
-    elif 'next week' in date_string:
-        return today + timedelta(weeks=1)
-    elif 'next month' in date_string:
-        return today + relativedelta(months=1)
-    elif 'next year' in date_string:
-        return today + relativedelta(years=1)
-    elif 'last week' in date_string:
-        return today - timedelta(weeks=1)
-    elif 'last month' in date_string:
-        return today - relativedelta(months=1)
+    date_string = ' '.join(date_string.lower().split())
+    if today is not None:
+        return _parse_date(date_string, today)
+    
+    day = _day_anchor.current()
+    resolved = day.table.get(date_string)
+    if resolved is not None:
+        return resolved
+    key = (day.timezone, day.start, date_string)
+    resolved = _date_cache.get(key, _MISSING)
+    if resolved is _MISSING:
+        resolved = _parse_date(date_string, day.today)
+        _date_cache.put(key, resolved)
+    return resolved
+
+def _parse_date(date_string, today):
+    """Parse a normalized date string against today (see parse_date)."""
+    # Known forms are resolved directly
+    match = _SCANNER.fullmatch(date_string)
+    if match is not None and match.lastgroup in _DATE_KINDS:
+        resolved = _resolve_date(match, today)
+        if resolved is not None:
+            return resolved
+    for keyword, offset in RELATIVE_DATES.items():
+        if ' ' in keyword and keyword in date_string:
+            return today + offset
     
     # Try parsing with dateutil
     try:
@@ -59,7 +322,7 @@ def parse_date(date_string):
                 if not re.search(r'\d{1,2}:\d{2}', date_string):
                     parsed_date = parsed_date.replace(hour=0, minute=0, second=0, microsecond=0)
             return parsed_date
-    except (ValueError, TypeError) as e:
+    except (ValueError, TypeError, OverflowError) as e:
         logger.warning(f"Failed to parse date '{date_string}': {e}")
         return None
     
@@ -69,6 +332,8 @@ def parse_time(time_string):
     """
     Parse a time string into time components.
     
+    Results are cached by the normalized string.
+    
     Args:
         time_string: String containing time information (e.g., "3pm", "15:30", "9:00 AM")
     
@@ -78,36 +343,35 @@ def parse_time(time_string):
     if not time_string or not time_string.strip():
         return None
     
-    time_string = time_string.strip().lower()
-    
     # Remove common prefixes
-    time_string = re.sub(r'^at\s+', '', time_string)
-    time_string = re.sub(r'^@\s*', '', time_string)
-    
-    # Try parsing with dateutil
+    time_string = _TIME_PREFIX.sub('', ' '.join(time_string.lower().split()))
+    resolved = _time_cache.get(time_string, _MISSING)
+    if resolved is _MISSING:
+        resolved = _parse_time(time_string)
+        _time_cache.put(time_string, resolved)
+    return resolved
+
+def _parse_time(time_string):
+    """Parse a normalized time string (see parse_time)."""
+    # Known forms are resolved directly
+    match = _SCANNER.fullmatch(time_string)
+    if match is not None and match.lastgroup in _TIME_KINDS:
+        resolved = _resolve_time(match)
+        if resolved is not None:
+            return resolved
+    
+    # Try parsing with dateutil; fields missing from the string default to midnight
     try:
         if config.DATETIME_CONFIG['use_dateutil']:
-            # Create a datetime with today's date and parse time
-            today = datetime.now()
-            parsed_datetime = date_parser.parse(time_string, default=today)
+            parsed_datetime = date_parser.parse(time_string, default=midnight_today())
             return (parsed_datetime.hour, parsed_datetime.minute)
-    except (ValueError, TypeError) as e:
+    except (ValueError, TypeError, OverflowError) as e:
         logger.warning(f"Failed to parse time '{time_string}': {e}")
     
-    # Fallback: try regex patterns
-    # Pattern for "3pm", "3 PM", "15:30", etc.
-    patterns = [
-        (r'(\d{1,2}):(\d{2})\s*(am|pm)?', lambda m: (int(m.group(1)) % 12 + (12 if m.group(3) == 'pm' else 0), int(m.group(2)))),
-        (r'(\d{1,2})\s*(am|pm)', lambda m: (int(m.group(1)) % 12 + (12 if m.group(2) == 'pm' else 0), 0)),
-    ]
-    
-    for pattern, converter in patterns:
-        match = re.search(pattern, time_string, re.IGNORECASE)
-        if match:
-            try:
-                return converter(match)
-            except (ValueError, IndexError):
-                continue
+    # Fallback: the first time anywhere in the string
+    for span in find_datetime_spans(time_string):
+        if span.kind == 'time':
+            return span.value
     
     return None
 
@@ -134,6 +398,193 @@ def parse_datetime(date_string, time_string=None):
     
     return date_obj
 
+# How a unique date string is resolved by parse_datetime_bulk; the three
+# integers that go with each form are listed alongside
+_BULK_DAYS = 0      # (days from today, -, -)
+_BULK_MONTHS = 1    # (months from today, -, -)
+_BULK_WEEKDAY = 2   # (weekday, 1 if 'next', -)
+_BULK_CALENDAR = 3  # (year, month, day)
+_BULK_SCALAR = 4    # parse_date() is needed
+
+def _unique_strings(strings):
+    """
+    Deduplicate a sequence of strings (None counts as empty).
+    
+    Returns:
+        tuple: (list of unique strings, index of each input in that list)
+    """
+    positions = {}
+    inverse = np.fromiter(
+        (positions.setdefault('' if text is None else text, len(positions)) for text in strings), dtype=np.intp
+    )
+    return list(positions), inverse
+
+def _classify_date(date_string, today):
+    """Describe a normalized date string as (form, a, b, c) for parse_datetime_bulk."""
+    match = _SCANNER.fullmatch(date_string)
+    kind = match.lastgroup if match is not None else None
+    if kind == 'relative':
+        keyword = ' '.join(match.group('relative').lower().split())
+    elif kind not in _DATE_KINDS:
+        keyword = next((keyword for keyword in RELATIVE_DATES if ' ' in keyword and keyword in date_string), None)
+    else:
+        keyword = None
+    if keyword is not None:
+        offset = RELATIVE_DATES[keyword]
+        if isinstance(offset, timedelta):
+            return (_BULK_DAYS, offset.days, 0, 0)
+        return (_BULK_MONTHS, offset.years * 12 + offset.months, 0, 0)
+    if kind == 'weekday':
+        prefix = (match.group('weekday_prefix') or '').lower()
+        return (_BULK_WEEKDAY, WEEKDAYS[match.group('weekday_name').lower()], int(prefix == 'next'), 0)
+    if kind == 'month_day':
+        year = int(match.group('md_year')) if match.group('md_year') else today.year
+        return (_BULK_CALENDAR, year, MONTHS[match.group('md_month').lower()], int(match.group('md_day')))
+    if kind == 'day_month':
+        year = int(match.group('dm_year')) if match.group('dm_year') else today.year
+        return (_BULK_CALENDAR, year, MONTHS[match.group('dm_month').lower()], int(match.group('dm_day')))
+    if kind == 'iso':
+        return (_BULK_CALENDAR, int(match.group('iso_year')), int(match.group('iso_month')), int(match.group('iso_day')))
+    if kind == 'numeric':
+        month, day = int(match.group('num_first')), int(match.group('num_second'))
+        if month > 12 >= day:
+            month, day = day, month
+        return (_BULK_CALENDAR, _full_year(int(match.group('num_year')), today), month, day)
+    return (_BULK_SCALAR, 0, 0, 0)
+
+def _resolve_dates_bulk(date_strings, today):
+    """
+    Resolve unique normalized date strings to datetime64[s].
+    
+    Args:
+        date_strings: List of unique normalized date strings
+        today: Midnight datetime the strings are resolved against
+    
+    Returns:
+        tuple: (datetime64[s] array, boolean validity array)
+    """
+    forms = np.array([_classify_date(text, today) for text in date_strings], dtype=np.int64).reshape(-1, 4)
+    form, a, b, c = forms.T
+    anchor = np.datetime64(today.date(), 'D')
+    values = np.full(len(forms), np.datetime64('NaT'), dtype='datetime64[D]')
+    valid = np.zeros(len(forms), dtype=bool)
+    
+    selected = form == _BULK_DAYS
+    values[selected] = anchor + a[selected]
+    valid |= selected
+    
+    # Month steps keep the day of month, clipped to the target month (as relativedelta does)
+    selected = form == _BULK_MONTHS
+    months = anchor.astype('datetime64[M]') + a[selected]
+    month_days = ((months + 1).astype('datetime64[D]') - months.astype('datetime64[D]')).astype(np.int64)
+    day_index = (anchor - anchor.astype('datetime64[M]').astype('datetime64[D]')).astype(np.int64)
+    values[selected] = months.astype('datetime64[D]') + np.minimum(day_index, month_days - 1)
+    valid |= selected
+    
+    # 1970-01-01 was a Thursday (weekday 3)
+    selected = form == _BULK_WEEKDAY
+    days_ahead = (a[selected] - (anchor.astype(np.int64) + 3)) % 7
+    days_ahead[(days_ahead == 0) & (b[selected] == 1)] = 7
+    values[selected] = anchor + days_ahead
+    valid |= selected
+    
+    selected = form == _BULK_CALENDAR
+    years, month_numbers, days = a[selected], b[selected], c[selected]
+    ok = (years >= 1) & (years <= 9999) & (month_numbers >= 1) & (month_numbers <= 12) & (days >= 1)
+    months = (
+        np.where(ok, years - 1970, 0).astype('datetime64[Y]').astype('datetime64[M]')
+        + np.where(ok, month_numbers - 1, 0)
+    )
+    month_days = ((months + 1).astype('datetime64[D]') - months.astype('datetime64[D]')).astype(np.int64)
+    ok &= days <= month_days
+    values[selected] = np.where(ok, months.astype('datetime64[D]') + np.where(ok, days - 1, 0), np.datetime64('NaT'))
+    valid[selected] = ok
+    
+    values = values.astype('datetime64[s]')
+    # Everything else, and calendar dates that do not exist, go through
+    # parse_date one unique string at a time
+    for index in np.flatnonzero(~valid):
+        resolved = _parse_date(date_strings[index], today) if date_strings[index] else None
+        if resolved is not None:
+            values[index] = np.datetime64(resolved.replace(tzinfo=None), 's')
+            valid[index] = True
+    return values, valid
+
+def _resolve_times_bulk(time_strings):
+    """
+    Resolve unique normalized time strings to minutes after midnight.
+    
+    Args:
+        time_strings: List of unique normalized time strings
+    
+    Returns:
+        tuple: (int64 minutes array, boolean validity array)
+    """
+    fields = np.zeros((len(time_strings), 4), dtype=np.int64)  # hour, minute, meridiem, known form
+    for index, time_string in enumerate(time_strings):
+        match = _SCANNER.fullmatch(time_string)
+        kind = match.lastgroup if match is not None else None
+        if kind == 'named_time':
+            fields[index] = (12 if match.group('named_time').lower() == 'noon' else 0, 0, 0, 1)
+        elif kind == 'clock':
+            meridiem = match.group('clock_meridiem')
+            fields[index] = (
+                int(match.group('clock_hour')), int(match.group('clock_minute')),
+                0 if not meridiem else 2 if meridiem[0].lower() == 'p' else 1, 1
+            )
+        elif kind == 'hour':
+            meridiem = match.group('hour_meridiem')
+            fields[index] = (int(match.group('hour_value')), 0, 2 if meridiem[0].lower() == 'p' else 1, 1)
+    hours, minutes, meridiem, known = fields.T
+    
+    valid = (known == 1) & (minutes <= 59) & np.where(meridiem > 0, (hours >= 1) & (hours <= 12), hours <= 23)
+    hours = np.where(meridiem > 0, hours % 12 + 12 * (meridiem == 2), hours)
+    minutes = hours * 60 + minutes
+    
+    for index in np.flatnonzero(~valid):
+        resolved = parse_time(time_strings[index]) if time_strings[index] else None
+        if resolved is not None:
+            minutes[index] = resolved[0] * 60 + resolved[1]
+            valid[index] = True
+    return minutes, valid
+
+def parse_datetime_bulk(date_strings, time_strings=None, today=None):
+    """
+    Parse many date (and time) strings at once, like parse_datetime.
+    
+    The strings are deduplicated first, so each distinct string is
+    classified once. Relative keywords, weekday names and calendar dates
+    are then resolved together with datetime64 arithmetic against a
+    single today; other strings fall back to parse_date / parse_time.
+    As in parse_datetime, a time that cannot be parsed is ignored.
+    
+    Args:
+        date_strings: Sequence of date strings
+        time_strings: Optional sequence of time strings, same length (None or '' for no time)
+        today: Date relative forms are resolved against (midnight today if None)
+    
+    Returns:
+        tuple: (datetime64[s] array with NaT where invalid, boolean validity mask)
+    """
+    today = today or midnight_today()
+    unique_dates, date_index = _unique_strings(date_strings)
+    normalized = [' '.join(text.lower().split()) for text in unique_dates]
+    unique_values, unique_valid = _resolve_dates_bulk(normalized, today)
+    values, valid = unique_values[date_index], unique_valid[date_index]
+    
+    if time_strings is not None:
+        unique_times, time_index = _unique_strings(time_strings)
+        if len(time_index) != len(date_index):
+            raise ValueError(f"Got {len(date_index)} date strings but {len(time_index)} time strings")
+        normalized = [_TIME_PREFIX.sub('', ' '.join(text.lower().split())) for text in unique_times]
+        unique_minutes, unique_time_valid = _resolve_times_bulk(normalized)
+        has_time = unique_time_valid[time_index] & valid
+        values[has_time] = (
+            values[has_time].astype('datetime64[D]')
+            + unique_minutes[time_index][has_time].astype('timedelta64[m]')
+        )
+    return values, valid
+
 def validate_datetime(dt):
     """
     Validate that a datetime is in the future (for reminders/events).
@@ -169,12 +620,16 @@ def format_datetime(dt, include_time=True):
     else:
         return dt.strftime("%B %d, %Y")
 
-def extract_datetime_from_text(text):
+def extract_datetime_from_text(text, today=None):
     """
     Extract date and time information from natural language text.
     
+    The text is scanned once (see find_datetime_spans); the first date
+    and the first time found are used.
+    
     Args:
         text: Natural language text containing date/time information
+        today: Date relative forms are resolved against (midnight today if None)
     
     Returns:
         dict: Contains 'date', 'time', 'datetime' keys with parsed values
@@ -185,35 +640,11 @@ def extract_datetime_from_text(text):
         'datetime': None
     }
     
-    # Try to find date and time patterns in text
-    # This is a simple implementation - could be enhanced with more sophisticated NLP
-    date_patterns = [
-        r'\b(today|tomorrow|yesterday|next week|next month)\b',
-        r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:st|nd|rd|th)?',
-        r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b',
-    ]
-    
-    time_patterns = [
-        r'\b\d{1,2}:\d{2}\s*(am|pm)\b',
-        r'\b\d{1,2}\s*(am|pm)\b',
-        r'\b\d{1,2}:\d{2}\b',
-    ]
-    
-    # Extract date
-    for pattern in date_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            result['date'] = parse_date(match.group(0))
-            break
-    
-    # Extract time
-    for pattern in time_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            time_tuple = parse_time(match.group(0))
-            if time_tuple:
-                result['time'] = time_tuple
-            break
+    for span in find_datetime_spans(text, today):
+        if result[span.kind] is None:
+            result[span.kind] = span.value
+            if result['date'] is not None and result['time'] is not None:
+                break
     
     # Combine if both found
     if result['date'] and result['time']:
@@ -221,4 +652,3 @@ def extract_datetime_from_text(text):
         result['datetime'] = result['date'].replace(hour=hour, minute=minute, second=0, microsecond=0)
     
     return result
-
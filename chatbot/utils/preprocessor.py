@@ -2,60 +2,134 @@
 Text preprocessing utilities for the chatbot.
 """
 
-import nltk
+from collections import namedtuple
 import numpy as np
-from nltk.stem import WordNetLemmatizer
+import config
+from chatbot.utils import tokenizer
+from chatbot.utils.cache import LRUCache
+
+# Compressed sparse row layout of a bag-of-words batch: the active columns
+# of row i are indices[indptr[i]:indptr[i + 1]].
+SparseBatch = namedtuple('SparseBatch', ['indptr', 'indices', 'shape'])
+
+
+def build_word_index(words):
+    """
+    Build a word -> column mapping for a vocabulary.
+    
+    Args:
+        words: List of words in vocabulary
+    
+    Returns:
+        Dictionary mapping each word to its bag-of-words column
+    """
+    return {word: i for i, word in enumerate(words)}
+
 
 class Preprocessor:
     """Handles text preprocessing for intent classification."""
     
-    def __init__(self, words_vocabulary=None):
+    def __init__(self, words_vocabulary=None, cache_size=None):
         """
         Initialize preprocessor.
         
         Args:
             words_vocabulary: List of words in vocabulary (for bag-of-words)
+            cache_size: Maximum number of cached sentences (uses config if None)
         """
-        self.lemmatizer = WordNetLemmatizer()
-        self.words = words_vocabulary
+        if cache_size is None:
+            perf_config = config.PERFORMANCE_CONFIG
+            cache_size = perf_config['cache_size'] if perf_config['cache_preprocessed_sentences'] else 0
+        self.cache = LRUCache(cache_size)
+        self.set_vocabulary(words_vocabulary)
     
     def clean_up_sentence(self, sentence):
         """
         Tokenize and lemmatize a sentence.
         
+        Uses the shared tokenizer module, so inference sees exactly the
+        tokens the training script built the vocabulary from.
+        
         Args:
             sentence: Input sentence string
         
         Returns:
-            List of lemmatized words
+            List of lemmatized, lowercased words
         """
-        sentence_words = nltk.word_tokenize(sentence)
-        sentence_words = [self.lemmatizer.lemmatize(word) for word in sentence_words]
-        return sentence_words
+        return tokenizer.clean_up_sentence(sentence)
     
-    def bag_of_words(self, sentence):
+    def bag_indices(self, sentence):
         """
-        Convert sentence to bag of words representation (optimized).
+        Get the active bag-of-words columns for a sentence.
+        
+        Cost depends on the sentence length, not on the vocabulary size.
+        Results are cached per sentence, so repeated messages skip
+        tokenization and lemmatization entirely.
         
         Args:
             sentence: Input sentence string
         
         Returns:
-            numpy array representing bag of words
+            Sorted, read-only numpy array of unique column indices
         """
         if self.words is None:
             raise ValueError("Words vocabulary not set. Initialize Preprocessor with words_vocabulary.")
         
-        sentence_words = self.clean_up_sentence(sentence)
-        bag = np.zeros(len(self.words), dtype=np.float32)
-        word_set = set(sentence_words)  # Use set for O(1) lookup
+        columns = self.cache.get(sentence)
+        if columns is not None:
+            return columns
+        
+        word_index = self.word_index
+        columns = {word_index[word] for word in self.clean_up_sentence(sentence) if word in word_index}
+        columns = np.array(sorted(columns), dtype=np.intp)
+        columns.flags.writeable = False
+        self.cache.put(sentence, columns)
+        return columns
+    
+    def bag_of_words(self, sentence):
+        """
+        Convert sentence to bag of words representation.
         
-        for i, word in enumerate(self.words):
-            if word in word_set:
-                bag[i] = 1
+        Args:
+            sentence: Input sentence string
         
+        Returns:
+            numpy array representing bag of words
+        """
+        columns = self.bag_indices(sentence)
+        bag = np.zeros(len(self.words), dtype=np.float32)
+        bag[columns] = 1
         return bag
     
+    def sparse_bag_of_words_batch(self, sentences):
+        """
+        Convert several sentences to a sparse (CSR) bag of words batch.
+        
+        Args:
+            sentences: List of input sentence strings
+        
+        Returns:
+            SparseBatch with indptr, indices and shape
+        """
+        rows = [self.bag_indices(sentence) for sentence in sentences]
+        indptr = np.zeros(len(rows) + 1, dtype=np.intp)
+        np.cumsum([len(columns) for columns in rows], out=indptr[1:])
+        indices = np.concatenate(rows) if rows else np.zeros(0, dtype=np.intp)
+        return SparseBatch(indptr, indices.astype(np.intp, copy=False), (len(rows), len(self.words)))
+    
+    def bag_of_words_batch(self, sentences):
+        """
+        Convert several sentences to a bag of words matrix.
+        
+        Args:
+            sentences: List of input sentence strings
+        
+        Returns:
+            numpy array of shape (len(sentences), len(vocabulary))
+        """
+        batch = self.sparse_bag_of_words_batch(sentences)
+        return sparse_to_dense(batch)
+    
     def set_vocabulary(self, words_vocabulary):
         """
         Set or update the words vocabulary.
@@ -64,4 +138,21 @@ class Preprocessor:
             words_vocabulary: List of words in vocabulary
         """
         self.words = words_vocabulary
+        self.word_index = build_word_index(words_vocabulary) if words_vocabulary is not None else None
+        self.cache.clear()
+
 
+def sparse_to_dense(batch):
+    """
+    Expand a SparseBatch into a dense float32 bag-of-words matrix.
+    
+    Args:
+        batch: SparseBatch to expand
+    
+    Returns:
+        numpy array of shape batch.shape
+    """
+    bags = np.zeros(batch.shape, dtype=np.float32)
+    rows = np.repeat(np.arange(batch.shape[0]), np.diff(batch.indptr))
+    bags[rows, batch.indices] = 1
+    return bags
@@ -0,0 +1,263 @@
+"""
+Recurring dates for phrases like "every Friday at 10am".
+
+parse_recurrence turns a phrase into a RecurrenceRule: a frequency, an
+interval, the weekdays or day of month it falls on, a time and the date
+the series starts. Occurrences are computed from the rule with date
+arithmetic, so next_after() and between() do not step through the
+earlier part of the series, and occurrences() is a lazy generator.
+"""
+
+import calendar
+import re
+from collections import namedtuple
+from datetime import datetime, timedelta
+from chatbot.utils.datetime_parser import WEEKDAYS, find_datetime_spans, parse_date, midnight_today
+
+_INTERVAL_WORDS = {'other': 2, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'six': 6}
+_ADVERBS = {
+    'daily': ('daily', 1), 'everyday': ('daily', 1), 'nightly': ('daily', 1),
+    'weekly': ('weekly', 1), 'fortnightly': ('weekly', 2), 'biweekly': ('weekly', 2),
+    'monthly': ('monthly', 1), 'yearly': ('yearly', 1), 'annually': ('yearly', 1)
+}
+_UNITS = {'day': 'daily', 'night': 'daily', 'week': 'weekly', 'fortnight': 'weekly', 'month': 'monthly', 'year': 'yearly'}
+_DAY_GROUPS = {'weekday': (0, 1, 2, 3, 4), 'weekend': (5, 6)}
+
+_WEEKDAY_NAME = '(?:' + '|'.join(sorted(WEEKDAYS, key=len, reverse=True)) + ')'
+_WEEKDAY = _WEEKDAY_NAME + 's?'
+_PLURAL_DAY = _WEEKDAY_NAME + 's'
+_RECURRENCE = re.compile(rf'''
+    (?<!\w)(?:
+        (?:every|each)\s+
+        (?:(?P<interval>\d+|{'|'.join(_INTERVAL_WORDS)})(?:st|nd|rd|th)?\s+)?
+        (?:
+            (?P<days>{_WEEKDAY}(?:(?:\s*,\s*(?:and\s+)?|\s+and\s+){_WEEKDAY})*)
+          | (?P<group>weekday|weekend)s?
+          | (?P<unit>day|night|week|fortnight|month|year)s?
+        )
+      | on\s+(?P<plural_days>{_PLURAL_DAY}(?:(?:\s*,\s*(?:and\s+)?|\s+and\s+){_WEEKDAY})*)
+      | (?P<adverb>{'|'.join(_ADVERBS)})
+    )(?!\w)
+''', re.IGNORECASE | re.VERBOSE)
+_WEEKDAY_NAMES = re.compile(_WEEKDAY_NAME, re.IGNORECASE)
+_MONTH_DAY = re.compile(r'(?<!\w)(?:on\s+)?the\s+(?P<day>\d{1,2})(?:st|nd|rd|th)(?!\w)', re.IGNORECASE)
+_UNTIL = re.compile(r'(?<!\w)until\s+(?P<until>.+)$', re.IGNORECASE)
+
+
+def _add_months(year, month, months):
+    index = year * 12 + month - 1 + months
+    return index // 12, index % 12 + 1
+
+
+def _clipped_date(year, month, day):
+    # Days past the end of a month fall on its last day ("the 31st" in April is the 30th)
+    return datetime(year, month, min(day, calendar.monthrange(year, month)[1]))
+
+
+def _date_only(text, today):
+    """Parse the first date in text, dropping any time of day."""
+    date = next((span.value for span in find_datetime_spans(text, today) if span.kind == 'date'), None)
+    if date is None:
+        date = parse_date(text, today=today)
+    return date.replace(hour=0, minute=0, second=0, microsecond=0) if date is not None else None
+
+
+class RecurrenceRule(namedtuple('RecurrenceRule', ['frequency', 'interval', 'weekdays', 'month_day', 'time', 'start', 'until'])):
+    """
+    A recurring date: every interval days, weeks, months or years from start.
+    
+    Fields:
+        frequency: 'daily', 'weekly', 'monthly' or 'yearly'
+        interval: Number of frequency units between occurrences (1 or more)
+        weekdays: Sorted tuple of weekdays (Monday is 0) for weekly rules
+        month_day: Day of month for monthly rules (clipped to short months)
+        time: (hour, minute) of every occurrence
+        start: Midnight of the first day the series can fall on; intervals
+            are counted from it (its week for weekly rules)
+        until: Midnight of the last day the series can fall on, or None
+    
+    Yearly rules fall on the month and day of start.
+    """
+    
+    __slots__ = ()
+    
+    def _on_day(self, day):
+        return day.replace(hour=self.time[0], minute=self.time[1])
+    
+    def _first_date_from(self, day):
+        """First occurrence date on or after day (a midnight datetime)."""
+        day = max(day, self.start)
+        
+        if self.frequency == 'daily':
+            offset = -(-(day - self.start).days // self.interval) * self.interval
+            return self.start + timedelta(days=offset)
+        
+        if self.frequency == 'weekly':
+            # Intervals count from the week of the first matching weekday
+            first = self.start + timedelta(days=min((weekday - self.start.weekday()) % 7 for weekday in self.weekdays))
+            first_monday = first - timedelta(days=first.weekday())
+            week = (day - first_monday).days // 7
+            if week % self.interval:
+                week += self.interval - week % self.interval
+                day = first_monday + timedelta(weeks=week)
+            for weekday in self.weekdays:
+                if weekday >= day.weekday():
+                    return day + timedelta(days=weekday - day.weekday())
+            return first_monday + timedelta(weeks=week + self.interval, days=self.weekdays[0])
+        
+        if self.frequency == 'monthly':
+            # Intervals count from the first month whose day is not before start
+            year, month = self.start.year, self.start.month
+            if _clipped_date(year, month, self.month_day) < self.start:
+                year, month = _add_months(year, month, 1)
+            months = (day.year - year) * 12 + day.month - month
+            months += -months % self.interval
+            candidate = _clipped_date(*_add_months(year, month, months), self.month_day)
+            if candidate < day:
+                candidate = _clipped_date(*_add_months(year, month, months + self.interval), self.month_day)
+            return candidate
+        
+        years = day.year - self.start.year
+        years += -years % self.interval
+        candidate = _clipped_date(self.start.year + years, self.start.month, self.start.day)
+        if candidate < day:
+            candidate = _clipped_date(self.start.year + years + self.interval, self.start.month, self.start.day)
+        return candidate
+    
+    def next_on_or_after(self, moment):
+        """
+        Get the first occurrence at or after a moment.
+        
+        Args:
+            moment: datetime
+        
+        Returns:
+            datetime of the occurrence, or None if the series has ended
+        """
+        day = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+        if self._on_day(day) < moment:
+            day += timedelta(days=1)
+        day = self._first_date_from(day)
+        if self.until is not None and day > self.until:
+            return None
+        return self._on_day(day)
+    
+    def next_after(self, moment):
+        """
+        Get the first occurrence strictly after a moment.
+        
+        Args:
+            moment: datetime
+        
+        Returns:
+            datetime of the occurrence, or None if the series has ended
+        """
+        return self.next_on_or_after(moment + timedelta(microseconds=1))
+    
+    def occurrences(self, after=None):
+        """
+        Generate occurrences in order, lazily.
+        
+        Args:
+            after: Only occurrences at or after this datetime (the start of the series if None)
+        
+        Yields:
+            datetime of each occurrence; the generator is endless unless the rule has an until date
+        """
+        occurrence = self.next_on_or_after(after or self.start)
+        while occurrence is not None:
+            yield occurrence
+            occurrence = self.next_after(occurrence)
+    
+    def between(self, start, end):
+        """
+        Generate the occurrences in [start, end), lazily.
+        
+        Args:
+            start: First datetime of the range (inclusive)
+            end: End of the range (exclusive)
+        
+        Yields:
+            datetime of each occurrence in the range
+        """
+        for occurrence in self.occurrences(after=start):
+            if occurrence >= end:
+                return
+            yield occurrence
+
+
+def parse_recurrence(text, today=None):
+    """
+    Parse a recurring date phrase into a RecurrenceRule.
+    
+    Handles "every day", "daily", "every other week", "every 3 months",
+    "every Friday", "every Monday and Thursday", "on Tuesdays and
+    Thursdays", "every weekday", "every month on the 15th" and "yearly on
+    March 3rd", with an optional time ("at 10am") and end ("until
+    December 1st").
+    Yearly phrases that give a day but no month are rejected.
+    
+    Args:
+        text: Phrase or message containing the recurrence
+        today: Date the series starts from (midnight today if None)
+    
+    Returns:
+        RecurrenceRule, or None if the text does not describe a recurrence
+    """
+    if not text:
+        return None
+    match = _RECURRENCE.search(text)
+    if match is None:
+        return None
+    today = (today or midnight_today()).replace(hour=0, minute=0, second=0, microsecond=0)
+    
+    group = match.group
+    interval = group('interval')
+    interval = int(interval) if interval and interval.isdigit() else _INTERVAL_WORDS.get((interval or '').lower(), 1)
+    weekdays = ()
+    month_day = None
+    if group('adverb'):
+        frequency, interval = _ADVERBS[group('adverb').lower()]
+    elif group('days') or group('plural_days'):
+        frequency = 'weekly'
+        weekdays = tuple(sorted({WEEKDAYS[name.lower()] for name in _WEEKDAY_NAMES.findall(group('days') or group('plural_days'))}))
+    elif group('group'):
+        frequency = 'weekly'
+        weekdays = _DAY_GROUPS[group('group').lower()]
+    else:
+        unit = group('unit').lower()
+        frequency = _UNITS[unit]
+        if unit == 'fortnight':
+            interval *= 2
+    if interval < 1:
+        return None
+    
+    rest = text[:match.start()] + ' ' + text[match.end():]
+    # The time may come after the end date ("until friday at 5pm")
+    time = next((span.value for span in find_datetime_spans(rest, today) if span.kind == 'time'), (0, 0))
+    until = None
+    until_match = _UNTIL.search(rest)
+    if until_match is not None:
+        until = _date_only(until_match.group('until'), today)
+        rest = rest[:until_match.start()]
+    
+    start = today
+    if frequency == 'weekly' and not weekdays:
+        weekdays = (today.weekday(),)
+    elif frequency == 'monthly':
+        day_match = _MONTH_DAY.search(rest)
+        month_day = int(day_match.group('day')) if day_match else today.day
+        if not 1 <= month_day <= 31:
+            return None
+    elif frequency == 'yearly':
+        # A yearly rule falls on the date given, else on today's month and day
+        date = next((span.value for span in find_datetime_spans(rest, today) if span.kind == 'date'), None)
+        if date is None and _MONTH_DAY.search(rest):
+            # "every year on the 5th" names no month
+            return None
+        if date is not None:
+            start = date
+            while start < today:
+                start = _clipped_date(start.year + 1, start.month, start.day)
+    
+    return RecurrenceRule(frequency, interval, weekdays, month_day, time, start, until)
@@ -0,0 +1,71 @@
+"""
+Per-stage timing statistics for the processing pipeline.
+"""
+
+import threading
+import time
+from collections import defaultdict
+
+
+class StageTimings:
+    """Thread-safe accumulator of wall-clock time spent in named stages."""
+    
+    def __init__(self):
+        """Initialize StageTimings."""
+        self._lock = threading.Lock()
+        self._totals = defaultdict(float)
+        self._counts = defaultdict(int)
+    
+    def record(self, stage, seconds):
+        """
+        Add one measurement for a stage.
+        
+        Args:
+            stage: Stage name
+            seconds: Elapsed wall-clock time in seconds
+        """
+        with self._lock:
+            self._totals[stage] += seconds
+            self._counts[stage] += 1
+    
+    def timed(self, stage, func, *args, **kwargs):
+        """
+        Call func and record its duration under stage.
+        
+        Args:
+            stage: Stage name
+            func: Callable to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        
+        Returns:
+            Return value of func
+        """
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.record(stage, time.perf_counter() - start)
+    
+    def summary(self):
+        """
+        Get the statistics for all stages.
+        
+        Returns:
+            Dictionary mapping stage name to count, total_seconds and mean_ms
+        """
+        with self._lock:
+            return {
+                stage: {
+                    'count': self._counts[stage],
+                    'total_seconds': total,
+                    'mean_ms': total / self._counts[stage] * 1000
+                }
+                for stage, total in self._totals.items()
+            }
+    
+    def reset(self):
+        """Drop all measurements."""
+        with self._lock:
+            self._totals.clear()
+            self._counts.clear()
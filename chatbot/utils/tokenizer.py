@@ -0,0 +1,84 @@
+"""
+Tokenization and lemmatization shared by training and inference.
+
+The tokenizer is a single precompiled regular expression that follows the
+Treebank rules used by nltk.word_tokenize for the kind of short, single
+sentence messages the chatbot receives: punctuation is split off,
+contractions become "do" + "n't", clitics like "'s" / "'re" are separate
+tokens, and words joined by "_", "-" or "/" stay whole. Unlike nltk, the
+period of an abbreviation ("Dr.") is always split off.
+"""
+
+import re
+from functools import lru_cache
+import config
+
+TOKEN_PATTERN = re.compile(r"""
+    \d+(?::\d+)+[a-z]*              # clock times: 15:30, 5:30pm
+  | [a-z]+(?=n't\b)                 # word before a negation: do|n't, ca|n't
+  | n't\b
+  | '(?:s|m|d|re|ve|ll)\b           # clitics: 's 're 've 'm 'd 'll
+  | \.\.\.                          # ellipsis
+  | \w+(?:[-/.]\w+)*                # words, compounds, book/movie/song
+  | [^\w\s]                         # any other single symbol
+""", re.VERBOSE)
+
+_lemmatizer = None
+
+
+def tokenize(sentence):
+    """
+    Lowercase and split a sentence into tokens.
+    
+    Args:
+        sentence: Input sentence string
+    
+    Returns:
+        List of token strings
+    """
+    return TOKEN_PATTERN.findall(sentence.lower())
+
+
+@lru_cache(maxsize=config.PERFORMANCE_CONFIG['lemma_cache_size'])
+def lemmatize(token):
+    """
+    Lemmatize a token with WordNet, memoizing the result.
+    
+    The set of live tokens is small and repeats constantly, so after
+    warm-up almost every call is a dictionary hit instead of a WordNet
+    lookup.
+    
+    Args:
+        token: Token string
+    
+    Returns:
+        Lemmatized token
+    """
+    global _lemmatizer
+    if _lemmatizer is None:
+        from nltk.stem import WordNetLemmatizer
+        _lemmatizer = WordNetLemmatizer()
+    return _lemmatizer.lemmatize(token)
+
+
+def clean_up_sentence(sentence):
+    """
+    Tokenize and lemmatize a sentence.
+    
+    Args:
+        sentence: Input sentence string
+    
+    Returns:
+        List of lemmatized, lowercased tokens
+    """
+    return [lemmatize(token) for token in tokenize(sentence)]
+
+
+def lemma_cache_info():
+    """
+    Get statistics of the token -> lemma memo table.
+    
+    Returns:
+        functools cache info (hits, misses, maxsize, currsize)
+    """
+    return lemmatize.cache_info()
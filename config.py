@@ -12,6 +12,8 @@ BASE_DIR = Path(__file__).parent
 # Model and data file paths
 MODEL_PATHS = {
     'ner_model': str(BASE_DIR / 'ner_model'),
+    'ner_model_compact': str(BASE_DIR / 'ner_model_compact'),  # Written by training/package_ner.py
+    'model_bundle': str(BASE_DIR / 'model_bundle.bin'),  # Written by training/build_bundle.py
     'intents_model': str(BASE_DIR / 'intents_model.h5'),
     'intents_json': str(BASE_DIR / 'intents.json'),
     'words_pkl': str(BASE_DIR / 'words.pkl'),
@@ -30,7 +32,9 @@ INTENT_CONFIG = {
 # NER Settings
 NER_CONFIG = {
     'keep_first_entity_only': True,  # If multiple entities of same type, keep first
-    'min_entity_confidence': 0.0  # Minimum confidence for entity extraction
+    'min_entity_confidence': 0.0,  # Minimum confidence for entity extraction
+    'always_run_ner': False,  # If False, skip NER for intents without entity slots
+    'load_profile': 'full'  # 'full' or 'compact' (NER only, no vocab data, inference only)
 }
 
 # Training Settings - Intent Model
@@ -84,6 +88,7 @@ LOGGING_CONFIG = {
 CHATBOT_CONFIG = {
     'goodbye_statements': ['bye', 'goodbye', 'see you', 'later', 'quit', 'exit', 'leave', 'end'],
     'welcome_message': "RemindMe! Chatbot - Ready to assist you!",
+    'cancel_statements': ['cancel', 'never mind', 'nevermind', 'stop'],  # Abort a pending slot prompt
     'exit_confirmation': True,
     'max_conversation_history': 10,  # Number of previous messages to keep
     'enable_context': False  # Enable conversation context (future feature)
@@ -94,15 +99,68 @@ DATETIME_CONFIG = {
     'use_dateutil': True,  # Use python-dateutil for parsing
     'default_timezone': None,  # None for local timezone
     'relative_date_keywords': ['today', 'tomorrow', 'yesterday', 'next week', 'next month'],
-    'time_formats': ['%H:%M', '%I:%M %p', '%H:%M:%S']
+    'time_formats': ['%H:%M', '%I:%M %p', '%H:%M:%S'],
+    'parse_cache_size': 4096  # Maximum cached parse_date / parse_time results (0 disables)
 }
 
 # Performance Settings
 PERFORMANCE_CONFIG = {
     'cache_preprocessed_sentences': True,
     'cache_size': 1000,  # Maximum cached sentences
+    'cache_predictions': True,  # Also cache intent results and entity dicts per message
+    'lemma_cache_size': 10000,  # Maximum memoized token -> lemma entries
+    'use_fast_path': True,  # Answer exact intents.json pattern matches without the models
+    # Overlap NER with intent classification. NER then starts before the intent is
+    # known, so it is only done when NER will (likely) be needed: always_run_ner,
+    # every intent has entity slots, or enough recent messages needed entities
+    'concurrent_stages': False,
+    'speculative_ner_threshold': 0.5,  # Share of recent model-path messages needing NER to start it early
+    'stage_workers': 2,  # Size of the stage thread pool when concurrent_stages is on
+    'parallel_model_loading': True,  # Load the NER model, intent model and data files concurrently
     'use_batch_prediction': False,  # Batch multiple predictions (future)
-    'model_optimization': 'none'  # 'none', 'tflite', 'onnx' (future)
+    'compile_intent_model': True,  # Call the Keras model through fixed-shape tf.function graphs
+    'batch_buckets': [1, 8, 32],  # Batch sizes compiled for; batches are padded up to the next one
+    'warm_up_models': True,  # Run every bucket and a sample message through the models at startup
+    'model_optimization': 'none',  # 'none', 'float16', 'int8' (numpy backend); 'tflite', 'onnx' (future)
+    'intent_backend': 'keras',  # 'keras' or 'numpy' (NumPy forward pass, no TensorFlow)
+    'use_model_bundle': True,  # With the numpy backend, load model_bundle.bin when it exists
+    'verify_model_bundle': True  # Check the bundle checksum at load time
+}
+
+# HTTP Server Settings (python -m chatbot.server)
+SERVER_CONFIG = {
+    'host': '127.0.0.1',
+    'port': 8080,
+    'max_batch_size': 32,  # Messages per micro-batch
+    'max_wait_ms': 5.0,  # Longest a message waits for its batch to fill
+    'max_body_bytes': 65536,  # Reject larger request bodies
+    'workers': 0,  # Pre-forked worker processes (python -m chatbot.prefork); 0 = one per CPU
+    'pin_workers': True,  # Pin each worker to its own CPU where supported
+    'drain_timeout': 10.0,  # Seconds to finish in-flight requests on shutdown
+    'allow_reload': False  # Expose POST /admin/reload (SIGHUP always reloads)
+}
+
+# Conversation Session Settings
+SESSION_CONFIG = {
+    'shards': 16,  # Independently locked partitions of the session table
+    'ttl_seconds': 1800,  # Sessions idle for longer are dropped
+    'max_sessions': 200000,  # Sessions kept in memory; least recently used are evicted beyond this
+    'spill_path': None,  # SQLite file that keeps evicted sessions with state, e.g. str(BASE_DIR / 'sessions.db')
+    'shared': False  # Use the spill file as the source of truth for processes sharing it (needs spill_path)
+}
+
+# Offline Bulk Processing Settings (python chatbot.py bulk ...)
+BULK_CONFIG = {
+    'chunk_size': 1024,  # Messages read, classified and written per chunk
+    'ner_batch_size': 256,  # spaCy nlp.pipe batch size
+    'text_field': 'message',  # JSON field holding the message text
+    'progress_interval': 5.0  # Seconds between progress reports
+}
+
+# Hot Model Reload Settings (Chatbot.reload)
+RELOAD_CONFIG = {
+    'smoke_batch_size': 64,  # Intent patterns run through a new model set before it is swapped in
+    'min_smoke_accuracy': 0.8  # Required top-1 accuracy of the new intent model on that batch
 }
 
 # Environment Variables (can override config)
@@ -122,5 +180,25 @@ def get_env_float(key, default):
 # Override with environment variables if set
 INTENT_CONFIG['error_threshold'] = get_env_float('INTENT_ERROR_THRESHOLD', INTENT_CONFIG['error_threshold'])
 LOGGING_CONFIG['level'] = os.getenv('LOG_LEVEL', LOGGING_CONFIG['level'])
+PERFORMANCE_CONFIG['intent_backend'] = os.getenv('INTENT_BACKEND', PERFORMANCE_CONFIG['intent_backend'])
+PERFORMANCE_CONFIG['model_optimization'] = os.getenv('MODEL_OPTIMIZATION', PERFORMANCE_CONFIG['model_optimization'])
+NER_CONFIG['always_run_ner'] = get_env_bool('ALWAYS_RUN_NER', NER_CONFIG['always_run_ner'])
+PERFORMANCE_CONFIG['concurrent_stages'] = get_env_bool('CONCURRENT_STAGES', PERFORMANCE_CONFIG['concurrent_stages'])
+PERFORMANCE_CONFIG['speculative_ner_threshold'] = get_env_float('SPECULATIVE_NER_THRESHOLD', PERFORMANCE_CONFIG['speculative_ner_threshold'])
+PERFORMANCE_CONFIG['use_model_bundle'] = get_env_bool('USE_MODEL_BUNDLE', PERFORMANCE_CONFIG['use_model_bundle'])
+PERFORMANCE_CONFIG['compile_intent_model'] = get_env_bool('COMPILE_INTENT_MODEL', PERFORMANCE_CONFIG['compile_intent_model'])
+PERFORMANCE_CONFIG['warm_up_models'] = get_env_bool('WARM_UP_MODELS', PERFORMANCE_CONFIG['warm_up_models'])
+PERFORMANCE_CONFIG['parallel_model_loading'] = get_env_bool('PARALLEL_MODEL_LOADING', PERFORMANCE_CONFIG['parallel_model_loading'])
+NER_CONFIG['load_profile'] = os.getenv('NER_LOAD_PROFILE', NER_CONFIG['load_profile'])
+SERVER_CONFIG['host'] = os.getenv('SERVER_HOST', SERVER_CONFIG['host'])
+SERVER_CONFIG['port'] = get_env_int('SERVER_PORT', SERVER_CONFIG['port'])
+SERVER_CONFIG['max_batch_size'] = get_env_int('SERVER_MAX_BATCH_SIZE', SERVER_CONFIG['max_batch_size'])
+SERVER_CONFIG['max_wait_ms'] = get_env_float('SERVER_MAX_WAIT_MS', SERVER_CONFIG['max_wait_ms'])
+SERVER_CONFIG['workers'] = get_env_int('SERVER_WORKERS', SERVER_CONFIG['workers'])
+SERVER_CONFIG['allow_reload'] = get_env_bool('SERVER_ALLOW_RELOAD', SERVER_CONFIG['allow_reload'])
+SESSION_CONFIG['ttl_seconds'] = get_env_float('SESSION_TTL', SESSION_CONFIG['ttl_seconds'])
+SESSION_CONFIG['max_sessions'] = get_env_int('SESSION_MAX', SESSION_CONFIG['max_sessions'])
+SESSION_CONFIG['spill_path'] = os.getenv('SESSION_SPILL_PATH', SESSION_CONFIG['spill_path'])
+SESSION_CONFIG['shared'] = get_env_bool('SESSION_SHARED', SESSION_CONFIG['shared'])
 INTENT_TRAINING['epochs'] = get_env_int('TRAINING_EPOCHS', INTENT_TRAINING['epochs'])
 
@@ -0,0 +1,112 @@
+"""
+Unit tests for offline bulk processing
+"""
+
+import json
+import os
+import tempfile
+import unittest
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from chatbot.bulk import BulkProcessor
+
+
+class FakeClassifier:
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.batches = []
+    
+    def predict_batch(self, messages, log=True):
+        if self.fail_on in messages:
+            raise RuntimeError('crash')
+        self.batches.append(list(messages))
+        return [[{'intent': 'reminder' if 'remind' in m else 'greeting', 'probability': 0.9}] for m in messages]
+
+
+class FakeExtractor:
+    def extract_batch(self, messages, batch_size=None):
+        for message in messages:
+            yield {'date': 'tomorrow'} if 'tomorrow' in message else {}
+
+
+class FakeGenerator:
+    def needs_entities(self, tag):
+        return tag == 'reminder'
+
+
+class FakeChatbot:
+    def __init__(self, fail_on=None):
+        self.intent_classifier = FakeClassifier(fail_on)
+        self.entity_extractor = FakeExtractor()
+        self.response_generator = FakeGenerator()
+
+
+LINES = [
+    {'id': 'a', 'message': 'hello'},
+    {'id': 'b', 'message': 'remind me tomorrow'},
+    'not json',
+    {'id': 'c', 'text': 'wrong field'},
+    {'id': 'd', 'message': 'see you tomorrow'},
+]
+
+
+class TestBulkProcessor(unittest.TestCase):
+    """Test cases for JSONL bulk processing."""
+    
+    def setUp(self):
+        """Write the input file."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.input = os.path.join(self.tmpdir.name, 'in.jsonl')
+        self.output = os.path.join(self.tmpdir.name, 'out.jsonl')
+        with open(self.input, 'w', encoding='utf-8') as f:
+            for line in LINES:
+                f.write((line if isinstance(line, str) else json.dumps(line)) + '\n')
+            f.write('\n')
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def read_output(self):
+        with open(self.output, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f]
+    
+    def test_output_in_input_order(self):
+        """Every line gets a record, in order, with chunked classification."""
+        chatbot = FakeChatbot()
+        stats = BulkProcessor(chatbot, chunk_size=2).run(self.input, self.output, progress_file=None)
+        records = self.read_output()
+        self.assertEqual([record['line'] for record in records], [1, 2, 3, 4, 5])
+        self.assertEqual(records[1]['intents'][0]['intent'], 'reminder')
+        self.assertEqual(records[1]['entities'], {'date': 'tomorrow'})
+        self.assertIn('error', records[2])
+        self.assertIn('error', records[3])
+        self.assertEqual((stats['messages'], stats['errors']), (5, 2))
+        self.assertTrue(all(len(batch) <= 2 for batch in chatbot.intent_classifier.batches))
+    
+    def test_ner_needed_only(self):
+        """With ner='needed' only intents that use entities are tagged."""
+        BulkProcessor(FakeChatbot(), ner='needed').run(self.input, self.output, progress_file=None)
+        records = self.read_output()
+        self.assertEqual(records[1]['entities'], {'date': 'tomorrow'})
+        self.assertEqual(records[4]['entities'], {})
+    
+    def test_resume_after_crash(self):
+        """A resumed run continues after the last completed chunk."""
+        with self.assertRaises(RuntimeError):
+            BulkProcessor(FakeChatbot(fail_on='see you tomorrow'), chunk_size=2).run(
+                self.input, self.output, progress_file=None
+            )
+        self.assertEqual(len(self.read_output()), 4)
+        
+        chatbot = FakeChatbot()
+        stats = BulkProcessor(chatbot, chunk_size=2).run(self.input, self.output, resume=True, progress_file=None)
+        self.assertEqual(stats['messages'], 1)
+        self.assertEqual(chatbot.intent_classifier.batches, [['see you tomorrow']])
+        self.assertEqual([record['line'] for record in self.read_output()], [1, 2, 3, 4, 5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Unit tests for the memory-mappable model bundle
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from chatbot.bundle import BundleError, write_bundle, load_bundle, ALIGNMENT
+from chatbot.numpy_backend import NumpyIntentModel, DenseLayer
+from chatbot.response_generator import ResponseGenerator
+from tests.test_response_generator import INTENTS_DATA
+
+
+def make_model(seed=0):
+    rng = np.random.default_rng(seed)
+    return NumpyIntentModel([
+        DenseLayer(rng.normal(size=(8, 5)), rng.normal(size=5), 'relu'),
+        DenseLayer(rng.normal(size=(5, 4)), rng.normal(size=4), 'softmax'),
+    ])
+
+
+class TestModelBundle(unittest.TestCase):
+    """Test cases for writing and mapping bundles."""
+    
+    def setUp(self):
+        """Write a bundle to a temporary directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'model_bundle.bin')
+        self.model = make_model()
+        self.generator = ResponseGenerator(INTENTS_DATA)
+        write_bundle(
+            self.path, self.model, [f'w{i}' for i in range(8)], ['a', 'b', 'c', 'd'],
+            self.generator.to_table(), {'greeting': ['hello']}, bundle_version='v1'
+        )
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_round_trip(self):
+        """Weights, vocabulary, classes and metadata survive a round trip."""
+        bundle = load_bundle(self.path)
+        self.assertEqual(bundle.version, 'v1')
+        self.assertEqual(bundle.words, [f'w{i}' for i in range(8)])
+        self.assertEqual(bundle.classes, ['a', 'b', 'c', 'd'])
+        self.assertEqual(bundle.intents_data(), {'intents': [{'tag': 'greeting', 'patterns': ['hello']}]})
+        x = np.random.default_rng(1).random((3, 8), dtype=np.float32)
+        np.testing.assert_allclose(bundle.intent_model.predict(x), self.model.predict(x), rtol=1e-6)
+    
+    def test_quantized_round_trip(self):
+        """Quantized weights and their scales are stored as is."""
+        quantized = self.model.quantize('int8')
+        write_bundle(self.path, quantized, ['w'] * 8, ['a', 'b', 'c', 'd'], {}, {})
+        bundle = load_bundle(self.path)
+        self.assertEqual(bundle.intent_model.precision, 'int8')
+        x = np.eye(8, dtype=np.float32)
+        np.testing.assert_allclose(bundle.intent_model.predict(x), quantized.predict(x), rtol=1e-6)
+    
+    def test_arrays_are_readonly_aligned_views(self):
+        """Arrays are views of the mapping, not copies."""
+        bundle = load_bundle(self.path)
+        for array in bundle.intent_model.to_arrays().values():
+            self.assertFalse(array.flags.writeable)
+            self.assertFalse(array.flags.owndata)
+            self.assertEqual(array.__array_interface__['data'][0] % ALIGNMENT, 0)
+    
+    def test_rewrite_keeps_existing_mapping(self):
+        """Rebuilding replaces the file, so a loaded bundle keeps its weights."""
+        bundle = load_bundle(self.path)
+        inode = os.stat(self.path).st_ino
+        x = np.eye(8, dtype=np.float32)
+        before = bundle.intent_model.predict(x)
+        write_bundle(self.path, make_model(seed=1), ['w'] * 8, ['a', 'b', 'c', 'd'], {}, {}, bundle_version='v2')
+        
+        self.assertNotEqual(os.stat(self.path).st_ino, inode)
+        np.testing.assert_array_equal(bundle.intent_model.predict(x), before)
+        self.assertEqual(load_bundle(self.path).version, 'v2')
+        self.assertEqual(os.listdir(self.tmp.name), ['model_bundle.bin'])
+    
+    def test_corruption_detected(self):
+        """A flipped byte fails the checksum."""
+        with open(self.path, 'r+b') as f:
+            f.seek(-1, os.SEEK_END)
+            last = f.read(1)
+            f.seek(-1, os.SEEK_END)
+            f.write(bytes([last[0] ^ 0xFF]))
+        with self.assertRaises(BundleError):
+            load_bundle(self.path)
+    
+    def test_not_a_bundle(self):
+        """Other files are rejected."""
+        with open(self.path, 'wb') as f:
+            f.write(b'\0' * 128)
+        with self.assertRaises(BundleError):
+            load_bundle(self.path)
+    
+    def test_response_table_rendering(self):
+        """A generator rebuilt from the table renders the same responses."""
+        restored = ResponseGenerator.from_table(load_bundle(self.path).response_table)
+        self.assertEqual(restored.entity_slots, self.generator.entity_slots)
+        entities = {'date': 'tomorrow', 'note': 'milk'}
+        for tag in self.generator.intents:
+            original = self.generator.intents[tag]
+            rebuilt = restored.intents[tag]
+            self.assertEqual(rebuilt.inputs, original.inputs)
+            for a, b in zip(original.templates, rebuilt.templates):
+                if a is None:
+                    self.assertIsNone(b)
+                else:
+                    self.assertEqual(a.render(entities), b.render(entities))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+"""
+Unit tests for the LRU cache
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from chatbot.utils.cache import LRUCache, normalize_message
+
+
+class TestLRUCache(unittest.TestCase):
+    """Test cases for LRUCache."""
+    
+    def test_hit_and_miss_counters(self):
+        """Lookups are counted as hits or misses."""
+        cache = LRUCache(2)
+        self.assertIsNone(cache.get('hi'))
+        cache.put('hi', 1)
+        self.assertEqual(cache.get('hi'), 1)
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertEqual(stats['hit_rate'], 0.5)
+    
+    def test_evicts_least_recently_used(self):
+        """The least recently used entry is evicted when full."""
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.stats()['evictions'], 1)
+        self.assertEqual(len(cache), 2)
+    
+    def test_zero_size_disables_cache(self):
+        """A cache of size 0 never stores values."""
+        cache = LRUCache(0)
+        cache.put('a', 1)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(len(cache), 0)
+    
+    def test_clear(self):
+        """Clearing drops entries but keeps counters."""
+        cache = LRUCache(4)
+        cache.put('a', 1)
+        cache.get('a')
+        cache.clear()
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.stats()['hits'], 1)
+    
+    def test_normalize_message(self):
+        """Keys ignore case and extra whitespace."""
+        self.assertEqual(normalize_message('  List   my Reminders '), 'list my reminders')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Unit tests for the compiled Keras intent model
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import patch
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+try:
+    import keras
+    from chatbot.compiled_model import CompiledIntentModel
+    KERAS_AVAILABLE = True
+except ImportError:
+    KERAS_AVAILABLE = False
+
+
+def make_keras_model(input_dim=12, classes=4):
+    return keras.Sequential([
+        keras.layers.Input(shape=(input_dim,)),
+        keras.layers.Dense(8, activation='relu'),
+        keras.layers.Dense(classes, activation='softmax'),
+    ])
+
+
+@unittest.skipUnless(KERAS_AVAILABLE, "Keras not available")
+class TestCompiledIntentModel(unittest.TestCase):
+    """Test cases for bucketed, fixed-signature inference."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build a small Keras model shared by the tests."""
+        cls.keras_model = make_keras_model()
+    
+    def setUp(self):
+        """Wrap the model with buckets 1, 4 and 8."""
+        self.model = CompiledIntentModel(self.keras_model, [8, 1, 4])
+    
+    def test_buckets(self):
+        """Batches pad up to the next bucket; oversize batches use the largest."""
+        self.assertEqual(self.model.batch_buckets, (1, 4, 8))
+        self.assertEqual([self.model.bucket_for(n) for n in (1, 2, 4, 5, 8, 30)], [1, 4, 4, 8, 8, 8])
+    
+    def test_matches_keras(self):
+        """Padded and split batches give the same probabilities as Keras."""
+        rng = np.random.default_rng(0)
+        for size in (1, 3, 8, 19):
+            x = rng.integers(0, 2, size=(size, 12)).astype(np.float32)
+            expected = self.keras_model(x, training=False).numpy()
+            result = self.model.predict(x)
+            self.assertEqual(result.shape, (size, 4))
+            np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-6)
+    
+    def test_no_retracing_after_warm_up(self):
+        """Warm-up traces each bucket once and later calls never trace."""
+        self.model.warm_up()
+        self.assertEqual(self.model.traces, 3)
+        for size in (1, 2, 5, 7, 8, 13, 40):
+            self.model.predict(np.zeros((size, 12), dtype=np.float32))
+        self.assertEqual(self.model.traces, 3)
+    
+    def test_empty_batch(self):
+        """An empty batch returns an empty result without calling the model."""
+        self.assertEqual(self.model.predict(np.zeros((0, 12))).shape, (0, 4))
+        self.assertEqual(self.model.traces, 0)
+    
+    def test_classifier_wraps_keras_models(self):
+        """IntentClassifier compiles Keras models only when enabled."""
+        from chatbot.intent_classifier import IntentClassifier
+        
+        words = [f'w{i}' for i in range(12)]
+        classes = ['a', 'b', 'c', 'd']
+        classifier = IntentClassifier(self.keras_model, words, classes)
+        self.assertIsInstance(classifier.model, CompiledIntentModel)
+        with patch.dict('config.PERFORMANCE_CONFIG', {'compile_intent_model': False}):
+            classifier = IntentClassifier(self.keras_model, words, classes)
+        self.assertIs(classifier.model, self.keras_model)
+
+
+if __name__ == '__main__':
+    unittest.main()
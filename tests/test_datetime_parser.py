@@ -7,14 +7,19 @@ from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 import sys
 import os
+from unittest.mock import patch
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from datetime_parser import (
     parse_date, parse_time, parse_datetime,
-    validate_datetime, format_datetime, extract_datetime_from_text
+    validate_datetime, format_datetime, extract_datetime_from_text,
+    find_datetime_spans, parse_datetime_bulk
 )
+import numpy as np
+import config
+from chatbot.utils import datetime_parser as parser_module
 
 class TestDateTimeParser(unittest.TestCase):
     """Test cases for datetime parsing functions."""
@@ -96,6 +101,147 @@ class TestDateTimeParser(unittest.TestCase):
         # Should extract date and time
         self.assertIsNotNone(result.get('date') or result.get('time'))
 
+class TestDateTimeScanner(unittest.TestCase):
+    """Test cases for the single-pass date/time scanner."""
+    
+    def setUp(self):
+        """Resolve relative forms against Saturday, 17 October 2026."""
+        self.today = datetime(2026, 10, 17)
+    
+    def spans(self, text):
+        return [(span.kind, span.text, span.value) for span in find_datetime_spans(text, self.today)]
+    
+    def test_dates_and_times_in_text_order(self):
+        """Every date and time is found with its resolved value."""
+        self.assertEqual(self.spans('dentist March 5th, 2027 at 9:30 a.m. then lunch at noon'), [
+            ('date', 'March 5th, 2027', datetime(2027, 3, 5)),
+            ('time', '9:30 a.m.', (9, 30)),
+            ('time', 'noon', (12, 0)),
+        ])
+    
+    def test_date_forms(self):
+        """Weekday, day-month, numeric, ISO and relative dates resolve directly."""
+        cases = {
+            'saturday': datetime(2026, 10, 17),
+            'next saturday': datetime(2026, 10, 24),
+            'on monday': datetime(2026, 10, 19),
+            '5 october': datetime(2026, 10, 5),
+            '12/25/24': datetime(2024, 12, 25),
+            '25/12/2026': datetime(2026, 12, 25),
+            '2026-11-01': datetime(2026, 11, 1),
+            'next month': datetime(2026, 11, 17),
+        }
+        for text, expected in cases.items():
+            self.assertEqual(parse_date(text, today=self.today), expected, text)
+    
+    def test_time_forms(self):
+        """Clock times and hours with am/pm resolve to whole minutes."""
+        cases = {'3pm': (15, 0), '12am': (0, 0), '12 pm': (12, 0), '7:05 P.M.': (19, 5), 'at 15:30': (15, 30)}
+        for text, expected in cases.items():
+            self.assertEqual(parse_time(text), expected, text)
+    
+    def test_invalid_and_ambiguous_text_is_skipped(self):
+        """Impossible values and look-alike words are not matched."""
+        self.assertEqual(self.spans('I sat in the sun at 25:00 on 2/30/2026'), [])
+        self.assertEqual(self.spans('may I have 10 amazing cookies'), [])
+    
+    def test_extract_combines_first_date_and_time(self):
+        """extract_datetime_from_text combines the first date and time."""
+        result = extract_datetime_from_text('party next friday 7 pm, or 9 pm', today=self.today)
+        self.assertEqual(result['datetime'], datetime(2026, 10, 23, 19, 0))
+
+
+class TestParseCache(unittest.TestCase):
+    """Test cases for the per-day parse tables and caches."""
+    
+    def setUp(self):
+        """Start from empty caches, one second before local midnight."""
+        parser_module.clear_parse_caches()
+        self.before_midnight = datetime(2026, 10, 17, 23, 59, 59).timestamp()
+    
+    def test_repeated_strings_hit_the_cache(self):
+        """A string is parsed once; relative keywords come from the day table."""
+        before = parser_module.parse_cache_stats()
+        first = parse_date('December 25')
+        self.assertEqual(parse_date('  december   25 '), first)
+        self.assertEqual(parse_time('3pm'), parse_time('at 3PM'))
+        after = parser_module.parse_cache_stats()
+        self.assertEqual(after['date']['hits'] - before['date']['hits'], 1)
+        self.assertEqual(after['time']['hits'] - before['time']['hits'], 1)
+        
+        parse_date('tomorrow')
+        self.assertEqual(parser_module.parse_cache_stats()['date']['misses'], after['date']['misses'])
+    
+    def test_day_table(self):
+        """Weekday phrases resolve like the scanner does."""
+        table = parser_module.DayAnchor().current(self.before_midnight).table
+        self.assertEqual(table['tomorrow'], datetime(2026, 10, 18))
+        self.assertEqual(table['saturday'], datetime(2026, 10, 17))
+        self.assertEqual(table['next saturday'], datetime(2026, 10, 24))
+        self.assertEqual(table['on monday'], datetime(2026, 10, 19))
+    
+    def test_rolls_over_at_midnight(self):
+        """Relative and cached dates move to the next day after midnight."""
+        with patch('chatbot.utils.datetime_parser.time.time', return_value=self.before_midnight):
+            self.assertEqual(parse_date('tomorrow'), datetime(2026, 10, 18))
+            self.assertEqual(parse_date('next week please'), datetime(2026, 10, 24))
+        with patch('chatbot.utils.datetime_parser.time.time', return_value=self.before_midnight + 2):
+            self.assertEqual(parse_date('tomorrow'), datetime(2026, 10, 19))
+            self.assertEqual(parse_date('next week please'), datetime(2026, 10, 25))
+    
+    def test_timezone_selects_the_day(self):
+        """The same instant falls on different days in different timezones."""
+        anchor = parser_module.DayAnchor()
+        now = datetime(2026, 10, 17, 12, 0).timestamp()
+        with patch.dict(config.DATETIME_CONFIG, {'default_timezone': 'Pacific/Kiritimati'}):
+            ahead = anchor.current(now)
+        with patch.dict(config.DATETIME_CONFIG, {'default_timezone': 'Etc/GMT+12'}):
+            behind = anchor.current(now)
+        self.assertEqual(ahead.today - behind.today, timedelta(days=1))
+        self.assertEqual(anchor.rollovers, 2)
+
+
+class TestParseDatetimeBulk(unittest.TestCase):
+    """Test cases for bulk date/time normalization."""
+    
+    def setUp(self):
+        """Resolve against a fixed Saturday."""
+        self.today = datetime(2026, 10, 17)
+    
+    def test_matches_parse_datetime(self):
+        """Every row resolves as parse_datetime would, duplicates included."""
+        dates = ['tomorrow', 'Next Monday', 'next saturday', 'march 5th', '12/25/26', '13/05/2026',
+                 'next month', 'next week please', '2026-11-02 14:30', 'tomorrow', 'TOMORROW']
+        times = ['3pm', 'at 9:30 am', 'noon', None, '7 pm', '16h30', '', '4:15pm', '', '3pm', '10']
+        values, valid = parse_datetime_bulk(dates, times, today=self.today)
+        self.assertTrue(valid.all())
+        for date_string, time_string, value in zip(dates, times, values):
+            expected = parse_date(date_string, today=self.today)
+            parsed_time = parse_time(time_string) if time_string else None
+            if parsed_time:
+                expected = expected.replace(hour=parsed_time[0], minute=parsed_time[1])
+            self.assertEqual(value, np.datetime64(expected, 's'), date_string)
+    
+    def test_validity_mask(self):
+        """Missing and impossible dates are NaT; an unparseable time is ignored."""
+        values, valid = parse_datetime_bulk(
+            ['2026-02-30', None, '', 'friday', '2024-02-29'], ['', '', '', '25:00', ''], today=self.today
+        )
+        self.assertEqual(valid.tolist(), [False, False, False, True, True])
+        self.assertTrue(np.isnat(values[:3]).all())
+        self.assertEqual(values[3], np.datetime64('2026-10-23T00:00:00'))
+    
+    def test_month_steps_clip_to_month_end(self):
+        """'next month' on the 31st lands on the last day of the next month."""
+        values, _ = parse_datetime_bulk(['next month', 'last month'], today=datetime(2026, 3, 31))
+        self.assertEqual(values.tolist(), [datetime(2026, 4, 30), datetime(2026, 2, 28)])
+    
+    def test_length_mismatch(self):
+        """Date and time sequences must have the same length."""
+        with self.assertRaises(ValueError):
+            parse_datetime_bulk(['today'], ['3pm', '4pm'])
+
+
 if __name__ == '__main__':
     unittest.main()
 
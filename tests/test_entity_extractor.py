@@ -0,0 +1,116 @@
+"""
+Unit tests for the EntityExtractor module
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from chatbot.entity_extractor import EntityExtractor
+
+try:
+    import spacy
+    SPACY_AVAILABLE = True
+except ImportError:
+    SPACY_AVAILABLE = False
+
+
+def build_rule_based_nlp():
+    """Build a small pipeline whose entities are predictable."""
+    nlp = spacy.blank('en')
+    ruler = nlp.add_pipe('entity_ruler')
+    ruler.add_patterns([
+        {'label': 'date', 'pattern': 'tomorrow'},
+        {'label': 'date', 'pattern': 'friday'},
+        {'label': 'time', 'pattern': '3pm'},
+    ])
+    return nlp
+
+
+class PoisonedNLP:
+    """Pipeline wrapper that fails on any batch or message containing 'poison'."""
+    
+    def __init__(self, nlp):
+        self.nlp = nlp
+        self.pipe_calls = 0
+    
+    def __call__(self, text):
+        if 'poison' in text:
+            raise ValueError('poisoned message')
+        return self.nlp(text)
+    
+    def pipe(self, texts, batch_size=2, n_process=1):
+        self.pipe_calls += 1
+        texts = iter(texts)
+        while True:
+            batch = [text for _, text in zip(range(batch_size), texts)]
+            if not batch:
+                return
+            if any('poison' in text for text in batch):
+                raise ValueError('poisoned batch')
+            yield from self.nlp.pipe(batch)
+
+
+@unittest.skipUnless(SPACY_AVAILABLE, "spaCy not available")
+class TestEntityExtractor(unittest.TestCase):
+    """Test cases for entity extraction."""
+    
+    def setUp(self):
+        """Set up an extractor over a rule-based pipeline."""
+        self.extractor = EntityExtractor(build_rule_based_nlp())
+        self.messages = [
+            'call mom tomorrow at 3pm',
+            '',
+            'hello',
+            'tomorrow or friday',
+            '   ',
+        ]
+    
+    def test_extract_batch_matches_extract(self):
+        """Batched results equal per-message results, in order."""
+        expected = [self.extractor.extract(m) for m in self.messages]
+        result = list(self.extractor.extract_batch(self.messages, batch_size=2))
+        self.assertEqual(result, expected)
+        self.assertEqual(result[0], {'date': 'tomorrow', 'time': '3pm'})
+        self.assertEqual(result[3], {'date': 'tomorrow'})
+    
+    def test_extract_batch_keeps_all_entities(self):
+        """keep_first_entity_only=False collects every entity per label."""
+        self.extractor.keep_first_only = False
+        result = list(self.extractor.extract_batch(self.messages))
+        self.assertEqual(result[3], {'date': ['tomorrow', 'friday']})
+        self.assertEqual(result, [self.extractor.extract(m) for m in self.messages])
+    
+    def test_extract_batch_is_lazy(self):
+        """Results are yielded as a generator over any iterable."""
+        batch = self.extractor.extract_batch(iter(['friday']))
+        self.assertEqual(next(batch), {'date': 'friday'})
+    
+    def test_extract_batch_survives_failing_batch(self):
+        """A failing batch falls back to per-message extraction; only the bad message gets {}."""
+        expected = [self.extractor.extract(m) for m in self.messages]
+        self.extractor.set_model(PoisonedNLP(build_rule_based_nlp()))
+        messages = self.messages[:3] + ['poison friday'] + self.messages[3:]
+        result = list(self.extractor.extract_batch(messages, batch_size=2))
+        self.assertEqual(result, expected[:3] + [{}] + expected[3:])
+        # Streaming resumed after the failed batch
+        self.assertEqual(self.extractor.nlp.pipe_calls, 2)
+    
+    def test_extract_batch_strict(self):
+        """on_error='raise' re-raises instead of falling back."""
+        self.extractor.set_model(PoisonedNLP(build_rule_based_nlp()))
+        with self.assertRaises(ValueError):
+            list(self.extractor.extract_batch(['friday', 'poison'], on_error='raise'))
+    
+    def test_set_model_invalidates_cache(self):
+        """Replacing the model drops cached entities."""
+        self.extractor.extract('tomorrow')
+        self.extractor.set_model(spacy.blank('en'))
+        self.assertEqual(self.extractor.extract('tomorrow'), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
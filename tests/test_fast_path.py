@@ -0,0 +1,81 @@
+"""
+Unit tests for the fast-path matcher
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import config
+from chatbot.fast_path import AhoCorasick, FastPathMatcher, normalize_pattern
+
+
+class TestAhoCorasick(unittest.TestCase):
+    """Test cases for the keyword automaton."""
+    
+    def test_find_all_overlapping(self):
+        """Overlapping keywords are all reported with their start index."""
+        automaton = AhoCorasick(['he', 'she', 'his', 'hers'])
+        self.assertEqual(
+            sorted(automaton.find_all('ushers')),
+            [(1, 'she'), (2, 'he'), (2, 'hers')]
+        )
+    
+    def test_contains_any_matches_substring_check(self):
+        """Results agree with a naive substring scan."""
+        keywords = config.CHATBOT_CONFIG['goodbye_statements']
+        automaton = AhoCorasick(keywords)
+        for text in ['ok bye', 'see you soon', 'my friend', 'hello there', '', 'goodbye!']:
+            self.assertEqual(
+                automaton.contains_any(text),
+                any(word in text for word in keywords),
+                text
+            )
+
+
+class TestFastPathMatcher(unittest.TestCase):
+    """Test cases for exact pattern matching."""
+    
+    def setUp(self):
+        """Set up a matcher over a small intents file."""
+        intents_data = {'intents': [
+            {'tag': 'greeting', 'patterns': [{'text': 'hello'}, 'Good morning']},
+            {'tag': 'listing_reminders', 'patterns': [
+                {'text': 'What are my reminders?'},
+                {'text': 'What are my upcoming appointments?'}
+            ]},
+            {'tag': 'listing_events', 'patterns': [{'text': 'What are my upcoming appointments?'}]},
+            {'tag': 'setting_reminder', 'patterns': [{'text': 'Remind me on {date}'}]},
+        ]}
+        self.matcher = FastPathMatcher(intents_data, ['bye', 'exit'])
+    
+    def test_exact_match_is_normalized(self):
+        """Case, whitespace and trailing punctuation are ignored."""
+        self.assertEqual(self.matcher.match('  HELLO!'), 'greeting')
+        self.assertEqual(self.matcher.match('what are my reminders'), 'listing_reminders')
+        self.assertEqual(normalize_pattern('Good   Morning?!'), 'good morning')
+    
+    def test_ambiguous_and_placeholder_patterns_excluded(self):
+        """Patterns shared by intents or with slots go to the classifier."""
+        self.assertIsNone(self.matcher.match('What are my upcoming appointments?'))
+        self.assertIsNone(self.matcher.match('Remind me on {date}'))
+    
+    def test_stats(self):
+        """Hits and misses are counted."""
+        self.matcher.match('hello')
+        self.matcher.match('hello world')
+        stats = self.matcher.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertEqual(stats['hit_rate'], 0.5)
+    
+    def test_is_goodbye(self):
+        """Goodbye keywords are found anywhere in the message."""
+        self.assertTrue(self.matcher.is_goodbye('OK, Bye now'))
+        self.assertFalse(self.matcher.is_goodbye('hello'))
+
+
+if __name__ == '__main__':
+    unittest.main()
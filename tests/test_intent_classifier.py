@@ -0,0 +1,131 @@
+"""
+Unit tests for the IntentClassifier module
+"""
+
+import unittest
+from unittest import mock
+import sys
+import os
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from chatbot.intent_classifier import IntentClassifier
+from chatbot.numpy_backend import NumpyIntentModel, DenseLayer
+
+
+class FakeModel:
+    """Linear stand-in for the Keras model that records predict() calls."""
+    
+    def __init__(self, weights):
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.calls = 0
+    
+    def predict(self, x, batch_size=None, verbose=0):
+        self.calls += 1
+        logits = np.asarray(x, dtype=np.float32) @ self.weights
+        exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+        return exp / exp.sum(axis=1, keepdims=True)
+
+
+class TestIntentClassifier(unittest.TestCase):
+    """Test cases for intent classification."""
+    
+    def setUp(self):
+        """Set up a classifier over a tiny vocabulary."""
+        words = ['bye', 'hello', 'hi', 'reminder', 'set']
+        classes = ['goodbye', 'greeting', 'setting_reminder']
+        weights = [
+            [6, 0, 0],
+            [0, 6, 0],
+            [0, 6, 0],
+            [0, 0, 4],
+            [0, 0, 4],
+        ]
+        self.model = FakeModel(weights)
+        self.classifier = IntentClassifier(self.model, words, classes)
+        patcher = mock.patch.object(
+            self.classifier.preprocessor, 'clean_up_sentence', side_effect=str.split
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_predict_batch_matches_predict(self):
+        """Batched results equal per-sentence results."""
+        sentences = ['hello', 'set reminder', 'bye', 'unknown words here']
+        expected = [self.classifier.predict(s) for s in sentences]
+        self.assertEqual(self.classifier.predict_batch(sentences), expected)
+    
+    def test_predict_batch_single_forward_pass(self):
+        """All sentences share one model call."""
+        self.classifier.predict_batch(['hi', 'bye', 'set reminder'])
+        self.assertEqual(self.model.calls, 1)
+    
+    def test_predict_batch_empty_sentences(self):
+        """Blank sentences keep their slot with an empty result."""
+        result = self.classifier.predict_batch(['', 'hello', '   '])
+        self.assertEqual(result[0], [])
+        self.assertEqual(result[2], [])
+        self.assertEqual(result[1][0]['intent'], 'greeting')
+    
+    def test_predict_batch_no_sentences(self):
+        """An empty batch does not call the model."""
+        self.assertEqual(self.classifier.predict_batch([]), [])
+        self.assertEqual(self.model.calls, 0)
+    
+    def test_repeated_message_served_from_cache(self):
+        """Repeated messages skip the model and get independent copies."""
+        first = self.classifier.predict('Hello')
+        first[0]['intent'] = 'modified'
+        second = self.classifier.predict('  hello ')
+        self.assertEqual(self.model.calls, 1)
+        self.assertEqual(second[0]['intent'], 'greeting')
+        self.assertEqual(self.classifier.cache.stats()['hits'], 1)
+    
+    def test_predict_batch_only_runs_cache_misses(self):
+        """Cached sentences are not part of the batch forward pass."""
+        self.classifier.predict('hello')
+        result = self.classifier.predict_batch(['hello', 'bye'])
+        self.assertEqual(self.model.calls, 2)
+        self.assertEqual([r[0]['intent'] for r in result], ['greeting', 'goodbye'])
+    
+    def test_set_model_invalidates_cache(self):
+        """Replacing the model drops cached predictions."""
+        self.assertEqual(self.classifier.predict('hello')[0]['intent'], 'greeting')
+        # Shifting the class columns makes the new model map 'hello' to setting_reminder
+        new_model = FakeModel(np.roll(self.model.weights, 1, axis=1))
+        self.classifier.set_model(new_model)
+        self.assertEqual(len(self.classifier.cache), 0)
+        self.assertEqual(len(self.classifier.preprocessor.cache), 0)
+        self.assertEqual(self.classifier.predict('hello')[0]['intent'], 'setting_reminder')
+        self.assertEqual(new_model.calls, 1)
+    
+    def test_bag_of_words_batch_matches_rows(self):
+        """Batch matrix rows equal single-sentence bags."""
+        preprocessor = self.classifier.preprocessor
+        sentences = ['hi hello', 'set set reminder', 'nothing known']
+        bags = preprocessor.bag_of_words_batch(sentences)
+        for row, sentence in zip(bags, sentences):
+            np.testing.assert_array_equal(row, preprocessor.bag_of_words(sentence))
+        self.assertEqual(bags[2].sum(), 0)
+    
+    def test_sparse_model_matches_dense_model(self):
+        """Models with predict_sparse give the same intents as dense input."""
+        sparse_model = NumpyIntentModel([DenseLayer(self.model.weights, np.zeros(3), 'softmax')])
+        sparse_classifier = IntentClassifier(sparse_model, self.classifier.preprocessor.words, self.classifier.classes)
+        sparse_classifier.preprocessor = self.classifier.preprocessor
+        self.assertTrue(sparse_classifier.sparse_input)
+        
+        sentences = ['hello', 'set reminder', '', 'unknown']
+        expected = self.classifier.predict_batch(sentences)
+        result = sparse_classifier.predict_batch(sentences)
+        self.assertEqual([[r['intent'] for r in row] for row in result],
+                         [[r['intent'] for r in row] for row in expected])
+        for row, expected_row in zip(result, expected):
+            for r, e in zip(row, expected_row):
+                self.assertAlmostEqual(r['probability'], e['probability'], places=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Unit tests for the ModelLoader module
+"""
+
+import unittest
+import subprocess
+import sys
+import os
+import tempfile
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import config
+
+try:
+    import spacy
+    from chatbot.model_loader import compact_ner_exclude
+    SPACY_AVAILABLE = True
+except ImportError:
+    SPACY_AVAILABLE = False
+
+
+@unittest.skipUnless(SPACY_AVAILABLE, "spaCy not available")
+class TestCompactNerExclude(unittest.TestCase):
+    """Test cases for the compact NER load profile."""
+    
+    def test_excludes_everything_but_ner(self):
+        """Test that other components and the vocab are excluded."""
+        nlp = spacy.blank('en')
+        nlp.add_pipe('sentencizer')
+        nlp.add_pipe('ner')
+        nlp.initialize()
+        with tempfile.TemporaryDirectory() as model_dir:
+            nlp.to_disk(model_dir)
+            exclude = compact_ner_exclude(model_dir)
+            self.assertEqual(exclude, ['sentencizer', 'vocab'])
+            compact = spacy.load(model_dir, exclude=exclude)
+            self.assertEqual(compact.pipe_names, ['ner'])
+
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test cases for import-time cost."""
+    
+    def test_import_does_not_load_frameworks(self):
+        """Importing the package and Chatbot class loads neither spaCy nor TensorFlow."""
+        code = (
+            "import sys; from chatbot import Chatbot; "
+            "print(any(name in sys.modules for name in ('spacy', 'tensorflow', 'keras')))"
+        )
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        output = subprocess.run(
+            [sys.executable, '-c', code], cwd=root, capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), 'False')
+
+
+@unittest.skipUnless(SPACY_AVAILABLE, "spaCy not available")
+class TestLoadAll(unittest.TestCase):
+    """Test cases for loading every artifact."""
+    
+    def test_parallel_load_reports_phases(self):
+        """Parallel loading returns every artifact and times each phase."""
+        from chatbot.model_loader import ModelLoader
+        
+        with patch.dict('config.PERFORMANCE_CONFIG', {
+            'intent_backend': 'numpy', 'parallel_model_loading': True, 'use_model_bundle': False
+        }):
+            loader = ModelLoader()
+            nlp, intent_model, intents_data, words, classes = loader.load_all()
+        self.assertIn('ner', nlp.pipe_names)
+        self.assertEqual(intent_model.output_dim, len(classes))
+        self.assertEqual(intent_model.input_dim, len(words))
+        self.assertTrue(intents_data['intents'])
+        self.assertEqual(
+            set(loader.timings.summary()),
+            {'imports', 'ner_model', 'intent_model', 'intents_data', 'words', 'classes', 'total'}
+        )
+    
+    @unittest.skipUnless(
+        os.path.exists(config.MODEL_PATHS['model_bundle']), 'Run training/build_bundle.py first'
+    )
+    def test_bundle_replaces_separate_artifacts(self):
+        """With a bundle, the intent model, vocabulary and classes come from one file."""
+        from chatbot.model_loader import ModelLoader
+        
+        with patch.dict('config.PERFORMANCE_CONFIG', {'intent_backend': 'numpy', 'use_model_bundle': True}):
+            loader = ModelLoader()
+            nlp, intent_model, intents_data, words, classes = loader.load_all()
+        self.assertIsNotNone(loader.bundle)
+        self.assertEqual(intent_model.output_dim, len(classes))
+        self.assertEqual(intent_model.input_dim, len(words))
+        self.assertEqual(set(loader.timings.summary()), {'imports', 'ner_model', 'bundle', 'total'})
+
+
+if __name__ == '__main__':
+    unittest.main()
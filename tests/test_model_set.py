@@ -0,0 +1,229 @@
+"""
+Unit tests for model sets and hot model reload
+"""
+
+import threading
+import unittest
+import sys
+import os
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from chatbot.chatbot import Chatbot
+from chatbot.entity_extractor import EntityExtractor
+from chatbot.model_set import ModelSet, ReloadError, smoke_messages
+from chatbot.fast_path import FastPathMatcher
+from chatbot.response_generator import ResponseGenerator
+
+INTENTS_DATA = {'intents': [
+    {'tag': 'greeting', 'patterns': ['hello', 'hi there'], 'responses': [{'text': 'Hello!'}]},
+    {'tag': 'thanks', 'patterns': ['thank you'], 'responses': [{'text': 'You are welcome'}]},
+]}
+
+
+class FakeClassifier:
+    """Classifies by pattern lookup; predict() can block until released."""
+    
+    def __init__(self, tags=None, probability=0.9, block=None):
+        self.tags = tags or {'hello': 'greeting', 'hi there': 'greeting', 'thank you': 'thanks'}
+        self.classes = ['greeting', 'thanks']
+        self.probability = probability
+        self.block = block
+        self.started = threading.Event()
+        self.cleared = 0
+    
+    def predict(self, message):
+        self.started.set()
+        if self.block is not None:
+            self.block.wait(5)
+        return self.predict_batch([message])[0]
+    
+    def predict_batch(self, messages, log=True):
+        return [[{'intent': self.tags.get(message, 'greeting'), 'probability': self.probability}] for message in messages]
+    
+    def warm_up(self):
+        return 0.0
+    
+    def clear_cache(self):
+        self.cleared += 1
+
+
+class FakeExtractor:
+    """Finds no entities."""
+    
+    def __init__(self):
+        self.cleared = 0
+        self.extracted = 0
+    
+    def extract(self, message):
+        self.extracted += 1
+        return {}
+    
+    def extract_batch(self, messages, on_error='skip'):
+        return [{} for _ in messages]
+    
+    def warm_up(self):
+        return 0.0
+    
+    def clear_cache(self):
+        self.cleared += 1
+
+
+def broken_nlp(text):
+    raise RuntimeError('NER model is broken')
+
+
+broken_nlp.pipe = lambda texts, **kwargs: map(broken_nlp, texts)
+
+
+def make_set(version, classifier=None, responses=None, extractor=None):
+    intents = INTENTS_DATA
+    if responses is not None:
+        intents = {'intents': [dict(intent, responses=[{'text': responses}]) for intent in INTENTS_DATA['intents']]}
+    return ModelSet(
+        classifier or FakeClassifier(), extractor or FakeExtractor(), ResponseGenerator(intents),
+        FastPathMatcher({'intents': []}, []), version=version,
+        smoke_batch=smoke_messages(INTENTS_DATA, 10)
+    )
+
+
+class TestSmokeTest(unittest.TestCase):
+    """Test cases for validating a model set."""
+    
+    def test_smoke_messages_cover_intents_first(self):
+        """The first pattern of every intent comes before second patterns."""
+        self.assertEqual(
+            smoke_messages(INTENTS_DATA, 2), [('hello', 'greeting'), ('thank you', 'thanks')]
+        )
+        self.assertEqual(len(smoke_messages(INTENTS_DATA, 10)), 3)
+    
+    def test_good_set_passes(self):
+        """A set that classifies its own patterns passes."""
+        self.assertEqual(make_set('v1').smoke_test(), {'messages': 3, 'accuracy': 1.0})
+    
+    def test_low_accuracy_rejected(self):
+        """A set that misclassifies its patterns is rejected."""
+        classifier = FakeClassifier(tags={'thank you': 'greeting', 'hi there': 'thanks'})
+        with self.assertRaises(ReloadError):
+            make_set('v1', classifier).smoke_test(min_accuracy=0.8)
+    
+    def test_invalid_probabilities_rejected(self):
+        """NaN probabilities are rejected even when the top intent is right."""
+        with self.assertRaises(ReloadError):
+            make_set('v1', FakeClassifier(probability=float('nan'))).smoke_test(min_accuracy=0.0)
+    
+    def test_component_error_rejected(self):
+        """An exception in a component becomes a ReloadError."""
+        models = make_set('v1')
+        models.entity_extractor.extract_batch = lambda messages, on_error='skip': 1 / 0
+        with self.assertRaises(ReloadError):
+            models.smoke_test()
+
+
+class TestChatbotReload(unittest.TestCase):
+    """Test cases for swapping model sets under a running chatbot."""
+    
+    def setUp(self):
+        """Create a chatbot around a fake model set."""
+        self.chatbot = Chatbot(models=make_set('v1', responses='old'))
+    
+    def tearDown(self):
+        self.chatbot.close()
+    
+    def test_reload_swaps_and_clears_caches(self):
+        """A passing set becomes active and both sets' caches are cleared."""
+        old = self.chatbot.models
+        new = make_set('v2', responses='new')
+        result = self.chatbot.reload(new)
+        
+        self.assertEqual((result['previous_version'], result['version']), ('v1', 'v2'))
+        self.assertIs(self.chatbot.models, new)
+        self.assertEqual(self.chatbot.model_info()['reloads'], 1)
+        self.assertEqual(old.intent_classifier.cleared, 1)
+        self.assertEqual(new.entity_extractor.cleared, 1)
+        self.assertEqual(self.chatbot.process_message('thank you'), 'new')
+    
+    def test_rejected_set_keeps_current(self):
+        """A set failing its smoke batch is not swapped in."""
+        bad = make_set('v2', FakeClassifier(tags={'hello': 'thanks', 'hi there': 'thanks'}))
+        with self.assertRaises(ReloadError):
+            self.chatbot.reload(bad)
+        self.assertEqual(self.chatbot.model_version, 'v1')
+        self.assertEqual(self.chatbot.reloads, 0)
+    
+    def test_failing_ner_rejected(self):
+        """A NER model that fails on every message is not swapped in."""
+        bad = make_set('v2', extractor=EntityExtractor(broken_nlp))
+        with patch('builtins.print'), self.assertRaises(ReloadError):
+            self.chatbot.reload(bad)
+        self.assertEqual(self.chatbot.model_version, 'v1')
+        self.assertEqual(self.chatbot.reloads, 0)
+    
+    def test_load_failure_keeps_current(self):
+        """A loader that exits the process becomes a ReloadError."""
+        with patch('chatbot.chatbot.ModelSet.load', side_effect=SystemExit(1)):
+            with self.assertRaises(ReloadError):
+                self.chatbot.reload()
+        self.assertEqual(self.chatbot.model_version, 'v1')
+    
+    def test_in_flight_request_finishes_on_old_set(self):
+        """A request that started before the swap is answered by the old set."""
+        release = threading.Event()
+        classifier = FakeClassifier(block=release)
+        self.chatbot.models = make_set('v1', classifier, responses='old')
+        replies = []
+        worker = threading.Thread(target=lambda: replies.append(self.chatbot.process_message('thank you')))
+        worker.start()
+        classifier.started.wait(5)
+        
+        self.chatbot.reload(make_set('v2', responses='new'))
+        release.set()
+        worker.join(5)
+        self.assertEqual(replies, ['old'])
+        self.assertEqual(self.chatbot.process_message('thank you'), 'new')
+
+
+class TestConcurrentStages(unittest.TestCase):
+    """Test cases for overlapping NER with intent classification."""
+    
+    def make_chatbot(self, always_run_ner):
+        with patch.dict('config.PERFORMANCE_CONFIG', {'concurrent_stages': True, 'use_fast_path': False}), \
+                patch.dict('config.NER_CONFIG', {'always_run_ner': always_run_ner}):
+            chatbot = Chatbot(models=make_set('v1'))
+        self.addCleanup(chatbot.close)
+        return chatbot
+    
+    def test_no_speculative_ner_when_intents_lack_slots(self):
+        """NER is not started for intents that never use entities."""
+        chatbot = self.make_chatbot(always_run_ner=False)
+        self.assertFalse(chatbot.models.entities_always_needed())
+        with patch.object(chatbot.executor, 'submit') as submit:
+            chatbot.process_message('thank you', 'alice')
+        submit.assert_not_called()
+        self.assertEqual(chatbot.entity_extractor.extracted, 0)
+    
+    def test_overlap_when_ner_always_runs(self):
+        """With always_run_ner the NER stage runs on the stage pool."""
+        chatbot = self.make_chatbot(always_run_ner=True)
+        self.assertEqual(chatbot.process_message('thank you', 'alice'), 'You are welcome')
+        self.assertEqual(chatbot.entity_extractor.extracted, 1)
+    
+    def test_speculates_once_most_messages_need_ner(self):
+        """Once recent messages mostly need entities, NER starts before the intent is known."""
+        chatbot = self.make_chatbot(always_run_ner=False)
+        chatbot.models.response_generator.entity_slots['greeting'] = {'date'}
+        with patch.object(chatbot.executor, 'submit', wraps=chatbot.executor.submit) as submit:
+            chatbot.process_message('hello', 'alice')
+            submit.assert_not_called()
+            while chatbot.ner_need_rate < chatbot.speculative_ner_threshold:
+                chatbot.process_message('hello', 'alice')
+            calls = submit.call_count
+            # Speculative NER for an intent without slots is discarded
+            self.assertEqual(chatbot.process_message('thank you', 'alice'), 'You are welcome')
+            self.assertEqual(submit.call_count, calls + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+"""
+Unit tests for the NumPy intent inference backend
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import config
+import tempfile
+import tracemalloc
+from chatbot.numpy_backend import NumpyIntentModel, DenseLayer, QuantizedDenseLayer
+from chatbot.utils.preprocessor import SparseBatch, sparse_to_dense
+
+MODEL_PATH = config.MODEL_PATHS['intents_model']
+
+try:
+    from keras.models import load_model
+    KERAS_AVAILABLE = os.path.exists(MODEL_PATH)
+except Exception:
+    KERAS_AVAILABLE = False
+
+
+class TestNumpyIntentModel(unittest.TestCase):
+    """Test cases for the NumPy forward pass."""
+    
+    def test_forward_pass(self):
+        """Dense layers apply kernel, bias and activation in order."""
+        model = NumpyIntentModel([
+            DenseLayer(np.eye(2), np.array([-1.0, 0.0]), 'relu'),
+            DenseLayer(np.eye(2), np.zeros(2), 'softmax'),
+        ])
+        result = model.predict(np.array([[0.5, 1.0]]))
+        expected = np.exp([0.0, 1.0]) / np.exp([0.0, 1.0]).sum()
+        np.testing.assert_allclose(result[0], expected, rtol=1e-6)
+    
+    def test_unsupported_activation(self):
+        """Unknown activations are rejected at construction."""
+        with self.assertRaises(ValueError):
+            DenseLayer(np.eye(2), np.zeros(2), 'gelu')
+    
+    def test_predict_sparse_matches_dense(self):
+        """Gathering kernel rows gives the same output as the dense matmul."""
+        rng = np.random.default_rng(1)
+        model = NumpyIntentModel([
+            DenseLayer(rng.normal(size=(10, 6)), rng.normal(size=6), 'relu'),
+            DenseLayer(rng.normal(size=(6, 3)), rng.normal(size=3), 'softmax'),
+        ])
+        # Rows 0 and 3 are empty, row 4 is the last and non-empty
+        batch = SparseBatch(
+            np.array([0, 0, 2, 5, 5, 6]),
+            np.array([1, 7, 0, 2, 9, 4]),
+            (5, 10)
+        )
+        np.testing.assert_allclose(
+            model.predict_sparse(batch),
+            model.predict(sparse_to_dense(batch)),
+            rtol=1e-5
+        )
+    
+    def test_predict_sparse_all_empty(self):
+        """A batch without active columns only applies the biases."""
+        model = NumpyIntentModel([DenseLayer(np.ones((4, 2)), np.array([1.0, 2.0]))])
+        batch = SparseBatch(np.zeros(3, dtype=np.intp), np.zeros(0, dtype=np.intp), (2, 4))
+        np.testing.assert_array_equal(model.predict_sparse(batch), [[1.0, 2.0], [1.0, 2.0]])
+    
+    def _random_model(self, seed=2):
+        rng = np.random.default_rng(seed)
+        return NumpyIntentModel([
+            DenseLayer(rng.normal(size=(40, 16)), rng.normal(size=16), 'relu'),
+            DenseLayer(rng.normal(size=(16, 5)), rng.normal(size=5), 'softmax'),
+        ])
+    
+    def test_quantize_int8_per_channel(self):
+        """int8 weights reconstruct each column within half a quantization step."""
+        model = self._random_model()
+        quantized = model.quantize('int8')
+        for layer, q_layer in zip(model.layers, quantized.layers):
+            self.assertEqual(q_layer.kernel.dtype, np.int8)
+            self.assertEqual(q_layer.scale.shape, (layer.units,))
+            restored = q_layer.kernel.astype(np.float32) * q_layer.scale
+            self.assertTrue(np.all(np.abs(restored - layer.kernel) <= q_layer.scale / 2 + 1e-6))
+        self.assertLess(quantized.nbytes, model.nbytes / 2)
+    
+    def test_quantized_outputs_close(self):
+        """Reduced-precision models stay close to float32, dense and sparse."""
+        model = self._random_model()
+        batch = SparseBatch(np.array([0, 3, 3, 7]), np.array([1, 5, 9, 0, 2, 30, 39]), (3, 40))
+        expected = model.predict(sparse_to_dense(batch))
+        for precision, tolerance in (('float16', 1e-2), ('int8', 5e-2)):
+            quantized = model.quantize(precision)
+            self.assertEqual(quantized.precision, precision)
+            np.testing.assert_allclose(quantized.predict(sparse_to_dense(batch)), expected, atol=tolerance)
+            np.testing.assert_allclose(quantized.predict_sparse(batch), expected, atol=tolerance)
+    
+    def test_npz_round_trip(self):
+        """Saved models load back with identical weights."""
+        model = self._random_model()
+        for precision in ('float32', 'float16', 'int8'):
+            quantized = model.quantize(precision)
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, 'model.npz')
+                quantized.save_npz(path)
+                loaded = NumpyIntentModel.load_npz(path)
+            self.assertEqual(loaded.precision, precision)
+            for a, b in zip(quantized.layers, loaded.layers):
+                np.testing.assert_array_equal(a.kernel, b.kernel)
+                self.assertEqual(a.activation, b.activation)
+    
+    def test_int8_requires_scale(self):
+        """int8 layers cannot be built without scales."""
+        with self.assertRaises(ValueError):
+            QuantizedDenseLayer(np.zeros((2, 2)), np.zeros(2), precision='int8')
+    
+    def test_quantized_call_converts_only_active_rows(self):
+        """Calls on a bag of words do not upcast the whole kernel."""
+        rng = np.random.default_rng(3)
+        dense = DenseLayer(rng.normal(size=(2000, 500)), rng.normal(size=500))
+        layer = QuantizedDenseLayer.from_dense(dense, 'int8')
+        x = np.zeros((4, 2000), dtype=np.float32)
+        x[:, rng.choice(2000, 20, replace=False)] = 1.0
+        layer(x)
+        
+        tracemalloc.start()
+        try:
+            result = layer(x)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        np.testing.assert_allclose(result, layer.dequantize()(x), rtol=1e-5, atol=1e-5)
+        # A float32 copy of the kernel would be 4 MB
+        self.assertLess(peak, 2000 * 500 * 4 / 20)
+    
+    def test_for_inference(self):
+        """Only the layers after the first are dequantized for serving."""
+        model = self._random_model()
+        batch = SparseBatch(np.array([0, 3, 3, 7]), np.array([1, 5, 9, 0, 2, 30, 39]), (3, 40))
+        self.assertIs(model.for_inference(), model)
+        for precision in ('float16', 'int8'):
+            quantized = model.quantize(precision)
+            served = quantized.for_inference()
+            # The first kernel is shared, not copied (bundles keep it memory-mapped)
+            self.assertIs(served.layers[0].kernel, quantized.layers[0].kernel)
+            self.assertEqual(served.precision, precision)
+            for layer in served.layers[1:]:
+                self.assertEqual(layer.kernel.dtype, np.float32)
+            np.testing.assert_allclose(served.predict_sparse(batch), quantized.predict_sparse(batch), rtol=1e-5)
+            np.testing.assert_allclose(served.predict(sparse_to_dense(batch)), quantized.predict(sparse_to_dense(batch)), rtol=1e-5)
+    
+    @unittest.skipUnless(KERAS_AVAILABLE, "Keras model not available")
+    def test_parity_with_keras(self):
+        """NumPy output matches Keras output for the trained model."""
+        keras_model = load_model(MODEL_PATH)
+        numpy_model = NumpyIntentModel.from_h5(MODEL_PATH)
+        
+        rng = np.random.default_rng(0)
+        x = (rng.random((64, numpy_model.input_dim)) < 0.03).astype(np.float32)
+        x[0] = 0  # Empty bag of words
+        
+        expected = keras_model.predict(x, verbose=0)
+        result = numpy_model.predict(x)
+        
+        self.assertEqual(result.shape, expected.shape)
+        np.testing.assert_allclose(result, expected, atol=1e-5)
+        np.testing.assert_array_equal(result.argmax(axis=1), expected.argmax(axis=1))
+    
+    @unittest.skipUnless(KERAS_AVAILABLE, "Keras model not available")
+    def test_from_keras_matches_from_h5(self):
+        """Weights taken from a loaded Keras model match the HDF5 reader."""
+        from_keras = NumpyIntentModel.from_keras(load_model(MODEL_PATH))
+        from_h5 = NumpyIntentModel.from_h5(MODEL_PATH)
+        for a, b in zip(from_keras.layers, from_h5.layers):
+            np.testing.assert_array_equal(a.kernel, b.kernel)
+            np.testing.assert_array_equal(a.bias, b.bias)
+            self.assertEqual(a.activation, b.activation)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Unit tests for the pre-fork launcher
+"""
+
+import asyncio
+import os
+import signal
+import time
+import unittest
+import sys
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import config
+from chatbot import prefork
+from chatbot.prefork import WorkerPool, create_listening_socket
+from tests.test_server import FakeChatbot, http_request
+
+
+def request(port, method, path, payload=None, attempts=50):
+    """Retry a request while workers are (re)starting."""
+    for _ in range(attempts):
+        try:
+            return asyncio.run(http_request(port, method, path, payload))
+        except (ConnectionError, ValueError):
+            time.sleep(0.1)
+    raise AssertionError(f'No worker answered {method} {path}')
+
+
+@unittest.skipUnless(hasattr(os, 'fork'), "os.fork not available")
+class TestWorkerPool(unittest.TestCase):
+    """Test cases for supervising forked workers."""
+    
+    def setUp(self):
+        """Start a supervisor with one worker in a child process."""
+        self.sock = create_listening_socket('127.0.0.1', 0)
+        self.port = self.sock.getsockname()[1]
+        self.supervisor = os.fork()
+        if self.supervisor == 0:
+            try:
+                WorkerPool(FakeChatbot(), self.sock, 1, pin_workers=False, drain_timeout=1.0).run()
+            finally:
+                os._exit(0)
+        self.sock.close()
+    
+    def tearDown(self):
+        """Stop the supervisor if a test left it running."""
+        try:
+            os.kill(self.supervisor, signal.SIGTERM)
+            os.waitpid(self.supervisor, 0)
+        except (ProcessLookupError, ChildProcessError):
+            pass
+    
+    def test_worker_serves_and_restarts_after_crash(self):
+        """A crashed worker is replaced and the socket keeps serving."""
+        status, body = request(self.port, 'POST', '/chat', {'message': 'hi'})
+        self.assertEqual((status, body['response']), (200, 'HI'))
+        
+        first_pid = request(self.port, 'GET', '/health')[1]['pid']
+        os.kill(first_pid, signal.SIGKILL)
+        for _ in range(50):
+            pid = request(self.port, 'GET', '/health')[1]['pid']
+            if pid != first_pid:
+                break
+            time.sleep(0.1)
+        self.assertNotEqual(pid, first_pid)
+    
+    def test_sighup_replaces_workers_with_reloaded_models(self):
+        """SIGHUP reloads in the supervisor and new workers serve the new version."""
+        status, body = request(self.port, 'GET', '/health')
+        first_pid = body['pid']
+        self.assertEqual(body['model_version'], 'v1')
+        os.kill(self.supervisor, signal.SIGHUP)
+        for _ in range(50):
+            body = request(self.port, 'GET', '/health')[1]
+            if body['pid'] != first_pid:
+                break
+            time.sleep(0.1)
+        self.assertEqual(body['model_version'], 'v2')
+        self.assertEqual(request(self.port, 'POST', '/chat', {'message': 'hi'})[1]['response'], 'HI')
+    
+    def test_sigterm_drains_and_exits(self):
+        """SIGTERM stops the workers and then the supervisor."""
+        request(self.port, 'GET', '/health')
+        os.kill(self.supervisor, signal.SIGTERM)
+        _, status = os.waitpid(self.supervisor, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+
+
+class TestMain(unittest.TestCase):
+    """Test cases for the launcher entry point."""
+    
+    def test_refuses_keras_backend(self):
+        """TensorFlow cannot be forked, so the launcher exits before loading models."""
+        with mock.patch.dict(config.PERFORMANCE_CONFIG, {'intent_backend': 'keras'}), \
+                mock.patch.object(sys, 'argv', ['prefork', '--workers', '2']), \
+                mock.patch('chatbot.chatbot.Chatbot') as chatbot_class, \
+                mock.patch.object(prefork, 'create_listening_socket') as create_socket, \
+                mock.patch('builtins.print'):
+            with self.assertRaises(SystemExit) as context:
+                prefork.main()
+        self.assertEqual(context.exception.code, 1)
+        chatbot_class.assert_not_called()
+        create_socket.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+Unit tests for recurrence module
+"""
+
+import unittest
+from datetime import datetime, timedelta
+from itertools import islice
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from chatbot.utils.recurrence import RecurrenceRule, parse_recurrence
+
+# A Saturday
+TODAY = datetime(2026, 10, 17)
+
+
+def first(rule, count=4):
+    return list(islice(rule.occurrences(), count))
+
+
+class TestParseRecurrence(unittest.TestCase):
+    """Test cases for parsing recurring date phrases."""
+    
+    def test_weekday_with_time(self):
+        """The phrase from the NER training data."""
+        rule = parse_recurrence('water the plants every Friday at 10am', TODAY)
+        self.assertEqual(rule, RecurrenceRule('weekly', 1, (4,), None, (10, 0), TODAY, None))
+    
+    def test_phrases(self):
+        """Frequencies, intervals and weekday lists."""
+        cases = {
+            'daily at noon': ('daily', 1, (), None, (12, 0)),
+            'every 3 days': ('daily', 3, (), None, (0, 0)),
+            'every other week': ('weekly', 2, (5,), None, (0, 0)),
+            'fortnightly': ('weekly', 2, (5,), None, (0, 0)),
+            'every Monday, Wednesday and Friday at 9:30 am': ('weekly', 1, (0, 2, 4), None, (9, 30)),
+            'on Tuesdays': ('weekly', 1, (1,), None, (0, 0)),
+            'on tuesdays and thursdays at 6pm': ('weekly', 1, (1, 3), None, (18, 0)),
+            'on Mondays, Wednesdays and Fridays': ('weekly', 1, (0, 2, 4), None, (0, 0)),
+            'every weekday at 7am': ('weekly', 1, (0, 1, 2, 3, 4), None, (7, 0)),
+            'on the 15th of every month at 3pm': ('monthly', 1, (), 15, (15, 0)),
+            'every month': ('monthly', 1, (), 17, (0, 0)),
+            'yearly': ('yearly', 1, (), None, (0, 0)),
+        }
+        for text, expected in cases.items():
+            rule = parse_recurrence(text, TODAY)
+            self.assertEqual(tuple(rule[:5]), expected, text)
+    
+    def test_until(self):
+        """An end date bounds the series."""
+        rule = parse_recurrence('every day until October 20th', TODAY)
+        self.assertEqual(rule.until, datetime(2026, 10, 20))
+        self.assertEqual(len(list(rule.occurrences())), 4)
+    
+    def test_time_after_until(self):
+        """A time after the end date belongs to the occurrences, not the end."""
+        rule = parse_recurrence('every monday until friday at 5pm', TODAY)
+        self.assertEqual(rule.time, (17, 0))
+        self.assertEqual(rule.until, datetime(2026, 10, 23))
+    
+    def test_yearly_on_a_date(self):
+        """A yearly rule falls on the date given, from its next occurrence."""
+        rule = parse_recurrence('yearly on march 3', TODAY)
+        self.assertEqual(rule.start, datetime(2027, 3, 3))
+        self.assertEqual(first(rule, 2), [datetime(2027, 3, 3), datetime(2028, 3, 3)])
+        self.assertEqual(parse_recurrence('every year on december 24th at 6pm', TODAY).start, datetime(2026, 12, 24))
+    
+    def test_yearly_day_without_month(self):
+        """'every year on the 5th' does not say which month."""
+        self.assertIsNone(parse_recurrence('every year on the 5th', TODAY))
+    
+    def test_not_a_recurrence(self):
+        """Single dates and invalid intervals are not recurrences."""
+        for text in ('next friday at 10am', 'every 0 days', '', None):
+            self.assertIsNone(parse_recurrence(text, TODAY), text)
+
+
+class TestRecurrenceRule(unittest.TestCase):
+    """Test cases for expanding recurrence rules."""
+    
+    def test_every_other_weekday_starts_at_the_next_match(self):
+        """Intervals count from the first matching day, not the week of start."""
+        rule = parse_recurrence('every other friday', TODAY)
+        self.assertEqual(first(rule), [datetime(2026, 10, 23), datetime(2026, 11, 6),
+                                       datetime(2026, 11, 20), datetime(2026, 12, 4)])
+    
+    def test_month_day_clipped_to_short_months(self):
+        """'the 31st' falls on the last day of shorter months."""
+        rule = parse_recurrence('every month on the 31st', TODAY)
+        self.assertEqual(
+            list(rule.between(datetime(2027, 1, 1), datetime(2027, 5, 1))),
+            [datetime(2027, 1, 31), datetime(2027, 2, 28), datetime(2027, 3, 31), datetime(2027, 4, 30)]
+        )
+    
+    def test_next_after(self):
+        """Occurrences at the given moment are excluded, later ones on the same day are not."""
+        rule = parse_recurrence('every friday at 10am', TODAY)
+        self.assertEqual(rule.next_after(datetime(2026, 10, 23, 9, 59)), datetime(2026, 10, 23, 10, 0))
+        self.assertEqual(rule.next_after(datetime(2026, 10, 23, 10, 0)), datetime(2026, 10, 30, 10, 0))
+        self.assertEqual(rule.next_on_or_after(datetime(2026, 10, 23, 10, 0)), datetime(2026, 10, 23, 10, 0))
+    
+    def test_far_queries_match_stepping(self):
+        """Queries far from start agree with stepping through the series."""
+        rules = [
+            parse_recurrence(text, datetime(2024, 2, 29))
+            for text in ('every 3 days at 8pm', 'every other monday and thursday', 'every other month on the 30th', 'every 2 years')
+        ]
+        for rule in rules:
+            series = list(islice(rule.occurrences(), 200))
+            for moment in (series[57] - timedelta(minutes=1), series[57], series[120] + timedelta(hours=30)):
+                expected = next(occurrence for occurrence in series if occurrence > moment)
+                self.assertEqual(rule.next_after(moment), expected, rule)
+    
+    def test_calendar_month_of_an_old_series(self):
+        """Listing one month of a long-running series only covers that month."""
+        rule = parse_recurrence('every weekday at 7am', datetime(1990, 1, 1))
+        october = list(rule.between(datetime(2026, 10, 1), datetime(2026, 11, 1)))
+        self.assertEqual(len(october), 22)
+        self.assertEqual(october[0], datetime(2026, 10, 1, 7, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
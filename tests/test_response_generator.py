@@ -0,0 +1,120 @@
+"""
+Unit tests for the ResponseGenerator module
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from chatbot.response_generator import ResponseGenerator, ResponseTemplate
+
+INTENTS_DATA = {'intents': [
+    {
+        'tag': 'greeting',
+        'patterns': [{'text': 'hello', 'entities': []}],
+        'responses': [{'text': 'Hello!', 'entities': []}]
+    },
+    {
+        'tag': 'setting_reminder',
+        'patterns': [{'text': 'Remind me on {date}', 'entities': [{'type': 'date'}]}],
+        'responses': [
+            {'text': 'Sure, what should I remind you about?', 'entities': []},
+            {'text': 'Reminder for {date} to {reminder_text}', 'entities': [{'type': 'date'}]}
+        ]
+    },
+    {
+        'tag': 'deleting_event',
+        'patterns': [{'text': 'Delete {event_text} event', 'entities': [{'type': 'event_text'}]}],
+        'responses': [{'text': 'Which event?', 'entities': []}]
+    },
+    {
+        'tag': 'legacy',
+        'patterns': ['old style'],
+        'responses': [{'text': 'Noted {note}'}],
+        'inputs': [{'type': 'note', 'prompt': 'What note?'}]
+    },
+]}
+
+
+class TestResponseGenerator(unittest.TestCase):
+    """Test cases for response generation."""
+    
+    def setUp(self):
+        """Set up a generator over a small intents file."""
+        self.generator = ResponseGenerator(INTENTS_DATA)
+    
+    def test_entity_slots_from_responses(self):
+        """Slots come from inputs, response entities and placeholders."""
+        self.assertEqual(self.generator.entity_slots['setting_reminder'], {'date', 'reminder_text'})
+        self.assertEqual(self.generator.entity_slots['legacy'], {'note'})
+    
+    def test_needs_entities(self):
+        """Only intents whose responses consume entities need NER."""
+        self.assertTrue(self.generator.needs_entities('setting_reminder'))
+        self.assertFalse(self.generator.needs_entities('greeting'))
+        # Pattern-only entities are never used by a response
+        self.assertFalse(self.generator.needs_entities('deleting_event'))
+        self.assertFalse(self.generator.needs_entities('unknown'))
+    
+    def test_generate_fallback(self):
+        """An empty intent list gets the fallback response."""
+        self.assertIn("didn't understand", self.generator.generate([], {}).lower())
+    
+    def test_generate_unknown_intent(self):
+        """A tag missing from the index gets the fallback response."""
+        response = self.generator.generate([{'intent': 'unknown', 'probability': 0.9}], {})
+        self.assertIn("didn't understand", response.lower())
+    
+    def test_only_response_data_is_kept(self):
+        """The generator indexes compiled responses, not training patterns."""
+        self.assertFalse(hasattr(self.generator, 'intents_data'))
+        self.assertEqual(len(self.generator.intents['setting_reminder'].templates), 2)
+    
+    def test_generate_fills_declared_inputs(self):
+        """Declared inputs are substituted from the extracted entities."""
+        response = self.generator.generate([{'intent': 'legacy', 'probability': 0.9}], {'note': 'milk'})
+        self.assertEqual(response, 'Noted milk')
+    
+    def test_missing_inputs_start_dialogue(self):
+        """Missing inputs return a prompt and a pending state instead of blocking."""
+        response, state = self.generator.respond([{'intent': 'legacy', 'probability': 0.9}], {})
+        self.assertEqual(response, 'What note?')
+        self.assertEqual(state.missing_slots, ['note'])
+        self.assertEqual(self.generator.generate([{'intent': 'legacy', 'probability': 0.9}], {}), 'What note?')
+    
+    def test_resume_fills_slot(self):
+        """The next reply fills the slot and completes the response."""
+        _, state = self.generator.respond([{'intent': 'legacy', 'probability': 0.9}], {})
+        self.assertEqual(self.generator.resume(state, '   '), ('What note?', state))
+        self.assertEqual(self.generator.resume(state, 'eggs'), ('Noted eggs', None))
+    
+    def test_resume_cancel(self):
+        """A cancel statement drops the pending dialogue."""
+        _, state = self.generator.respond([{'intent': 'legacy', 'probability': 0.9}], {})
+        response, state = self.generator.resume(state, 'Never mind')
+        self.assertIsNone(state)
+        self.assertIn('cancelled', response)
+
+
+class TestResponseTemplate(unittest.TestCase):
+    """Test cases for compiled response templates."""
+    
+    def test_render_slots(self):
+        """Every occurrence of a slot is filled in one join."""
+        template = ResponseTemplate('{a} and {b}, then {a}!', {'a', 'b'})
+        self.assertEqual(template.slots, ('a', 'b', 'a'))
+        self.assertEqual(template.render({'a': 1, 'b': 'two'}), '1 and two, then 1!')
+    
+    def test_undeclared_placeholders_stay_literal(self):
+        """Placeholders that are not slots are part of the literal text."""
+        template = ResponseTemplate('Reminder for {date} to {reminder_text}', {'date'})
+        self.assertEqual(template.chunks, ('Reminder for ', ' to {reminder_text}'))
+        self.assertEqual(template.render({}), 'Reminder for {date} to {reminder_text}')
+        self.assertEqual(template.render({'date': 'friday', 'reminder_text': 'x'}), 'Reminder for friday to {reminder_text}')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+"""
+Unit tests for the HTTP server and micro-batching
+"""
+
+import asyncio
+import json
+import threading
+import unittest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from chatbot.server import MicroBatcher, ChatServer
+from chatbot.session_store import SessionStore
+from chatbot.model_set import ReloadError
+
+
+class FakeChatbot:
+    """Echoes messages and records the batches it receives."""
+    
+    def __init__(self):
+        self.batches = []
+        self.sessions = SessionStore(spill_path='')
+        self.model_version = 'v1'
+        self.reject_reload = False
+    
+    def process_batch(self, messages, sessions):
+        self.batches.append(list(messages))
+        return [message.upper() for message in messages]
+    
+    def timing_stats(self):
+        return {}
+    
+    def cache_stats(self):
+        return {}
+    
+    def model_info(self):
+        return {'version': self.model_version, 'loaded_at': 0.0, 'reloads': 0}
+    
+    def reload(self):
+        if self.reject_reload:
+            raise ReloadError('smoke batch failed')
+        previous = self.model_version
+        self.model_version = f'v{int(previous[1:]) + 1}'
+        return {'previous_version': previous, 'version': self.model_version}
+
+
+async def http_request(port, method, path, payload=None):
+    """Send one HTTP request and return (status, decoded JSON body)."""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    body = b'' if payload is None else (payload if isinstance(payload, bytes) else json.dumps(payload).encode())
+    writer.write(
+        f'{method} {path} HTTP/1.1\r\nHost: test\r\nConnection: close\r\n'
+        f'Content-Length: {len(body)}\r\n\r\n'.encode() + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), json.loads(content)
+
+
+class TestMicroBatcher(unittest.IsolatedAsyncioTestCase):
+    """Test cases for request gathering."""
+    
+    async def test_concurrent_submissions_share_batches(self):
+        """Concurrent items are batched up to max_batch_size, results in order."""
+        batches = []
+        
+        def process(items):
+            batches.append(items)
+            return [item * 2 for item in items]
+        
+        batcher = MicroBatcher(process, max_batch_size=4, max_wait=0.05)
+        batcher.start()
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(6)))
+        await batcher.stop()
+        
+        self.assertEqual(results, [0, 2, 4, 6, 8, 10])
+        self.assertEqual([len(batch) for batch in batches], [4, 2])
+        stats = batcher.stats()
+        self.assertEqual(stats['batches'], 2)
+        self.assertEqual(stats['mean_batch_size'], 3.0)
+        self.assertEqual(stats['batch_size_histogram'], {2: 1, 4: 1})
+    
+    async def test_lone_item_waits_at_most_max_wait(self):
+        """A single item is dispatched once max_wait expires."""
+        batcher = MicroBatcher(lambda items: items, max_batch_size=8, max_wait=0.01)
+        batcher.start()
+        self.assertEqual(await asyncio.wait_for(batcher.submit('x'), 1.0), 'x')
+        await batcher.stop()
+        self.assertLess(batcher.stats()['max_queue_wait_ms'], 500)
+    
+    async def test_batch_error_reaches_every_waiter(self):
+        """An exception in the batch function fails all its items."""
+        def process(items):
+            raise RuntimeError('boom')
+        
+        batcher = MicroBatcher(process, max_batch_size=2, max_wait=0.05)
+        batcher.start()
+        results = await asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True)
+        await batcher.stop()
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+
+
+class TestChatServer(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the HTTP endpoints."""
+    
+    async def asyncSetUp(self):
+        self.chatbot = FakeChatbot()
+        self.server = ChatServer(self.chatbot, max_batch_size=8, max_wait_ms=20, allow_reload=True)
+        await self.server.start('127.0.0.1', 0)
+    
+    async def asyncTearDown(self):
+        await self.server.stop()
+    
+    async def test_chat_requests_are_batched(self):
+        """Concurrent /chat requests are answered from shared batches."""
+        replies = await asyncio.gather(*(
+            http_request(self.server.port, 'POST', '/chat', {'message': f'hi {i}', 'session_id': i % 2})
+            for i in range(5)
+        ))
+        self.assertEqual([body['response'] for _, body in replies], [f'HI {i}' for i in range(5)])
+        self.assertEqual(replies[1][1]['session_id'], '1')
+        self.assertLess(len(self.chatbot.batches), 5)
+        self.assertEqual(len(self.chatbot.sessions), 2)
+    
+    async def test_sessions_resolved_off_the_loop(self):
+        """Session lookups (SQLite reads in shared mode) run in the executor."""
+        threads = []
+        get = self.chatbot.sessions.get
+        
+        def record_get(session_id, create=True):
+            threads.append(threading.get_ident())
+            return get(session_id, create)
+        
+        self.chatbot.sessions.get = record_get
+        status, body = await http_request(self.server.port, 'POST', '/chat', {'message': 'hi', 'session_id': 'alice'})
+        self.assertEqual((status, body['pending_slots']), (200, []))
+        self.assertEqual(len(threads), 1)
+        self.assertNotEqual(threads[0], threading.get_ident())
+    
+    async def test_metrics(self):
+        """Batch size and queue wait are exposed on /metrics."""
+        await http_request(self.server.port, 'POST', '/chat', {'message': 'hello'})
+        status, body = await http_request(self.server.port, 'GET', '/metrics')
+        self.assertEqual(status, 200)
+        self.assertEqual(body['batching']['messages'], 1)
+        self.assertIn('mean_queue_wait_ms', body['batching'])
+        self.assertEqual(body['models']['version'], 'v1')
+    
+    async def test_reload_endpoint(self):
+        """A reload swaps the version reported by /health; a rejected one keeps it."""
+        status, body = await http_request(self.server.port, 'POST', '/admin/reload')
+        self.assertEqual((status, body['version']), (200, 'v2'))
+        self.assertEqual((await http_request(self.server.port, 'GET', '/health'))[1]['model_version'], 'v2')
+        
+        self.chatbot.reject_reload = True
+        status, body = await http_request(self.server.port, 'POST', '/admin/reload')
+        self.assertEqual((status, body['version']), (409, 'v2'))
+        
+        self.server.allow_reload = False
+        self.assertEqual((await http_request(self.server.port, 'POST', '/admin/reload'))[0], 404)
+    
+    async def test_bad_requests(self):
+        """Invalid bodies and unknown routes get error statuses."""
+        self.assertEqual((await http_request(self.server.port, 'POST', '/chat', b'not json'))[0], 400)
+        self.assertEqual((await http_request(self.server.port, 'POST', '/chat', {'text': 'x'}))[0], 400)
+        self.assertEqual((await http_request(self.server.port, 'GET', '/chat'))[0], 405)
+        self.assertEqual((await http_request(self.server.port, 'GET', '/nope'))[0], 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
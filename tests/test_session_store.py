@@ -0,0 +1,151 @@
+"""
+Unit tests for the SessionStore module
+"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+import sys
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from chatbot.session_store import SessionStore
+from chatbot.dialogue import DialogueState
+from chatbot.response_generator import ResponseTemplate
+
+
+class TestSessionStore(unittest.TestCase):
+    """Test cases for session storage."""
+    
+    def test_get_creates_and_returns_same_session(self):
+        """A session id maps to one live Session object."""
+        store = SessionStore(shards=4, ttl=60, max_sessions=100, spill_path='')
+        session = store.get('alice')
+        self.assertIs(store.get('alice'), session)
+        self.assertIsNone(store.get('bob', create=False))
+        self.assertEqual(store.stats()['hits'], 1)
+    
+    def test_ttl_expiry(self):
+        """Sessions idle past the TTL are replaced by fresh ones."""
+        store = SessionStore(shards=1, ttl=10, max_sessions=100, spill_path='')
+        with patch('chatbot.session_store.time.time', return_value=1000.0):
+            store.get('alice').last_intent = 'greeting'
+        with patch('chatbot.session_store.time.time', return_value=1011.0):
+            self.assertIsNone(store.get('alice').last_intent)
+            self.assertEqual(store.expire(), 0)
+        self.assertEqual(store.stats()['expired'], 1)
+    
+    def test_capacity_evicts_least_recently_used(self):
+        """Shards over capacity drop their least recently used sessions."""
+        store = SessionStore(shards=1, ttl=60, max_sessions=2, spill_path='')
+        store.get('a')
+        store.get('b')
+        store.get('a')
+        store.get('c')
+        self.assertIsNone(store.get('b', create=False))
+        self.assertIsNotNone(store.get('a', create=False))
+        self.assertEqual(store.stats()['evicted'], 1)
+    
+    def test_spill_and_reload(self):
+        """Evicted sessions with state come back from the spill file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = SessionStore(shards=1, ttl=60, max_sessions=1, spill_path=os.path.join(tmpdir, 's.db'))
+            session = store.get('alice')
+            session.dialogue = DialogueState(
+                'legacy', ResponseTemplate('Noted {note}', {'note'}), [('note', 'What note?')], {}
+            )
+            store.get('bob')  # evicts and spills alice
+            self.assertEqual(store.stats()['on_disk'], 1)
+            
+            reloaded = store.get('alice')
+            self.assertEqual(reloaded.dialogue.prompt, 'What note?')
+            self.assertEqual(store.stats()['loaded'], 1)
+            store.close()
+    
+    def test_shared_stores_alternate(self):
+        """Two stores over one spill file each see the other's latest update."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 's.db')
+            first = SessionStore(shards=2, ttl=60, max_sessions=100, spill_path=path, shared=True)
+            second = SessionStore(shards=2, ttl=60, max_sessions=100, spill_path=path, shared=True)
+            
+            session = first.get('alice')
+            session.dialogue = DialogueState(
+                'legacy', ResponseTemplate('Noted {note}', {'note'}), [('note', 'What note?')], {}
+            )
+            first.save(session)
+            
+            session = second.get('alice')
+            self.assertEqual(session.dialogue.prompt, 'What note?')
+            session.dialogue = None
+            session.last_intent = 'legacy'
+            second.save(session)
+            
+            # first still holds the pending dialogue in memory, but the file wins
+            session = first.get('alice')
+            self.assertIsNone(session.dialogue)
+            self.assertEqual(session.last_intent, 'legacy')
+            session.last_intent = None
+            first.save(session)
+            
+            self.assertIsNone(second.get('alice', create=False))
+            self.assertEqual(second.stats()['on_disk'], 0)
+            first.close()
+            second.close()
+    
+    def test_shared_eviction_keeps_newer_state(self):
+        """Evicting a stale copy does not overwrite what another store saved."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 's.db')
+            first = SessionStore(shards=1, ttl=60, max_sessions=1, spill_path=path, shared=True)
+            second = SessionStore(shards=1, ttl=60, max_sessions=1, spill_path=path, shared=True)
+            
+            session = first.get('alice')
+            session.last_intent = 'v1'
+            first.save(session)
+            session = second.get('alice')
+            session.last_intent = 'v2'
+            second.save(session)
+            
+            # Evicts first's stale copy of alice
+            first.get('bob')
+            self.assertEqual(first.stats()['evicted'], 1)
+            self.assertEqual(second.get('alice').last_intent, 'v2')
+            first.close()
+            second.close()
+    
+    def test_shared_needs_spill_path(self):
+        """A shared store without a spill file is a configuration error."""
+        with self.assertRaises(ValueError):
+            SessionStore(spill_path='', shared=True)
+    
+    def test_concurrent_access(self):
+        """Threads hammering the store keep it within capacity and consistent."""
+        store = SessionStore(shards=8, ttl=60, max_sessions=64, spill_path='')
+        errors = []
+        
+        def worker(offset):
+            try:
+                for i in range(500):
+                    session = store.get(f'user-{(i * 7 + offset) % 100}')
+                    session.last_intent = 'greeting'
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(store), 64)
+        stats = store.stats()
+        self.assertEqual(stats['hits'] + stats['misses'], 2000)
+
+
+if __name__ == '__main__':
+    unittest.main()
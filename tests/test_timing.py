@@ -0,0 +1,44 @@
+"""
+Unit tests for stage timing statistics
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from chatbot.utils.timing import StageTimings
+
+
+class TestStageTimings(unittest.TestCase):
+    """Test cases for StageTimings."""
+    
+    def test_record_and_summary(self):
+        """Measurements are summed and averaged per stage."""
+        timings = StageTimings()
+        timings.record('intent', 0.010)
+        timings.record('intent', 0.030)
+        summary = timings.summary()
+        self.assertEqual(summary['intent']['count'], 2)
+        self.assertAlmostEqual(summary['intent']['mean_ms'], 20.0)
+    
+    def test_timed_returns_and_records(self):
+        """timed() passes through the return value and records a sample."""
+        timings = StageTimings()
+        self.assertEqual(timings.timed('ner', max, 1, 2), 2)
+        self.assertEqual(timings.summary()['ner']['count'], 1)
+    
+    def test_timed_records_on_error(self):
+        """Failing stages are still timed."""
+        timings = StageTimings()
+        with self.assertRaises(ZeroDivisionError):
+            timings.timed('intent', lambda: 1 / 0)
+        self.assertEqual(timings.summary()['intent']['count'], 1)
+        timings.reset()
+        self.assertEqual(timings.summary(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+Unit tests for the shared tokenizer module
+"""
+
+import unittest
+import json
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import config
+from chatbot.utils.tokenizer import tokenize, lemmatize, lemma_cache_info
+
+try:
+    from nltk.tokenize import NLTKWordTokenizer
+    NLTK_AVAILABLE = True
+except ImportError:
+    NLTK_AVAILABLE = False
+
+try:
+    lemmatize('reminders')
+    WORDNET_AVAILABLE = True
+except LookupError:
+    WORDNET_AVAILABLE = False
+
+
+class TestTokenizer(unittest.TestCase):
+    """Test cases for tokenization and lemmatization."""
+    
+    def test_tokenize_splits_punctuation_and_clitics(self):
+        """Contractions and punctuation become separate tokens."""
+        self.assertEqual(
+            tokenize("What's up? I don't know, I'm busy!"),
+            ['what', "'s", 'up', '?', 'i', 'do', "n't", 'know', ',', 'i', "'m", 'busy', '!']
+        )
+    
+    def test_tokenize_keeps_compounds(self):
+        """Slot names, slashes and clock times stay whole."""
+        self.assertEqual(
+            tokenize('Set {reminder_text} at 5:30pm, book/movie/song'),
+            ['set', '{', 'reminder_text', '}', 'at', '5:30pm', ',', 'book/movie/song']
+        )
+    
+    @unittest.skipUnless(NLTK_AVAILABLE, "nltk not available")
+    def test_tokenize_matches_nltk_on_patterns(self):
+        """Tokens match the nltk Treebank tokenizer on all intent patterns."""
+        with open(config.MODEL_PATHS['intents_json'], 'r', encoding='utf-8') as f:
+            intents = json.load(f)
+        treebank = NLTKWordTokenizer()
+        for intent in intents['intents']:
+            for pattern in intent['patterns']:
+                text = pattern if isinstance(pattern, str) else pattern.get('text', '')
+                self.assertEqual(tokenize(text), treebank.tokenize(text.lower()), text)
+    
+    @unittest.skipUnless(WORDNET_AVAILABLE, "WordNet data not available")
+    def test_lemmatize_is_memoized(self):
+        """Repeated tokens are served from the memo table."""
+        self.assertEqual(lemmatize('reminders'), 'reminder')
+        hits = lemma_cache_info().hits
+        lemmatize('reminders')
+        self.assertEqual(lemma_cache_info().hits, hits + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Pack the intent model weights, vocabulary, classes and compiled responses
+into a single memory-mappable model bundle (see chatbot/bundle.py).
+"""
+
+import argparse
+import hashlib
+import json
+import pickle
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import config
+from logger import setup_logger
+from chatbot.bundle import write_bundle, load_bundle
+from chatbot.numpy_backend import NumpyIntentModel
+from chatbot.response_generator import ResponseGenerator
+
+# Setup logger
+logger = setup_logger('bundle_builder')
+
+
+def collect_patterns(intents_data):
+    """
+    Get the pattern texts of every intent.
+    
+    Args:
+        intents_data: Dictionary containing intents and patterns
+    
+    Returns:
+        Dictionary mapping intent tag to a list of pattern strings
+    """
+    patterns = {}
+    for intent in intents_data.get('intents', []):
+        texts = patterns.setdefault(intent.get('tag'), [])
+        for pattern in intent.get('patterns', []):
+            text = pattern if isinstance(pattern, str) else pattern.get('text', '')
+            if text:
+                texts.append(text)
+    return patterns
+
+
+def main():
+    """Main bundle building function."""
+    default_precision = config.PERFORMANCE_CONFIG['model_optimization']
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--precision', choices=['float32', 'float16', 'int8'],
+        default=default_precision if default_precision in ('float16', 'int8') else 'float32',
+        help='Weight precision stored in the bundle'
+    )
+    parser.add_argument('--output', default=config.MODEL_PATHS['model_bundle'], help='Bundle path')
+    args = parser.parse_args()
+    
+    model = NumpyIntentModel.from_h5(config.MODEL_PATHS['intents_model']).quantize(args.precision)
+    with open(config.MODEL_PATHS['words_pkl'], 'rb') as f:
+        words = pickle.load(f)
+    with open(config.MODEL_PATHS['classes_pkl'], 'rb') as f:
+        classes = pickle.load(f)
+    with open(config.MODEL_PATHS['intents_json'], 'r', encoding='utf-8') as f:
+        intents_data = json.load(f)
+    
+    # Version = build time plus a digest of the contents it was built from
+    digest = hashlib.sha256()
+    for array in model.to_arrays().values():
+        digest.update(array.tobytes())
+    digest.update(json.dumps([words, classes, intents_data], sort_keys=True).encode('utf-8'))
+    version = f"{time.strftime('%Y%m%d%H%M%S')}-{digest.hexdigest()[:12]}"
+    
+    write_bundle(
+        args.output, model, words, classes,
+        ResponseGenerator(intents_data).to_table(), collect_patterns(intents_data),
+        bundle_version=version
+    )
+    
+    # Check the bundle reproduces the model it was built from
+    start = time.perf_counter()
+    bundle = load_bundle(args.output)
+    load_time = time.perf_counter() - start
+    probe = np.eye(len(words), dtype=np.float32)[:64]
+    max_error = float(np.abs(bundle.intent_model.predict(probe) - model.predict(probe)).max())
+    if max_error > 1e-6:
+        raise RuntimeError(f"Bundle predictions differ from the source model by {max_error}")
+    
+    size = Path(args.output).stat().st_size
+    logger.info(f"Model bundle {version} written to {args.output} ({size} bytes, {args.precision})")
+    print(f"✓ Bundle {version} saved to: {args.output}")
+    print(f"  {size / 1024:.1f} KiB, {args.precision} weights, loads in {load_time * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
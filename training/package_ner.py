@@ -0,0 +1,112 @@
+"""
+Write a pruned, inference-only copy of the NER model and report how load
+time and memory compare with the full model.
+"""
+
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import spacy
+import config
+from logger import setup_logger
+from chatbot.model_loader import compact_ner_exclude
+
+# Setup logger
+logger = setup_logger('ner_packaging')
+
+# Run in a fresh interpreter so each measurement starts from a clean process
+MEASURE_SCRIPT = """
+import json, resource, sys, time, warnings
+warnings.filterwarnings('ignore')
+import spacy
+exclude = json.loads(sys.argv[2])
+start = time.perf_counter()
+nlp = spacy.load(sys.argv[1], exclude=exclude)
+load_time = time.perf_counter() - start
+peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({'load_seconds': load_time, 'peak_rss_kib': peak_rss}))
+"""
+
+
+def measure_load(model_path, exclude=()):
+    """
+    Measure load time and peak RSS of a spaCy model in a subprocess.
+    
+    Args:
+        model_path: Path to the spaCy model directory
+        exclude: Names to exclude when loading
+    
+    Returns:
+        Dictionary with load_seconds and peak_rss_kib
+    """
+    output = subprocess.run(
+        [sys.executable, '-c', MEASURE_SCRIPT, str(model_path), json.dumps(list(exclude))],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def package_ner_model(source_path, output_path):
+    """
+    Save a copy of the NER model without unused components and vocab data.
+    
+    The entities predicted by the pruned copy are checked against the
+    full model on the NER training texts before it is kept.
+    
+    Args:
+        source_path: Path to the full spaCy model directory
+        output_path: Destination directory for the pruned model
+    """
+    exclude = compact_ner_exclude(source_path)
+    full_nlp = spacy.load(source_path)
+    compact_nlp = spacy.load(source_path, exclude=exclude)
+    
+    output_path = Path(output_path)
+    if output_path.exists():
+        shutil.rmtree(output_path)
+    compact_nlp.to_disk(output_path, exclude=[name for name in exclude if name == 'vocab'])
+    logger.info(f"Excluded from packaged NER model: {exclude}")
+    
+    with open(config.MODEL_PATHS['entities_json'], 'r', encoding='utf-8') as f:
+        texts = [annotation['text'] for annotation in json.load(f).get('annotations', [])]
+    reloaded = spacy.load(output_path)
+    for full_doc, compact_doc in zip(full_nlp.pipe(texts), reloaded.pipe(texts)):
+        full_ents = [(ent.start_char, ent.end_char, ent.label_) for ent in full_doc.ents]
+        compact_ents = [(ent.start_char, ent.end_char, ent.label_) for ent in compact_doc.ents]
+        if full_ents != compact_ents:
+            shutil.rmtree(output_path)
+            raise RuntimeError(f"Packaged model disagrees with the full model on: {full_doc.text!r}")
+
+
+def directory_size(path):
+    """Total size in bytes of the files under path."""
+    return sum(f.stat().st_size for f in Path(path).rglob('*') if f.is_file())
+
+
+def main():
+    """Main packaging function."""
+    source_path = config.MODEL_PATHS['ner_model']
+    output_path = config.MODEL_PATHS['ner_model_compact']
+    
+    package_ner_model(source_path, output_path)
+    print(f'✓ Compact NER model saved to: {output_path}')
+    
+    before = measure_load(source_path)
+    after = measure_load(output_path, compact_ner_exclude(output_path))
+    print(f"{'':10}{'disk KiB':>10}{'load ms':>10}{'peak RSS':>10}")
+    for name, path, stats in (('full', source_path, before), ('compact', output_path, after)):
+        print(
+            f"{name:10}{directory_size(path) / 1024:>10.0f}"
+            f"{stats['load_seconds'] * 1000:>10.1f}{stats['peak_rss_kib']:>10}"
+        )
+    logger.info(f"NER load profile - full: {before}, compact: {after}")
+
+
+if __name__ == "__main__":
+    main()
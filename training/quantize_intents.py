@@ -0,0 +1,118 @@
+"""
+Convert the trained intent model to reduced-precision (float16 / int8) weights
+for the NumPy inference backend, and report the accuracy impact.
+"""
+
+import argparse
+import json
+import pickle
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import config
+from logger import setup_logger
+from chatbot.numpy_backend import NumpyIntentModel
+from chatbot.utils.preprocessor import Preprocessor
+
+# Setup logger
+logger = setup_logger('intent_quantization')
+
+
+def load_evaluation_set(intents_file, words, classes):
+    """
+    Build a bag-of-words evaluation set from the intents file patterns.
+    
+    Args:
+        intents_file: Path to intents JSON file
+        words: List of words in vocabulary
+        classes: List of intent classes
+    
+    Returns:
+        tuple: (SparseBatch of patterns, numpy array of label indices)
+    """
+    with open(intents_file, 'r', encoding='utf-8') as f:
+        intents = json.load(f)
+    
+    sentences = []
+    labels = []
+    for intent in intents['intents']:
+        if intent['tag'] not in classes:
+            continue
+        for pattern in intent['patterns']:
+            text = pattern if isinstance(pattern, str) else pattern.get('text', '')
+            if text.strip():
+                sentences.append(' '.join(text.lower().split()))
+                labels.append(classes.index(intent['tag']))
+    
+    preprocessor = Preprocessor(words_vocabulary=words, cache_size=0)
+    return preprocessor.sparse_bag_of_words_batch(sentences), np.array(labels)
+
+
+def evaluate(reference, candidate, batch, labels):
+    """
+    Compare a quantized model against the float32 reference.
+    
+    Args:
+        reference: float32 NumpyIntentModel
+        candidate: Quantized NumpyIntentModel
+        batch: SparseBatch of evaluation sentences
+        labels: Label index per sentence
+    
+    Returns:
+        Dictionary with agreement, accuracies and probability error
+    """
+    expected = reference.predict_sparse(batch)
+    result = candidate.predict_sparse(batch)
+    return {
+        'top1_agreement': float(np.mean(expected.argmax(axis=1) == result.argmax(axis=1))),
+        'reference_accuracy': float(np.mean(expected.argmax(axis=1) == labels)),
+        'quantized_accuracy': float(np.mean(result.argmax(axis=1) == labels)),
+        'max_probability_error': float(np.abs(expected - result).max())
+    }
+
+
+def main():
+    """Main quantization function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--precision', choices=['float16', 'int8', 'all'], default='all',
+        help='Weight precision to produce (default: all)'
+    )
+    args = parser.parse_args()
+    precisions = ['float16', 'int8'] if args.precision == 'all' else [args.precision]
+    
+    model_path = config.MODEL_PATHS['intents_model']
+    with open(config.MODEL_PATHS['words_pkl'], 'rb') as f:
+        words = pickle.load(f)
+    with open(config.MODEL_PATHS['classes_pkl'], 'rb') as f:
+        classes = pickle.load(f)
+    
+    reference = NumpyIntentModel.from_h5(model_path)
+    batch, labels = load_evaluation_set(config.MODEL_PATHS['intents_json'], words, classes)
+    logger.info(f"Evaluating on {len(labels)} patterns from intents.json")
+    
+    print(f"float32: {reference.nbytes / 1024:.1f} KiB of weights")
+    for precision in precisions:
+        quantized = reference.quantize(precision)
+        output_path = model_path.replace('.h5', f'_{precision}.npz')
+        quantized.save_npz(output_path)
+        
+        report = evaluate(reference, quantized, batch, labels)
+        logger.info(f"Quantized {precision} model saved to {output_path}: {report}")
+        print(
+            f"{precision}: {quantized.nbytes / 1024:.1f} KiB of weights "
+            f"({quantized.nbytes / reference.nbytes:.0%} of float32), "
+            f"top-1 agreement {report['top1_agreement']:.2%}, "
+            f"accuracy {report['reference_accuracy']:.2%} -> {report['quantized_accuracy']:.2%}, "
+            f"max probability error {report['max_probability_error']:.4f}"
+        )
+        print(f"✓ Saved to: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
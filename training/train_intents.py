@@ -5,8 +5,6 @@ import numpy as np
 import os
 import sys
 from sklearn.model_selection import train_test_split
-import nltk
-from nltk.stem import WordNetLemmatizer
 import tensorflow as tf
 import sys
 from pathlib import Path
@@ -16,13 +14,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import config
 from logger import setup_logger, log_training_event
+from chatbot.utils.preprocessor import build_word_index
+from chatbot.utils.tokenizer import tokenize, lemmatize
 
 # Setup logger
 logger = setup_logger('intent_training')
 
-# Initialize lemmatizer
-lemmatizer = WordNetLemmatizer()
-
 def preprocess_intents(intents_file):
     """
     Preprocess intents file and return training data.
@@ -52,10 +49,10 @@ def preprocess_intents(intents_file):
     for intent in intents['intents']:
         for pattern in intent['patterns']:
             if isinstance(pattern, str):
-                word_list = nltk.tokenize.word_tokenize(pattern)
+                word_list = tokenize(pattern)
                 entities = []
             elif isinstance(pattern, dict):
-                word_list = nltk.tokenize.word_tokenize(pattern.get('text', ''))
+                word_list = tokenize(pattern.get('text', ''))
                 entities = pattern.get('entities', [])
             words.extend(word_list)
             documents.append((word_list, intent['tag'], entities))
@@ -64,7 +61,7 @@ def preprocess_intents(intents_file):
 
 
 
-    words = [lemmatizer.lemmatize(word) for word in words if word not in ignore_letters]
+    words = [lemmatize(word) for word in words if word not in ignore_letters]
     words = sorted(set(words))
 
     classes = sorted(set(classes))
@@ -88,16 +85,14 @@ def preprocess_intents(intents_file):
     training = []
     outputEmpty = [0] * len(classes)
 
-    # Optimize bag of words creation
+    # Bag of words creation: set only the columns of the pattern's words
+    word_index = build_word_index(words)
     for document in documents:
         bag = np.zeros(len(words), dtype=np.float32)
         wordPatterns = document[0]
-        wordPatterns = [lemmatizer.lemmatize(word.lower()) for word in wordPatterns]
-        wordPatterns_set = set(wordPatterns)  # Use set for O(1) lookup
-        
-        for i, word in enumerate(words):
-            if word in wordPatterns_set:
-                bag[i] = 1
+        wordPatterns = [lemmatize(word) for word in wordPatterns]
+        columns = [word_index[word] for word in wordPatterns if word in word_index]
+        bag[columns] = 1
 
         outputRow = list(outputEmpty)
         outputRow[classes.index(document[1])] = 1